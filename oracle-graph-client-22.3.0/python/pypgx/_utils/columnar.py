@@ -0,0 +1,208 @@
+#
+# Copyright (C) 2013 - 2022 Oracle and/or its affiliates. All rights reserved.
+#
+
+"""Conversion of whole columns of Java values to NumPy, pandas and Arrow arrays."""
+
+from typing import Any, Iterable, List, Optional, Sequence, TYPE_CHECKING
+
+from pypgx._utils import conversion
+
+if TYPE_CHECKING:
+    # Don't import at runtime, to avoid circular imports.
+    from pypgx.api._pgx_graph import PgxGraph
+
+INTEGER_TYPES = {'integer': 'int32', 'long': 'int64'}
+FLOATING_TYPES = {'float': 'float32', 'double': 'float64'}
+DATETIME_TYPES = ('date', 'timestamp', 'timestamp_with_timezone')
+TEMPORAL_TYPES = DATETIME_TYPES + ('time', 'time_with_timezone')
+
+
+def column_type(property_type: str) -> str:
+    """Return the PGQL result element type matching a property type, e.g. 'date' for
+    'local_date'.
+    """
+    return 'date' if property_type == 'local_date' else property_type
+
+
+def import_numpy():
+    """Import NumPy, raising an ImportError with a helpful message if it is missing."""
+    try:
+        import numpy as np
+    except Exception:
+        raise ImportError("Could not find numpy package")
+    return np
+
+
+def import_pandas():
+    """Import pandas, raising an ImportError with a helpful message if it is missing."""
+    try:
+        import pandas as pd
+    except Exception:
+        raise ImportError("Could not find pandas package")
+    return pd
+
+
+def import_pyarrow():
+    """Import pyarrow, raising an ImportError with a helpful message if it is missing."""
+    try:
+        import pyarrow as pa
+    except Exception:
+        raise ImportError("Could not find pyarrow package")
+    return pa
+
+
+def to_list(values: Iterable[Any]) -> List[Any]:
+    """Return `values` as a list of Python values, converting NumPy arrays and scalars."""
+    if hasattr(values, 'tolist'):
+        return values.tolist()
+    return [value.item() if hasattr(value, 'item') else value for value in values]
+
+
+def object_array(values: Sequence[Any]):
+    """Return a one-dimensional NumPy object array holding `values`.
+
+    Unlike numpy.array(values, dtype=object), this never creates a multi-dimensional array when the
+    values are themselves sequences (e.g. arrays or 2D points).
+    """
+    np = import_numpy()
+    array = np.empty(len(values), dtype=object)
+    array[:] = values
+    return array
+
+
+def _to_python_values(
+    values: Sequence[Any], col_type: str, graph: Optional["PgxGraph"]
+) -> List[Any]:
+    if col_type in TEMPORAL_TYPES:
+        return conversion.temporal_values_to_python(values, col_type)
+    convert = conversion.column_converter(col_type, graph)
+    if convert is None:
+        return list(values)
+    return [convert(value) for value in values]
+
+
+def column_to_numpy(values: Sequence[Any], col_type: str, graph: Optional["PgxGraph"] = None):
+    """Convert a column of values, as transferred from Java, to a NumPy array.
+
+    Numeric and boolean columns without nulls become arrays of the matching primitive dtype, and
+    date and timestamp columns become datetime64 arrays (timestamps with timezone are normalized to
+    UTC). Integer and boolean columns with nulls, as well as all other columns, become object
+    arrays of Python values.
+
+    :param values: The column values
+    :param col_type: The PGQL result element type of the column, e.g. 'long'
+    :param graph: The graph of vertex and edge values
+    """
+    np = import_numpy()
+    if col_type in FLOATING_TYPES:
+        # None becomes NaN.
+        return np.array(values, dtype=FLOATING_TYPES[col_type])
+    if col_type in INTEGER_TYPES:
+        if None in values:
+            return object_array(values)
+        return np.array(values, dtype=INTEGER_TYPES[col_type])
+    if col_type == 'boolean':
+        # Pyjnius may convert Java Booleans to Python ints.
+        if None in values:
+            return object_array([None if value is None else bool(value) for value in values])
+        return np.array(values, dtype=bool)
+    if col_type == 'string':
+        return object_array(values)
+    if col_type in DATETIME_TYPES:
+        return conversion.temporal_values_to_numpy(values, col_type)
+    return object_array(_to_python_values(values, col_type, graph))
+
+
+def column_to_pandas(
+    values: Sequence[Any],
+    col_type: str,
+    graph: Optional["PgxGraph"] = None,
+    categorical: bool = False,
+):
+    """Convert a column of values, as transferred from Java, to an array for a pandas DataFrame.
+
+    Like column_to_numpy(), but integer and boolean columns with nulls become nullable pandas
+    arrays ('Int32', 'Int64' and 'boolean'), timestamps with timezone become timezone-aware
+    datetimes in UTC, and string columns can be made categorical.
+
+    :param values: The column values
+    :param col_type: The PGQL result element type of the column, e.g. 'long'
+    :param graph: The graph of vertex and edge values
+    :param categorical: Whether to convert string columns to the 'category' dtype
+    """
+    pd = import_pandas()
+    if col_type in INTEGER_TYPES and None in values:
+        return pd.array(values, dtype=INTEGER_TYPES[col_type].capitalize())
+    if col_type == 'boolean' and None in values:
+        return pd.array([None if value is None else bool(value) for value in values], 'boolean')
+    if col_type == 'string' and categorical:
+        return pd.Categorical(values)
+    array = column_to_numpy(values, col_type, graph)
+    if col_type == 'timestamp_with_timezone':
+        return pd.DatetimeIndex(array).tz_localize('UTC').array
+    return array
+
+
+def _arrow_type(col_type: str, graph: Optional["PgxGraph"]):
+    """Return the Arrow type of a column, or None if it has to be inferred from the values."""
+    pa = import_pyarrow()
+    if col_type == 'vertex':
+        col_type = getattr(graph, 'vertex_id_type', None)
+    arrow_types = {
+        'integer': pa.int32(),
+        'long': pa.int64(),
+        'float': pa.float32(),
+        'double': pa.float64(),
+        'boolean': pa.bool_(),
+        'string': pa.string(),
+        'edge': pa.int64(),
+        'edge_label': pa.string(),
+        'vertex_labels': pa.list_(pa.string()),
+        'date': pa.date32(),
+        'time': pa.time64('us'),
+        'time_with_timezone': pa.string(),
+        'timestamp': pa.timestamp('us'),
+        'timestamp_with_timezone': pa.timestamp('us', tz='UTC'),
+        'point2d': pa.struct([('x', pa.float64()), ('y', pa.float64())]),
+    }
+    return arrow_types.get(col_type)
+
+
+def _to_arrow_values(values: Sequence[Any], col_type: str, graph: Optional["PgxGraph"]) -> Any:
+    """Convert the values of a column that Arrow cannot take as they are."""
+    if col_type in INTEGER_TYPES or col_type in FLOATING_TYPES or col_type == 'string':
+        # Converted to Python scalars by Pyjnius already.
+        return values
+    if col_type == 'boolean':
+        return [None if value is None else bool(value) for value in values]
+    if col_type in ('vertex', 'edge'):
+        # Store the IDs, without wrapping each entity in a PgxVertex or PgxEdge.
+        return [None if value is None else value.getId() for value in values]
+    if col_type in DATETIME_TYPES:
+        return conversion.temporal_values_to_numpy(values, col_type)
+    python_values = _to_python_values(values, col_type, graph)
+    if col_type == 'vertex_labels':
+        return [None if value is None else sorted(value) for value in python_values]
+    if col_type == 'time_with_timezone':
+        return [None if value is None else value.isoformat() for value in python_values]
+    if col_type == 'point2d':
+        return [
+            None if value is None else {'x': value[0], 'y': value[1]} for value in python_values
+        ]
+    return python_values
+
+
+def column_to_arrow(values: Sequence[Any], col_type: str, graph: Optional["PgxGraph"] = None):
+    """Convert a column of values, as transferred from Java, to a pyarrow Array.
+
+    Vertices and edges are represented by their IDs, vertex labels by sorted lists, 2D points by
+    structs with 'x' and 'y' fields and times with timezone by ISO 8601 strings. Timestamps with
+    timezone are converted to UTC.
+
+    :param values: The column values
+    :param col_type: The PGQL result element type of the column, e.g. 'long'
+    :param graph: The graph of vertex and edge values
+    """
+    pa = import_pyarrow()
+    return pa.array(_to_arrow_values(values, col_type, graph), type=_arrow_type(col_type, graph))
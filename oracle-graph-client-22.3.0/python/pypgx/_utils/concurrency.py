@@ -0,0 +1,197 @@
+#
+# Copyright (C) 2013 - 2022 Oracle and/or its affiliates. All rights reserved.
+#
+
+"""Run PyPGX operations concurrently, on threads waiting for the Java calls to return."""
+
+import atexit
+import functools
+import inspect
+import os
+import queue
+import threading
+from collections import deque
+from concurrent.futures import Executor, Future
+from typing import Any, Callable, Deque, Iterable, Iterator, List, Optional, TypeVar
+
+from jnius import detach
+
+from pypgx._utils.error_messages import ARG_MUST_BE
+
+# Same default as concurrent.futures.ThreadPoolExecutor.
+DEFAULT_MAX_WORKERS = min(32, (os.cpu_count() or 1) + 4)
+
+_executor: Optional["AttachedThreadPool"] = None
+_executor_lock = threading.Lock()
+
+T = TypeVar('T')
+
+
+class AttachedThreadPool(Executor):
+    """A bounded pool of worker threads that stay attached to the JVM.
+
+    A thread is attached to the JVM by its first Java call, which is costly. Unlike the threads of
+    a ThreadPoolExecutor, the threads of this pool only detach from the JVM when the pool shuts
+    down, so they are attached at most once.
+    """
+
+    def __init__(
+        self, max_workers: int = DEFAULT_MAX_WORKERS, thread_name_prefix: str = 'pypgx'
+    ) -> None:
+        if not isinstance(max_workers, int) or max_workers < 1:
+            raise ValueError(ARG_MUST_BE.format(arg='max_workers', type='a positive integer'))
+        self._max_workers = max_workers
+        self._thread_name_prefix = thread_name_prefix
+        self._tasks: "queue.Queue" = queue.Queue()
+        self._threads: List[threading.Thread] = []
+        self._idle = threading.Semaphore(0)
+        self._lock = threading.Lock()
+        self._shutdown = False
+
+    def submit(self, fn: Callable[..., Any], *args: Any, **kwargs: Any) -> Future:  # noqa: D102
+        with self._lock:
+            if self._shutdown:
+                raise RuntimeError('cannot submit tasks after the pool is shut down')
+            future: Future = Future()
+            self._tasks.put((future, fn, args, kwargs))
+            # Start a new thread unless one is idle.
+            if not self._idle.acquire(blocking=False) and len(self._threads) < self._max_workers:
+                thread = threading.Thread(
+                    target=self._work,
+                    name='{}_{}'.format(self._thread_name_prefix, len(self._threads)),
+                    daemon=True,
+                )
+                thread.start()
+                self._threads.append(thread)
+        return future
+
+    def _work(self) -> None:
+        try:
+            while True:
+                task = self._tasks.get()
+                if task is None:
+                    return
+                future, fn, args, kwargs = task
+                if future.set_running_or_notify_cancel():
+                    try:
+                        result = fn(*args, **kwargs)
+                    except BaseException as exc:
+                        future.set_exception(exc)
+                    else:
+                        future.set_result(result)
+                del task, future, fn, args, kwargs
+                self._idle.release()
+        finally:
+            # Threads calling into Java must be detached from the JVM before they exit.
+            detach()
+
+    def shutdown(self, wait: bool = True, **kwargs: Any) -> None:  # noqa: D102
+        with self._lock:
+            if not self._shutdown:
+                self._shutdown = True
+                for _ in self._threads:
+                    self._tasks.put(None)
+        if wait:
+            for thread in self._threads:
+                thread.join()
+
+
+def get_executor() -> AttachedThreadPool:
+    """Return the thread pool running asynchronous operations, creating it on first use."""
+    global _executor
+    with _executor_lock:
+        if _executor is None:
+            _executor = AttachedThreadPool()
+            atexit.register(_executor.shutdown)
+        return _executor
+
+
+def submit(function: Callable[..., Any], *args: Any, **kwargs: Any) -> Future:
+    """Call `function` on a worker thread and return a Future of its result.
+
+    Pyjnius releases the GIL during Java calls, so blocking calls to PGX made by different worker
+    threads overlap.
+    """
+    return get_executor().submit(function, *args, **kwargs)
+
+
+def imap(function: Callable[[Any], T], items: Iterable[Any], max_in_flight: int) -> Iterator[T]:
+    """Call `function` on each item on the worker threads, and yield the results in order.
+
+    At most `max_in_flight` calls are started ahead of the results consumed, which bounds the
+    concurrency and the memory held by results not consumed yet.
+    """
+    executor = get_executor()
+    pending: Deque[Future] = deque()
+    try:
+        for item in items:
+            if len(pending) >= max_in_flight:
+                yield pending.popleft().result()
+            pending.append(executor.submit(function, item))
+        while pending:
+            yield pending.popleft().result()
+    finally:
+        for future in pending:
+            future.cancel()
+
+
+def gather(requests: List[Any]) -> List[Any]:
+    """Wait for several operations and return their results, in the same order.
+
+    Each request is a Future, or a function without arguments starting an operation, e.g.
+    ``lambda: analyst.pagerank_async(graph)``. Functions are called on the calling thread; if they
+    return a Future, its result is waited for, otherwise their return value is the result.
+
+    If an operation fails, its exception is raised once all operations are finished.
+    """
+    futures = []
+    for request in requests:
+        if callable(request) and not isinstance(request, Future):
+            request = request()
+        if not isinstance(request, Future):
+            done: Future = Future()
+            done.set_result(request)
+            request = done
+        futures.append(request)
+    for future in futures:
+        future.exception()
+    return [future.result() for future in futures]
+
+
+def with_async_methods(*names: str) -> Callable[[T], T]:
+    """Class decorator adding a `<name>_async` variant to each of the named methods of a class.
+
+    Only methods making requests to the server that are worth running concurrently are listed.
+    The variant runs the method on a worker thread and returns a
+    :class:`concurrent.futures.Future` of its result. It calls the method of the object it is
+    called on, so that overrides in subclasses are used.
+    """
+
+    def decorate(cls: T) -> T:
+        for name in names:
+            async_name = name + '_async'
+            if async_name in vars(cls):
+                continue
+            setattr(cls, async_name, _async_method(getattr(cls, name), async_name))
+        return cls
+
+    return decorate
+
+
+def _async_method(method: Callable[..., Any], async_name: str) -> Callable[..., Future]:
+    name = method.__name__
+
+    @functools.wraps(method)
+    def async_method(self, *args: Any, **kwargs: Any) -> Future:
+        return submit(getattr(self, name), *args, **kwargs)
+
+    async_method.__name__ = async_name
+    async_method.__qualname__ = method.__qualname__ + '_async'
+    async_method.__signature__ = inspect.signature(method).replace(  # type: ignore
+        return_annotation=Future
+    )
+    async_method.__doc__ = (
+        "Asynchronous version of :meth:`{}`.\n\n"
+        "Returns a :class:`concurrent.futures.Future` of its result.".format(name)
+    )
+    return async_method
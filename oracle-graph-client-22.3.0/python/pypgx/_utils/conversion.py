@@ -2,8 +2,21 @@
 # Copyright (C) 2013 - 2022 Oracle and/or its affiliates. All rights reserved.
 #
 
-from datetime import date, time, datetime
-from typing import Any, Optional, TYPE_CHECKING, Union, Iterable, Tuple, Dict, Mapping
+import re
+from datetime import date, time, datetime, timezone
+from typing import (
+    Any,
+    Callable,
+    Optional,
+    TYPE_CHECKING,
+    Union,
+    Iterable,
+    List,
+    Sequence,
+    Tuple,
+    Dict,
+    Mapping,
+)
 
 from pypgx._utils.error_handling import java_handler
 from pypgx._utils import pgx_types
@@ -21,6 +34,22 @@ if TYPE_CHECKING:
     from pypgx.api._pgx_graph import PgxGraph
 
 
+# Java prints up to 9 fractional digits, Python and NumPy parse at most 6 of them.
+_NANOS_PATTERN = re.compile(r'(\.\d{6})\d+')
+_OFFSET_PATTERN = re.compile(r'([+-])(\d{2}):(\d{2})(?::(\d{2}))?$')
+
+
+def _fromisoformat_unavailable(value_str: str) -> Any:
+    raise ValueError("fromisoformat() is not available before Python 3.7")
+
+
+# fromisoformat() was added in Python 3.7. On Python 3.6, temporal values are only parsed with
+# strptime().
+_HAS_FROMISOFORMAT = hasattr(datetime, 'fromisoformat')
+_date_fromisoformat = getattr(date, 'fromisoformat', _fromisoformat_unavailable)
+_time_fromisoformat = getattr(time, 'fromisoformat', _fromisoformat_unavailable)
+_datetime_fromisoformat = getattr(datetime, 'fromisoformat', _fromisoformat_unavailable)
+
 QUERY_ARGUMENT_TYPES = {
     "integer",
     "long",
@@ -230,6 +259,11 @@ def anything_to_java(value: Any) -> Any:
     return value
 
 
+def to_pgql_identifier(name: str) -> str:
+    """Quote a label or property name to use it in a PGQL query."""
+    return '"{}"'.format(name.replace('"', '""'))
+
+
 def to_java_local_date(value: date) -> JavaClass:
     """Convert Python date to Java."""
     return pgx_types.local_date.parse(pgx_types.String(value.isoformat()))
@@ -267,6 +301,20 @@ def to_java_list(iterable: Iterable) -> JavaClass:
     return java_list
 
 
+def to_java_column(values: Sequence[Any], data_type: Optional[str]) -> JavaClass:
+    """Return a Java list holding a frame column of the given data type, e.g. 'LONG_TYPE'.
+
+    Unlike to_java_list(), the values are passed to Java at once: as a primitive array for
+    numeric and boolean columns, and as an object array for all other columns.
+
+    :param values: The column values, as Python values
+    :param data_type: The frame data type of the column, or None if unknown
+    """
+    if data_type in pgx_types.primitive_lists:
+        return pgx_types.primitive_lists[data_type].asList(*values)
+    return pgx_types.java_arrays.asList(*(anything_to_java(value) for value in values))
+
+
 def to_java_set(iterable: Iterable) -> JavaClass:
     """Return a Java HashSet.
 
@@ -334,54 +382,128 @@ def anything_to_python(value: Any, graph: Optional["PgxGraph"] = None) -> Any:
     property_to_python(), NOT anything_to_python().
 
     The typical use case for this function is converting a Java object whose type is not known
-    until runtime. For example, an element from a PGQL result set.
+    until runtime. For example, an element from a PGQL result set. If many values of the same
+    known type are converted, column_converter() is faster.
     """
 
-    from pypgx.api._pgx_graph import PgxGraph
+    if not isinstance(value, JavaClass):
+        # Already converted by Pyjnius, e.g. None, str, int or float.
+        return value
+    java_class_name = type(value).__javaclass__
+    conversion = _PYTHON_CONVERSIONS.get(java_class_name)
+    if conversion is None:
+        conversion = _resolve_python_conversion(value)
+        _PYTHON_CONVERSIONS[java_class_name] = conversion
+    convert, needs_graph = conversion
+    if needs_graph:
+        return convert(value, graph)
+    return convert(value)
+
+
+# Conversion function of each Java class passed to anything_to_python(), and whether it takes the
+# graph as second argument. Filled lazily by _resolve_python_conversion().
+_PYTHON_CONVERSIONS: Dict[str, Tuple[Callable[..., Any], bool]] = {}
 
+
+def _resolve_python_conversion(value: JavaClass) -> Tuple[Callable[..., Any], bool]:
+    """Return the conversion function for the Java class of `value`, and whether it takes the
+    graph as second argument.
+    """
     if isinstance(value, (pgx_types.pgx_entities['vertex'], pgx_types.pgx_entities['edge'])):
-        if graph is None:
-            raise ValueError("Graph must be set if the item type is PgxVertex")
-        if not isinstance(graph, PgxGraph):
-            raise TypeError(ARG_MUST_BE.format(arg='graph', type=PgxGraph))
-        return entity_to_python(value, graph)
-    if isinstance(value, pgx_types.local_date):
-        return local_date_to_python(value)
-    if isinstance(value, pgx_types.local_time):
-        return local_time_to_python(value)
-    if isinstance(value, pgx_types.timestamp):
-        return timestamp_to_python(value)
-    if isinstance(value, pgx_types.time_with_timezone):
-        return time_with_timezone_to_python(value)
-    if isinstance(value, pgx_types.timestamp_with_timezone):
-        return timestamp_with_timezone_to_python(value)
-    if isinstance(value, pgx_types.legacy_date):
-        return legacy_date_to_python(value)
-    if isinstance(value, pgx_types.Point2D):
-        return point2d_to_python(value)
-    if isinstance(value, pgx_types.Enum):
-        return enum_to_python_str(value)
-    if isinstance(value, pgx_types.graph_property_config):
-        from pypgx.api import GraphPropertyConfig
-        return GraphPropertyConfig._from_java_config(value)
-    if isinstance(value, pgx_types.graph_config):
-        from pypgx.api import GraphConfig
-        return GraphConfig(value)
-    if isinstance(value, pgx_types.abstract_config):
-        return config_to_python_dict(value)
-    if isinstance(value, pgx_types.java_set):
-        return set_to_python(value)
-    if isinstance(value, pgx_types.java_collection):
+        return _checked_entity_to_python, True
+    conversions = (
+        (pgx_types.local_date, local_date_to_python),
+        (pgx_types.local_time, local_time_to_python),
+        (pgx_types.timestamp, timestamp_to_python),
+        (pgx_types.time_with_timezone, time_with_timezone_to_python),
+        (pgx_types.timestamp_with_timezone, timestamp_with_timezone_to_python),
+        (pgx_types.legacy_date, legacy_date_to_python),
+        (pgx_types.Point2D, point2d_to_python),
+        (pgx_types.Enum, enum_to_python_str),
+        (pgx_types.graph_property_config, _graph_property_config_to_python),
+        (pgx_types.graph_config, _graph_config_to_python),
+        (pgx_types.abstract_config, config_to_python_dict),
+        (pgx_types.java_set, set_to_python),
         # Set before collection because each Set is a collection.
-        return collection_to_python_list(value)
-    if isinstance(value, pgx_types.java_map):
-        return map_to_python(value)
-    if isinstance(value, pgx_types.pgx_vect):
-        # Returns a list.
-        return value.toArray()
+        (pgx_types.java_collection, collection_to_python_list),
+        (pgx_types.java_map, map_to_python),
+        (pgx_types.pgx_vect, _vect_to_python),
+    )
+    for java_class, convert in conversions:
+        if isinstance(value, java_class):
+            return convert, False
+    return _identity, False
+
+
+def _identity(value: Any) -> Any:
     return value
 
 
+def _checked_entity_to_python(value: JavaClass, graph: Optional["PgxGraph"]) -> PgxEntity:
+    from pypgx.api._pgx_graph import PgxGraph
+
+    if graph is None:
+        raise ValueError("Graph must be set if the item type is PgxVertex")
+    if not isinstance(graph, PgxGraph):
+        raise TypeError(ARG_MUST_BE.format(arg='graph', type=PgxGraph))
+    return entity_to_python(value, graph)
+
+
+def _graph_property_config_to_python(value: JavaClass) -> Any:
+    from pypgx.api import GraphPropertyConfig
+
+    return GraphPropertyConfig._from_java_config(value)
+
+
+def _graph_config_to_python(value: JavaClass) -> Any:
+    from pypgx.api import GraphConfig
+
+    return GraphConfig(value)
+
+
+def _vect_to_python(value: JavaClass) -> List[Any]:
+    # Returns a list.
+    return value.toArray()
+
+
+def column_converter(
+    type_name: str, graph: Optional["PgxGraph"] = None
+) -> Optional[Callable[[Any], Any]]:
+    """Return the function that converts the values of a PGQL result column to Python, or None if
+    Pyjnius already converts them.
+
+    Unlike anything_to_python(), the returned function does not need to look up the conversion
+    for each value, and converts booleans to bool.
+
+    :param type_name: The PGQL result element type of the column, e.g. 'timestamp'
+    :param graph: The graph of vertex and edge values
+    """
+    if type_name in ('integer', 'long', 'float', 'double', 'string', 'edge_label'):
+        return None
+    if type_name == 'boolean':
+        return optional_boolean_to_python
+    if type_name in ('vertex', 'edge'):
+        entity_class = PgxVertex if type_name == 'vertex' else PgxEdge
+
+        def convert_entity(value: Any) -> Optional[PgxEntity]:
+            if value is None:
+                return None
+            if graph is None:
+                raise ValueError("Graph must be set if the item type is PgxVertex")
+            return entity_class(graph, value)
+
+        return convert_entity
+    if type_name in _TEMPORAL_CONVERSIONS:
+        return _TEMPORAL_CONVERSIONS[type_name][1]
+    if type_name == 'point2d':
+        return point2d_to_python
+
+    def convert(value: Any) -> Any:
+        return anything_to_python(value, graph)
+
+    return convert
+
+
 def entity_to_python(java_entity: JavaClass, graph: "PgxGraph") -> PgxEntity:
     """Convert a Java vertex or edge to Python."""
 
@@ -408,7 +530,12 @@ def local_date_to_python(value: Optional[JavaClass]) -> Optional[date]:
 
     if value is None:
         return None
-    return datetime.strptime(value.toString(), '%Y-%m-%d').date()
+    value_str = value.toString()
+    try:
+        return _date_fromisoformat(value_str)
+    except ValueError:
+        pass
+    return datetime.strptime(value_str, '%Y-%m-%d').date()
 
 
 def local_time_to_python(value: Optional[JavaClass]) -> Optional[time]:
@@ -418,6 +545,10 @@ def local_time_to_python(value: Optional[JavaClass]) -> Optional[time]:
         return None
 
     value_str = value.toString()
+    try:
+        return _time_fromisoformat(_to_python_iso_format(value_str))
+    except ValueError:
+        pass
     # Format may or may not have milliseconds in the string. Test for both.
     try:
         return datetime.strptime(value_str, '%H:%M:%S.%f').time()
@@ -444,8 +575,12 @@ def time_with_timezone_to_python(value: Optional[JavaClass]) -> Optional[time]:
     if value is None:
         return None
 
-    # Adjust timezone to be readable by .strptime()
     value_str = value.toString()
+    try:
+        return _time_fromisoformat(_to_python_iso_format(value_str))
+    except ValueError:
+        pass
+    # Adjust timezone to be readable by .strptime()
     if value_str[-1] == 'Z':
         value_str = value_str[:-1] + '+0000'
     else:
@@ -477,6 +612,10 @@ def timestamp_to_python(value: Optional[JavaClass]) -> Optional[datetime]:
         return None
 
     value_str = value.toString()
+    try:
+        return _datetime_fromisoformat(_to_python_iso_format(value_str))
+    except ValueError:
+        pass
     # Format may or may not have milliseconds in the string. Test for both.
     try:
         return datetime.strptime(value_str, '%Y-%m-%dT%H:%M:%S.%f')
@@ -503,8 +642,12 @@ def timestamp_with_timezone_to_python(value: Optional[JavaClass]) -> Optional[da
     if value is None:
         return None
 
-    # Adjust timezone to be readable by .strptime()
     value_str = value.toString()
+    try:
+        return _datetime_fromisoformat(_to_python_iso_format(value_str))
+    except ValueError:
+        pass
+    # Adjust timezone to be readable by .strptime()
     if value_str[-1] == 'Z':
         value_str = value_str[:-1] + '+0000'
     else:
@@ -529,6 +672,120 @@ def timestamp_with_timezone_to_python(value: Optional[JavaClass]) -> Optional[da
     raise ValueError(value_str + " cannot be parsed into datetime")
 
 
+def _to_python_iso_format(value_str: str) -> str:
+    """Adapt the ISO 8601 string of a Java temporal value to the format parsed by Python's
+    fromisoformat() and by NumPy: 'Z' is replaced by '+00:00' and nanoseconds are truncated to
+    microseconds.
+    """
+    if value_str[-1] == 'Z':
+        value_str = value_str[:-1] + '+00:00'
+    if '.' in value_str:
+        value_str = _NANOS_PATTERN.sub(r'\1', value_str, count=1)
+    return value_str
+
+
+_TEMPORAL_CONVERSIONS: Dict[str, Tuple[Callable[[str], Any], Callable[[Any], Any]]] = {
+    'date': (_date_fromisoformat, local_date_to_python),
+    'local_date': (_date_fromisoformat, local_date_to_python),
+    'time': (_time_fromisoformat, local_time_to_python),
+    'time_with_timezone': (_time_fromisoformat, time_with_timezone_to_python),
+    'timestamp': (_datetime_fromisoformat, timestamp_to_python),
+    'timestamp_with_timezone': (_datetime_fromisoformat, timestamp_with_timezone_to_python),
+}
+
+# NumPy unit of each temporal type that can be represented as datetime64.
+_DATETIME64_UNITS = {
+    'date': 'datetime64[D]',
+    'local_date': 'datetime64[D]',
+    'timestamp': 'datetime64[us]',
+    'timestamp_with_timezone': 'datetime64[us]',
+}
+
+
+def temporal_values_to_python(
+    values: Sequence[Optional[JavaClass]], type_name: str
+) -> List[Optional[Union[date, time, datetime]]]:
+    """Convert Java temporal values that all have the same type to Python, in one pass.
+
+    This is faster than calling e.g. timestamp_to_python() for each value, the slower parsing of
+    that function is only used for values that the fast path cannot parse.
+
+    :param values: Java LocalDate, LocalTime, LocalDateTime, OffsetTime or OffsetDateTime
+        values, or None
+    :param type_name: 'date', 'time', 'time_with_timezone', 'timestamp' or
+        'timestamp_with_timezone'
+    """
+    if type_name not in _TEMPORAL_CONVERSIONS:
+        raise ValueError(INVALID_OPTION.format(var='type_name', opts=list(_TEMPORAL_CONVERSIONS)))
+    parse, convert = _TEMPORAL_CONVERSIONS[type_name]
+    if not _HAS_FROMISOFORMAT:
+        return [convert(value) for value in values]
+    python_values: List[Optional[Union[date, time, datetime]]] = []
+    append = python_values.append
+    for value in values:
+        if value is None:
+            append(None)
+            continue
+        try:
+            append(parse(_to_python_iso_format(value.toString())))
+        except ValueError:
+            append(convert(value))
+    return python_values
+
+
+def temporal_values_to_numpy(values: Sequence[Optional[JavaClass]], type_name: str) -> Any:
+    """Convert Java dates or timestamps that all have the same type to a NumPy datetime64 array.
+
+    The string representations of the values are parsed by NumPy in bulk. Dates become
+    datetime64[D], timestamps datetime64[us] and timestamps with timezone are converted to UTC.
+    Nulls become NaT. Values that NumPy cannot parse are converted with
+    temporal_values_to_python() instead.
+
+    This function requires NumPy.
+
+    :param values: Java LocalDate, LocalDateTime or OffsetDateTime values, or None
+    :param type_name: 'date', 'timestamp' or 'timestamp_with_timezone'
+    """
+    try:
+        import numpy as np
+    except Exception:
+        raise ImportError("Could not find numpy package")
+    if type_name not in _DATETIME64_UNITS:
+        raise ValueError(INVALID_OPTION.format(var='type_name', opts=list(_DATETIME64_UNITS)))
+    unit = _DATETIME64_UNITS[type_name]
+    value_strs = [
+        None if value is None else _to_python_iso_format(value.toString()) for value in values
+    ]
+
+    try:
+        if type_name != 'timestamp_with_timezone':
+            return np.array(value_strs, dtype=unit)
+        # Parse the local date-times and the offsets separately, NumPy does not parse offsets.
+        local_strs = []
+        offsets = []
+        for value_str in value_strs:
+            match = None if value_str is None else _OFFSET_PATTERN.search(value_str)
+            if match is None:
+                local_strs.append(value_str)
+                offsets.append(0)
+                continue
+            sign, hours, minutes, seconds = match.groups()
+            offset = int(hours) * 3600 + int(minutes) * 60 + int(seconds or 0)
+            local_strs.append(value_str[:match.start()])
+            offsets.append(-offset if sign == '-' else offset)
+        return np.array(local_strs, dtype=unit) - np.array(offsets, dtype='timedelta64[s]')
+    except ValueError:
+        pass
+
+    python_values = temporal_values_to_python(values, type_name)
+    if type_name == 'timestamp_with_timezone':
+        python_values = [
+            None if value is None else value.astimezone(timezone.utc).replace(tzinfo=None)
+            for value in python_values
+        ]
+    return np.array(python_values, dtype=unit)
+
+
 def legacy_date_to_python(value: Optional[JavaClass]) -> Optional[datetime]:
     """Convert Java Date to Python."""
 
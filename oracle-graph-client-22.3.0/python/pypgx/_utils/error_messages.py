@@ -16,6 +16,8 @@ MODEL_NOT_FITTED = "The model has not been fitted."
 VERTEX_ID_OR_COLLECTION_OF_IDS = "'{var}' must be a vertex ID or a collection of vertex IDs."
 VERTEX_ID_OR_PGXVERTEX = "'{var}' must be a vertex ID or a PgxVertex."
 PROPERTY_NOT_FOUND = "Property '{prop}' not found."
+GRAPH_NOT_FOUND = "Graph '{graph}' not found."
+ENTITY_NOT_FOUND = "No {entity_type} with ID {id!r} in the graph."
 INDEX_OUT_OF_BOUNDS = "'{idx}' must be an integer: 0 <= '{idx}' <= {max_idx}"
 VALID_INTERVAL = (
     "'start': {start} and 'stop': {stop} must define a valid interval within the range: "
@@ -0,0 +1,52 @@
+#
+# Copyright (C) 2013 - 2022 Oracle and/or its affiliates. All rights reserved.
+#
+
+"""Attributes of wrapper objects that are only fetched from Java when first read."""
+
+from typing import Any, Callable, Optional
+
+
+class lazy_property:
+    """A property computed when first read and then cached on the instance.
+
+    Like functools.cached_property (Python 3.8+): the value is stored in the instance __dict__
+    under the same name, so later reads don't call the getter, and assigning to the attribute
+    replaces the cached value. Cached values are dropped by reset_lazy_properties().
+    """
+
+    def __init__(self, getter: Callable[[Any], Any]) -> None:
+        self._getter = getter
+        self._name = getter.__name__
+        self.__doc__ = getter.__doc__
+
+    def __set_name__(self, owner: type, name: str) -> None:
+        self._name = name
+
+    def __get__(self, instance: Optional[Any], owner: Optional[type] = None) -> Any:
+        if instance is None:
+            return self
+        value = self._getter(instance)
+        instance.__dict__[self._name] = value
+        return value
+
+
+def reset_lazy_properties(instance: Any) -> None:
+    """Drop the cached values of the lazy properties of `instance`, to fetch them again."""
+    for cls in type(instance).__mro__:
+        for name, attr in vars(cls).items():
+            if isinstance(attr, lazy_property):
+                instance.__dict__.pop(name, None)
+
+
+def load_lazy_properties(instance: Any) -> None:
+    """Read the lazy properties of `instance` that are not cached yet, so that later reads don't
+    call Java. Properties that cannot be read are left to be read when accessed.
+    """
+    for cls in type(instance).__mro__:
+        for name, attr in vars(cls).items():
+            if isinstance(attr, lazy_property) and name not in instance.__dict__:
+                try:
+                    getattr(instance, name)
+                except Exception:
+                    pass
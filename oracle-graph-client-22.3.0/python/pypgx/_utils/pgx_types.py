@@ -77,6 +77,15 @@ array_list = autoclass('java.util.ArrayList')
 java_map = autoclass('java.util.Map')
 HashMap = autoclass('java.util.HashMap')
 HashSet = autoclass('java.util.HashSet')
+java_arrays = autoclass('java.util.Arrays')
+# Lists backed by primitive arrays, for the frame column types that have one.
+primitive_lists = {
+    'INTEGER_TYPE': autoclass('com.google.common.primitives.Ints'),
+    'LONG_TYPE': autoclass('com.google.common.primitives.Longs'),
+    'FLOAT_TYPE': autoclass('com.google.common.primitives.Floats'),
+    'DOUBLE_TYPE': autoclass('com.google.common.primitives.Doubles'),
+    'BOOLEAN_TYPE': autoclass('com.google.common.primitives.Booleans'),
+}
 pgx_vect = autoclass("oracle.pgx.api.PgxVect")
 Enum = autoclass('java.lang.Enum')
 Point2D = autoclass('oracle.pgql.lang.spatial.Point2D')
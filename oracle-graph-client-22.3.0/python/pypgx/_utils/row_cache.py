@@ -0,0 +1,201 @@
+#
+# Copyright (C) 2013 - 2022 Oracle and/or its affiliates. All rights reserved.
+#
+
+"""Bounded cache for rows fetched from the server."""
+
+import sys
+from bisect import bisect_right, insort
+from collections import OrderedDict
+from typing import Any, Dict, List, Optional, Tuple
+
+from pypgx._utils.error_messages import INVALID_OPTION
+
+# 'lru' evicts the least recently used rows first. 'scan' does the same, but rows read by a
+# sequential scan are inserted as least recently used, so that a scan does not flush the rows that
+# are accessed repeatedly. 'none' disables caching.
+CACHE_POLICIES = ('lru', 'scan', 'none')
+
+
+class RowCache:
+    """An LRU cache of row extents, bounded by a number of rows and/or an approximate number of
+    bytes.
+
+    An extent is a list of consecutive rows, stored under the index of its first row.
+    Extents never overlap: inserting an extent trims the extents it overlaps.
+    """
+
+    def __init__(
+        self, policy: str = 'lru', max_rows: Optional[int] = None, max_bytes: Optional[int] = None
+    ) -> None:
+        if policy not in CACHE_POLICIES:
+            raise ValueError(INVALID_OPTION.format(var='policy', opts=list(CACHE_POLICIES)))
+        self.policy = policy
+        self.max_rows = max_rows
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self.num_rows = 0
+        self.num_bytes = 0
+        self._extents: "OrderedDict[int, List[Any]]" = OrderedDict()
+        self._starts: List[int] = []
+        self._sizes: Dict[int, int] = {}
+
+    @property
+    def enabled(self) -> bool:
+        """Whether rows are kept in the cache at all."""
+        return self.policy != 'none' and self.max_rows != 0 and self.max_bytes != 0
+
+    def _find(self, row: int) -> Optional[int]:
+        """Return the start of the extent containing `row`, or None."""
+        idx = bisect_right(self._starts, row) - 1
+        if idx < 0:
+            return None
+        start = self._starts[idx]
+        if row < start + len(self._extents[start]):
+            return start
+        return None
+
+    def get_range(
+        self, start: int, stop: int, count: bool = True
+    ) -> Optional[List[List[Any]]]:
+        """Return the rows from `start` (inclusive) to `stop` (exclusive) if all of them are
+        cached, or None otherwise.
+
+        :param count: Whether to count the lookup in the hit/miss statistics
+        """
+        rows: List[List[Any]] = []
+        used = []
+        row = start
+        while row < stop:
+            extent_start = self._find(row)
+            if extent_start is None:
+                if count:
+                    self.misses += stop - start
+                return None
+            extent = self._extents[extent_start]
+            end = min(stop, extent_start + len(extent))
+            rows.extend(extent[row - extent_start:end - extent_start])
+            used.append(extent_start)
+            row = end
+        if count:
+            self.hits += stop - start
+        for extent_start in used:
+            self._extents.move_to_end(extent_start)
+        return rows
+
+    def segments(
+        self, start: int, stop: int
+    ) -> List[Tuple[int, int, Optional[List[List[Any]]]]]:
+        """Split the range from `start` (inclusive) to `stop` (exclusive) into consecutive
+        segments that are either fully cached or not cached at all.
+
+        :return: A list of (segment start, segment stop, rows) tuples, where rows is None for
+            segments that are not cached
+        """
+        segments: List[Tuple[int, int, Optional[List[List[Any]]]]] = []
+        idx = max(bisect_right(self._starts, start) - 1, 0)
+        row = start
+        for extent_start in self._starts[idx:]:
+            if extent_start >= stop:
+                break
+            extent = self._extents[extent_start]
+            extent_stop = extent_start + len(extent)
+            if extent_stop <= row:
+                continue
+            if extent_start > row:
+                segments.append((row, extent_start, None))
+                row = extent_start
+            end = min(stop, extent_stop)
+            segments.append((row, end, extent[row - extent_start:end - extent_start]))
+            self._extents.move_to_end(extent_start)
+            row = end
+        if row < stop:
+            segments.append((row, stop, None))
+        return segments
+
+    def put(self, start: int, rows: List[List[Any]], scan: bool = False) -> None:
+        """Insert the consecutive `rows`, the first of which has index `start`.
+
+        :param scan: Whether the rows are read by a sequential scan
+        """
+        if not self.enabled or not rows:
+            return
+        if self.max_rows is not None and len(rows) > self.max_rows:
+            return
+        size = self._estimate_size(rows)
+        if self.max_bytes is not None and size > self.max_bytes:
+            return
+
+        self._remove_range(start, start + len(rows))
+        self._insert(start, rows, size)
+        if scan and self.policy == 'scan':
+            self._extents.move_to_end(start, last=False)
+        self._evict(keep=start)
+
+    def clear(self) -> None:
+        """Remove all rows from the cache."""
+        self._extents.clear()
+        self._starts.clear()
+        self._sizes.clear()
+        self.num_rows = 0
+        self.num_bytes = 0
+
+    def _insert(self, start: int, rows: List[List[Any]], size: Optional[int] = None) -> None:
+        if size is None:
+            size = self._estimate_size(rows)
+        self._extents[start] = rows
+        self._sizes[start] = size
+        insort(self._starts, start)
+        self.num_rows += len(rows)
+        self.num_bytes += size
+
+    def _pop(self, start: int) -> List[List[Any]]:
+        rows = self._extents.pop(start)
+        self._starts.remove(start)
+        self.num_rows -= len(rows)
+        self.num_bytes -= self._sizes.pop(start)
+        return rows
+
+    def _remove_range(self, start: int, stop: int) -> None:
+        """Remove the rows from `start` (inclusive) to `stop` (exclusive), trimming the extents
+        that only partially overlap the range.
+        """
+        idx = max(bisect_right(self._starts, start) - 1, 0)
+        overlapping = []
+        for extent_start in self._starts[idx:]:
+            if extent_start >= stop:
+                break
+            if extent_start + len(self._extents[extent_start]) > start:
+                overlapping.append(extent_start)
+        for extent_start in overlapping:
+            rows = self._pop(extent_start)
+            extent_stop = extent_start + len(rows)
+            if extent_start < start:
+                self._insert(extent_start, rows[:start - extent_start])
+            if extent_stop > stop:
+                self._insert(stop, rows[stop - extent_start:])
+
+    def _over_budget(self) -> bool:
+        if self.max_rows is not None and self.num_rows > self.max_rows:
+            return True
+        return self.max_bytes is not None and self.num_bytes > self.max_bytes
+
+    def _evict(self, keep: int) -> None:
+        """Evict least recently used extents until the cache is within budget."""
+        for victim in list(self._extents):
+            if not self._over_budget():
+                break
+            if victim != keep:
+                self._pop(victim)
+
+    def _estimate_size(self, rows: List[List[Any]]) -> int:
+        """Return an approximation of the memory taken up by `rows`, in bytes."""
+        if self.max_bytes is None:
+            return 0
+        size = sys.getsizeof(rows)
+        for row in rows:
+            size += sys.getsizeof(row)
+            if isinstance(row, list):
+                size += sum(sys.getsizeof(cell) for cell in row)
+        return size
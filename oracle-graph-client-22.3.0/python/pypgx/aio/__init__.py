@@ -0,0 +1,14 @@
+#
+# Copyright (C) 2013 - 2022 Oracle and/or its affiliates. All rights reserved.
+#
+
+"""asyncio facade over the PGX client.
+
+The methods of the wrapped objects become coroutines that run the blocking PGX calls on a bounded
+pool of threads attached to the JVM, so that they don't block the event loop.
+"""
+
+from pypgx.aio._async_wrapper import AsyncAnalyst, AsyncGraph, AsyncResultSet, AsyncSession
+from pypgx.aio._async_wrapper import get_session
+
+__all__ = [name for name in dir() if not name.startswith('_')]
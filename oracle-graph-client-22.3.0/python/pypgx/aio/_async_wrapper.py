@@ -0,0 +1,208 @@
+#
+# Copyright (C) 2013 - 2022 Oracle and/or its affiliates. All rights reserved.
+#
+
+import asyncio
+import functools
+import inspect
+from typing import Any, AsyncIterator, Callable, Optional
+
+from pypgx._utils.concurrency import DEFAULT_MAX_WORKERS, AttachedThreadPool
+from pypgx._utils.error_messages import ARG_MUST_BE
+from pypgx._utils.lazy import load_lazy_properties
+from pypgx.api._analyst import Analyst
+from pypgx.api._pgql_result_set import DEFAULT_BATCH_SIZE, PgqlResultSet
+from pypgx.api._pgx import get_session as _get_session
+from pypgx.api._pgx_graph import PgxGraph
+from pypgx.api._pgx_session import PgxSession
+
+
+class _AsyncWrapper:
+    """Base class of the asyncio facades.
+
+    Methods of the wrapped object are returned as coroutine functions, and attributes as they are.
+    Sessions, analysts, graphs and result sets are wrapped in their facade.
+
+    Attributes fetched from Java when first read, e.g. the number of vertices of a graph, are
+    read by the worker threads: when the facade is created by a coroutine, and again after each
+    method call, since methods may reset them. Reading them never blocks the event loop.
+    """
+
+    _wrapped_class: type = object
+
+    def __init__(self, wrapped: Any, pool: AttachedThreadPool) -> None:
+        if not isinstance(wrapped, self._wrapped_class):
+            raise TypeError(ARG_MUST_BE.format(arg='wrapped', type=self._wrapped_class.__name__))
+        self._wrapped = wrapped
+        self._pool = pool
+
+    async def _run(self, function: Callable[..., Any], *args: Any, **kwargs: Any) -> Any:
+        """Run `function` on the thread pool and return its result."""
+        return await asyncio.wrap_future(self._pool.submit(function, *args, **kwargs))
+
+    def _wrap(self, value: Any) -> Any:
+        for wrapped_class, wrapper_class in _WRAPPER_CLASSES:
+            if isinstance(value, wrapped_class):
+                return wrapper_class(value, pool=self._pool)
+        return value
+
+    def __getattr__(self, name: str) -> Any:
+        if name.startswith('_'):
+            raise AttributeError(name)
+        attr = getattr(self._wrapped, name)
+        if not inspect.ismethod(attr):
+            return self._wrap(attr)
+
+        def run(*args: Any, **kwargs: Any) -> Any:
+            result = attr(*args, **kwargs)
+            _load_attributes(self._wrapped)
+            _load_attributes(result)
+            return result
+
+        @functools.wraps(attr)
+        async def call(*args: Any, **kwargs: Any) -> Any:
+            return self._wrap(await self._run(run, *args, **kwargs))
+
+        return call
+
+    def __repr__(self) -> str:
+        return "{}({!r})".format(self.__class__.__name__, self._wrapped)
+
+    def __str__(self) -> str:
+        return repr(self)
+
+
+class AsyncAnalyst(_AsyncWrapper):
+    """asyncio facade over an :class:`Analyst`."""
+
+    _wrapped_class = Analyst
+
+
+class AsyncGraph(_AsyncWrapper):
+    """asyncio facade over a :class:`PgxGraph`."""
+
+    _wrapped_class = PgxGraph
+
+
+class AsyncResultSet(_AsyncWrapper):
+    """asyncio facade over a :class:`PgqlResultSet`.
+
+    The rows can be iterated over with ``async for``. Retrieving results from the server is not
+    thread-safe, so the result set must not be accessed otherwise until the iteration is over.
+    """
+
+    _wrapped_class = PgqlResultSet
+
+    def __aiter__(self) -> AsyncIterator[Any]:
+        return self.iter_rows()
+
+    async def iter_rows(self, batch_size: int = DEFAULT_BATCH_SIZE) -> AsyncIterator[Any]:
+        """Iterate over the rows of the result set, fetching them from the server in batches.
+
+        The next batch is fetched while the current one is consumed.
+
+        :param batch_size: Number of rows fetched per request
+        """
+        result_set = self._wrapped
+        result_set._assert_not_closed()
+        if not isinstance(batch_size, int) or batch_size < 1:
+            raise ValueError(ARG_MUST_BE.format(arg='batch_size', type='a positive integer'))
+        num_results = result_set.num_results
+        starts = range(0, num_results, batch_size)
+
+        def fetch(start: int) -> "asyncio.Future":
+            stop = min(start + batch_size, num_results)
+            return asyncio.ensure_future(self._run(result_set._get_batch, start, stop))
+
+        pending: Optional["asyncio.Future"] = fetch(0) if num_results > 0 else None
+        try:
+            for start in starts:
+                assert pending is not None
+                batch = await pending
+                next_start = start + batch_size
+                pending = fetch(next_start) if next_start < num_results else None
+                for row in batch:
+                    yield result_set._unwrap_row(row)
+        finally:
+            if pending is not None:
+                # Don't leave the prefetched batch behind: wait for it, ignoring its result.
+                await asyncio.gather(pending, return_exceptions=True)
+
+
+class AsyncSession(_AsyncWrapper):
+    """asyncio facade over a :class:`PgxSession`.
+
+    The session has its own pool of threads running the PGX calls of the session and of the
+    objects it returns.
+
+    A session wrapped directly, rather than returned by :func:`get_session`, reads the attributes
+    not loaded yet on its first method call.
+
+    :param session: The session to wrap
+    :param max_workers: The maximum number of PGX calls running at the same time
+    """
+
+    _wrapped_class = PgxSession
+
+    def __init__(
+        self,
+        session: PgxSession,
+        max_workers: int = DEFAULT_MAX_WORKERS,
+        pool: Optional[AttachedThreadPool] = None,
+    ) -> None:
+        if pool is None:
+            pool = AttachedThreadPool(max_workers, thread_name_prefix='pypgx_aio')
+        super().__init__(session, pool)
+
+    async def close(self) -> None:
+        """Close the session and stop its threads."""
+        await self._run(self._wrapped.close)
+        self._pool.shutdown(wait=False)
+
+    async def __aenter__(self) -> "AsyncSession":
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback) -> None:
+        await self.close()
+
+
+_WRAPPER_CLASSES = (
+    (PgxSession, AsyncSession),
+    (Analyst, AsyncAnalyst),
+    (PgxGraph, AsyncGraph),
+    (PgqlResultSet, AsyncResultSet),
+)
+
+
+def _load_attributes(value: Any) -> None:
+    """Read the lazy attributes of an object wrapped by a facade, and those of the analyst of a
+    session. Must be called on a worker thread.
+    """
+    if isinstance(value, tuple(wrapped_class for wrapped_class, _ in _WRAPPER_CLASSES)):
+        load_lazy_properties(value)
+    if isinstance(value, PgxSession) and 'analyst' in vars(value):
+        load_lazy_properties(value.analyst)
+
+
+def _connect(*args: Any, **kwargs: Any) -> PgxSession:
+    session = _get_session(*args, **kwargs)
+    _load_attributes(session)
+    return session
+
+
+async def get_session(
+    *args: Any, max_workers: int = DEFAULT_MAX_WORKERS, **kwargs: Any
+) -> AsyncSession:
+    """Connect to a PGX server and return an :class:`AsyncSession`.
+
+    Takes the same arguments as :func:`pypgx.get_session`.
+
+    :param max_workers: The maximum number of PGX calls running at the same time
+    """
+    pool = AttachedThreadPool(max_workers, thread_name_prefix='pypgx_aio')
+    try:
+        session = await asyncio.wrap_future(pool.submit(_connect, *args, **kwargs))
+    except BaseException:
+        pool.shutdown(wait=False)
+        raise
+    return AsyncSession(session, pool=pool)
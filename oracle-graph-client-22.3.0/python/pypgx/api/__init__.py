@@ -76,6 +76,7 @@ from ._property import EdgeLabel, EdgeProperty, VertexProperty, VertexLabels
 from ._property_meta_data import PropertyMetaData
 from ._scalar import Scalar
 from ._server_instance import ServerInstance
+from ._session_pool import PooledSession, SessionPool
 from ._synchronizer import Synchronizer, FlashbackSynchronizer
 
 
@@ -2,11 +2,12 @@
 # Copyright (C) 2013 - 2022 Oracle and/or its affiliates. All rights reserved.
 #
 
-from typing import TYPE_CHECKING
+from typing import Any, Iterable, List, Union, TYPE_CHECKING
 
 from pypgx.api._pgx_entity import PgxVertex
 from pypgx.api._pgx_path import PgxPath
 from pypgx.api._pgx_context_manager import PgxContextManager
+from pypgx._utils import concurrency
 from pypgx._utils.error_handling import java_handler
 from pypgx._utils.error_messages import ARG_MUST_BE
 
@@ -36,6 +37,31 @@ class AllPaths(PgxContextManager):
         java_path = java_handler(self._all_paths.getPath, [destination._vertex])
         return PgxPath(self.graph, java_path)
 
+    def get_paths(
+        self, destinations: Iterable[Union[PgxVertex, Any]], max_workers: int = 4
+    ) -> List[PgxPath]:
+        """Get the paths to several destination vertices.
+
+        The paths are requested concurrently on the shared worker threads, up to `max_workers` at
+        the same time.
+
+        :param destinations: The destination vertices, as PgxVertex objects or vertex IDs
+        :param max_workers: The maximum number of paths requested at the same time
+        :returns: The paths to the destination vertices, in the same order
+        """
+        if not isinstance(max_workers, int) or max_workers < 1:
+            raise ValueError(ARG_MUST_BE.format(arg='max_workers', type='a positive integer'))
+
+        def get_path(destination: Union[PgxVertex, Any]) -> PgxPath:
+            if not isinstance(destination, PgxVertex):
+                destination = self.graph.get_vertex(destination)
+            return self.get_path(destination)
+
+        destinations = list(destinations)
+        if len(destinations) <= 1 or max_workers == 1:
+            return [get_path(destination) for destination in destinations]
+        return list(concurrency.imap(get_path, destinations, max_workers))
+
     def destroy(self) -> None:
         """Destroy this object."""
         java_handler(self._all_paths.destroy, [])
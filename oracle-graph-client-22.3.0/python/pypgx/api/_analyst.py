@@ -9,6 +9,7 @@ from jnius import autoclass
 import pypgx._utils.algorithms_metadata as alg_metadata
 from pypgx._utils import pgx_types
 from pypgx._utils.arguments_validator import validate_arguments
+from pypgx._utils.concurrency import with_async_methods
 from pypgx._utils.error_handling import java_handler
 from pypgx._utils.error_messages import INVALID_OPTION, PROPERTY_NOT_FOUND, UNHASHABLE_TYPE
 from pypgx.api._all_paths import AllPaths
@@ -41,6 +42,29 @@ if TYPE_CHECKING:
     from pypgx.api._pgx_session import PgxSession
 
 
+@with_async_methods(
+    'adamic_adar_counting', 'all_reachable_vertices_edges',
+    'approximate_vertex_betweenness_centrality', 'bipartite_check', 'center',
+    'closeness_centrality', 'communities_conductance_minimization', 'communities_infomap',
+    'communities_label_propagation', 'compute_high_degree_vertices', 'conductance',
+    'count_triangles', 'create_distance_index', 'degree_centrality', 'diameter',
+    'eigenvector_centrality', 'enumerate_simple_paths', 'fattest_path', 'filtered_bfs',
+    'filtered_dfs', 'find_cycle', 'hits', 'in_degree_centrality', 'in_degree_distribution',
+    'k_core', 'limited_shortest_path_hop_dist', 'limited_shortest_path_hop_dist_filtered',
+    'load_deepwalk_model', 'load_pg2vec_model', 'load_supervised_graphwise_model',
+    'load_unsupervised_graphwise_model', 'local_clustering_coefficient', 'louvain',
+    'matrix_factorization_gradient_descent', 'matrix_factorization_recommendations',
+    'out_degree_centrality', 'out_degree_distribution', 'pagerank', 'pagerank_approximate',
+    'partition_conductance', 'partition_modularity', 'periphery', 'personalized_pagerank',
+    'personalized_salsa', 'personalized_weighted_pagerank', 'prim', 'radius',
+    'random_walk_with_restart', 'reachability', 'salsa', 'scc_kosaraju', 'scc_tarjan',
+    'shortest_path_bellman_ford', 'shortest_path_bellman_ford_reversed',
+    'shortest_path_bidirectional_dijkstra', 'shortest_path_dijkstra',
+    'shortest_path_filtered_bidirectional_dijkstra', 'shortest_path_filtered_dijkstra',
+    'shortest_path_hop_distance', 'shortest_path_hop_distance_reversed', 'topological_schedule',
+    'topological_sort', 'vertex_betweenness_centrality', 'wcc', 'weighted_closeness_centrality',
+    'weighted_pagerank', 'whom_to_follow',
+)
 class Analyst:
     """The Analyst gives access to all built-in algorithms of PGX.
 
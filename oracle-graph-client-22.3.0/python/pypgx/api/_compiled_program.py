@@ -11,7 +11,7 @@ from pypgx.api._scalar import Scalar
 from pypgx.api._pgx_context_manager import PgxContextManager
 from pypgx.api.filters import GraphFilter
 from pypgx._utils.error_handling import java_handler
-from pypgx._utils.error_messages import ARG_MUST_BE, WRONG_NUMBER_OF_ARGS
+from pypgx._utils.error_messages import ARG_MUST_BE, PROPERTY_NOT_FOUND, WRONG_NUMBER_OF_ARGS
 from pypgx._utils import pgx_types
 from pypgx._utils.pyjnius_helper import PyjniusHelper
 from typing import Dict, Optional, Any, TYPE_CHECKING
@@ -31,6 +31,7 @@ scalar_out_types = (
     'NODE_ID_OUT',
     'STRING_OUT',
 )
+property_arg_types = ('NODE_PROPERTY', 'EDGE_PROPERTY')
 
 
 class CompiledProgram(PgxContextManager):
@@ -58,6 +59,9 @@ class CompiledProgram(PgxContextManager):
         If the Green-Marl procedure of this compiled program looks like this:
         procedure pagerank(G: Graph, e double, max int, nodePorp){...}
 
+        Vertex and edge properties can also be passed by name. They are then looked up in the
+        graph that is passed as an argument.
+
         :param argv: All the arguments required by specified procedure
         :returns: Result of analysis as an AnalysisResult as a dict
         """
@@ -67,8 +71,15 @@ class CompiledProgram(PgxContextManager):
             raise TypeError(
                 WRONG_NUMBER_OF_ARGS.format(expected=len(arg_types), received=len(argv))
             )
+        graph = next((arg for arg in argv if isinstance(arg, PgxGraph)), None)
         for idx, (arg, arg_type) in enumerate(zip(argv, arg_types)):
-            if isinstance(arg, PgxGraph):
+            if isinstance(arg, str) and arg_type.toString() in property_arg_types:
+                if graph is None:
+                    raise TypeError(
+                        ARG_MUST_BE.format(arg='argv[' + str(idx) + ']', type=PgxProperty.__name__)
+                    )
+                arguments.append(self._get_graph_property(graph, arg, arg_type.toString())._prop)
+            elif isinstance(arg, PgxGraph):
                 arguments.append(arg._graph)
             elif isinstance(arg, PgxEntity):
                 arguments.append(arg._entity)
@@ -109,6 +120,17 @@ class CompiledProgram(PgxContextManager):
         }
         return analysis_result
 
+    @staticmethod
+    def _get_graph_property(graph: PgxGraph, name: str, arg_type: str) -> PgxProperty:
+        """Look up a property argument that is given by name."""
+        if arg_type == 'NODE_PROPERTY':
+            prop = graph.get_vertex_property(name)
+        else:
+            prop = graph.get_edge_property(name)
+        if prop is None:
+            raise LookupError(PROPERTY_NOT_FOUND.format(prop=name))
+        return prop
+
     def destroy(self) -> None:
         """Free resources on the server taken up by this Program."""
         java_handler(self._program.destroy, [])
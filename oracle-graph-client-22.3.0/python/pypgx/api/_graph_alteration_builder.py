@@ -15,6 +15,7 @@ from pypgx._utils.pgx_types import (
 if TYPE_CHECKING:
     # Don't import at runtime, to avoid circular imports.
     from pypgx.api._pgx_graph import PgxGraph
+    from pypgx.api._pgx_session import PgxSession
 
 
 class GraphAlterationBuilder:
@@ -25,8 +26,11 @@ class GraphAlterationBuilder:
 
     _java_class = "oracle.pgx.api.graphalteration.GraphAlterationBuilder"
 
-    def __init__(self, java_graph_alteration_builder) -> None:
+    def __init__(
+        self, java_graph_alteration_builder, session: Optional["PgxSession"] = None
+    ) -> None:
         self._graph_alteration_builder = java_graph_alteration_builder
+        self._session = session
 
     def set_data_source_version(self, data_source_version: str) -> None:
         """Set the version information for the built graph or snapshot.
@@ -259,7 +263,7 @@ class GraphAlterationBuilder:
         from pypgx.api._pgx_graph import PgxGraph  # need to import here to avoid import loop
 
         pgx_graph = java_handler(self._graph_alteration_builder.build, [new_graph_name])
-        return PgxGraph(self, pgx_graph)
+        return PgxGraph._from_java(self._session, pgx_graph, new_snapshot=True)
 
     def build_new_snapshot(self) -> "PgxGraph":
         """Create a new snapshot for the current graph that is the result of
@@ -270,4 +274,4 @@ class GraphAlterationBuilder:
         from pypgx.api._pgx_graph import PgxGraph  # need to import here to avoid import loop
 
         pgx_graph = java_handler(self._graph_alteration_builder.buildNewSnapshot)
-        return PgxGraph(self, pgx_graph)
+        return PgxGraph._from_java(self._session, pgx_graph, new_snapshot=True)
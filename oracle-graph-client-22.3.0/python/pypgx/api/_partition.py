@@ -3,14 +3,15 @@
 #
 
 from itertools import islice
-from typing import Union, Any, Iterator
+from typing import Union, Any, Dict, Iterator, List, Optional, Tuple
 
 from pypgx.api._pgx_collection import VertexSet
 from pypgx.api._pgx_entity import PgxVertex
 from pypgx.api._pgx_context_manager import PgxContextManager
 from pypgx.api._property import VertexProperty
+from pypgx._utils import columnar, conversion
 from pypgx._utils.error_handling import java_handler
-from pypgx._utils.error_messages import INDEX_OUT_OF_BOUNDS
+from pypgx._utils.error_messages import ARG_MUST_BE, ENTITY_NOT_FOUND, INDEX_OUT_OF_BOUNDS
 
 
 class PgxPartition(PgxContextManager):
@@ -23,13 +24,22 @@ class PgxPartition(PgxContextManager):
         self.size = java_partition.size()
         self.property = property
         self.graph = graph
+        # Summaries computed on demand. The partition does not change once computed.
+        self._component_sizes: Any = None
+        self._assignment: Optional[Tuple[Any, Any]] = None
+        self._index_by_vertex: Optional[Dict[Any, int]] = None
 
     def get_partition_by_vertex(self, v: Union[PgxVertex, int, str]) -> VertexSet:
         """Get the partition a particular vertex belongs to.
 
+        If :meth:`to_assignment_array` was called before, the partition of a vertex ID is looked
+        up locally instead of on the server.
+
         :param v: The vertex
         :returns: The set of vertices representing the partition the given vertex belongs to
         """
+        if isinstance(v, (int, str)) and self._assignment is not None:
+            return self.get_partition_by_index(self.get_partition_index_of_vertex(v))
         if isinstance(v, (int, str)):
             vertex = self.graph.get_vertex(v)
         else:
@@ -49,14 +59,86 @@ class PgxPartition(PgxContextManager):
         return VertexSet(self.graph, java_collection)
 
     def get_partition_index_of_vertex(self, v: Union[PgxVertex, int, str]) -> Any:
-        """Get a partition by index.
+        """Get the index of the partition a particular vertex belongs to.
 
-        :param v: The index. Must be between 0 and size() - 1.
-        :returns: The set of vertices representing the partition
+        If :meth:`to_assignment_array` was called before, the index is looked up locally instead
+        of on the server.
+
+        :param v: The vertex or its ID
+        :returns: The index of the partition, between 0 and size() - 1
+        """
+        if self._assignment is not None:
+            vid = v.id if isinstance(v, PgxVertex) else v
+            if self._index_by_vertex is None:
+                ids, components = self._assignment
+                self._index_by_vertex = dict(zip(ids.tolist(), components.tolist()))
+            if vid not in self._index_by_vertex:
+                raise LookupError(ENTITY_NOT_FOUND.format(entity_type='vertex', id=vid))
+            return self._index_by_vertex[vid]
+        if not isinstance(v, PgxVertex):
+            v = self.graph.get_vertex(v)
+        return java_handler(self._partition.getPartitionIndexOfVertex, [v._vertex])
+
+    def _query_columns(self, query: str) -> List[Any]:
+        """Run a PGQL query on the components property and return its columns as NumPy
+        arrays.
+        """
+        result_set = self.graph.query_pgql(
+            query.format(prop=conversion.to_pgql_identifier(self.property.name))
+        )
+        try:
+            return list(result_set.to_numpy().values())
+        finally:
+            result_set.close()
+
+    def component_sizes(self) -> Any:
+        """Get the number of vertices of each partition.
+
+        The sizes are computed on the server with a single PGQL query, which returns one row
+        per partition. The result is cached. This method requires NumPy.
+
+        :returns: A NumPy array whose element i is the size of the partition with index i
+        """
+        if self._component_sizes is None:
+            np = columnar.import_numpy()
+            components, counts = self._query_columns(
+                'SELECT N.{prop}, COUNT(*) MATCH (N) GROUP BY N.{prop}'
+            )
+            sizes = np.zeros(self.size, dtype='int64')
+            sizes[components.astype('int64')] = counts
+            self._component_sizes = sizes
+        return self._component_sizes
+
+    def to_assignment_array(self) -> Tuple[Any, Any]:
+        """Get the partition index of every vertex.
+
+        The vertex IDs and partition indices are transferred column by column with a single
+        PGQL query. The result is cached, and used by :meth:`get_partition_index_of_vertex` and
+        :meth:`get_partition_by_vertex` afterwards. This method requires NumPy.
+
+        :returns: A (vertex IDs, partition indices) tuple of NumPy arrays
+        """
+        if self._assignment is None:
+            columnar.import_numpy()
+            ids, components = self._query_columns('SELECT ID(N), N.{prop} MATCH (N)')
+            self._assignment = (ids, components)
+        return self._assignment
+
+    def largest(self, k: int) -> List[Tuple[int, int]]:
+        """Get the `k` largest partitions.
+
+        This method requires NumPy.
+
+        :param k: Number of partitions to return
+        :returns: A list of (partition index, size) tuples, from the largest partition to the
+            smallest. Partitions of the same size are ordered by index.
         """
-        if isinstance(v, PgxVertex):
-            v = v.id
-        return java_handler(self._partition.getPartitionIndexOfVertex, [v])
+        if not isinstance(k, int) or k < 0:
+            raise ValueError(ARG_MUST_BE.format(arg='k', type='a non-negative integer'))
+        np = columnar.import_numpy()
+        sizes = self.component_sizes()
+        order = np.argsort(-sizes, kind='stable')[:k]
+        return [(int(idx), int(sizes[idx])) for idx in order]
 
     def get_components_property(self) -> VertexProperty:
         """Return the property that contains for each vertex, its associated component ID."""
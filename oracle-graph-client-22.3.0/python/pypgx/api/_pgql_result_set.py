@@ -4,12 +4,30 @@
 import sys
 from jnius import autoclass
 from pypgx._utils.error_handling import java_handler
-from pypgx._utils.error_messages import INDEX_OUT_OF_BOUNDS, VALID_INTERVAL
-from pypgx._utils import conversion
-from pypgx._utils.pgx_types import col_types
+from pypgx._utils.error_messages import (
+    ARG_MUST_BE,
+    INDEX_OUT_OF_BOUNDS,
+    INVALID_OPTION,
+    VALID_INTERVAL,
+)
+from pypgx._utils import columnar, concurrency, conversion
+from pypgx._utils.row_cache import RowCache
 from pypgx.api._pgx_context_manager import PgxContextManager
 from datetime import date, datetime, time
-from typing import Any, Collection, Iterator, List, Optional, Tuple, Union, TextIO, TYPE_CHECKING
+from typing import (
+    Any,
+    Callable,
+    Collection,
+    Dict,
+    Iterator,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+    Union,
+    TextIO,
+    TYPE_CHECKING,
+)
 
 if TYPE_CHECKING:
     # Don't import at runtime, to avoid circular imports.
@@ -23,6 +41,10 @@ ResultSetFormatter = autoclass('oracle.pgql.lang.ResultSetFormatter')
 PythonClientResultSetUtil = autoclass('oracle.pgx.pypgx.internal.PythonClientResultSetUtil')
 
 DEFAULT_PRINT_LIMIT = ResultSetFormatter.DEFAULT_PRINT_LIMIT
+DEFAULT_BATCH_SIZE = 1000
+DEFAULT_CACHE_MAX_ROWS = 100000
+# Number of rows transferred per request by to_pandas() and to_numpy() when no chunk size is given.
+DEFAULT_EXPORT_CHUNK_SIZE = 100000
 
 
 class PgqlResultSet(PgxContextManager):
@@ -40,9 +62,9 @@ class PgqlResultSet(PgxContextManager):
         self.id = java_pgql_result_set.getId()
         self.num_results = java_pgql_result_set.getNumResults()
         self.pgql_result_elements = {}
-        self._cached_data = {}
-        self._cache_ceil = -1
-        self._id_cols = {}
+        self._cache = RowCache('lru', max_rows=DEFAULT_CACHE_MAX_ROWS)
+        self._page_size = DEFAULT_BATCH_SIZE
+        self._col_types: Dict[int, str] = {}
         self.is_closed = False
         metadata = java_handler(self._pgql_result_set.getMetaData, [])
         self.col_count = java_handler(metadata.getColumnCount, [])
@@ -55,13 +77,86 @@ class PgqlResultSet(PgxContextManager):
             col_name = result_elements.get(idx).getVarName()
             col_type = str(result_elements.get(idx).getElementType().toString())
             self.pgql_result_elements[idx] = col_name
-            if col_type in col_types:
-                self._id_cols[idx] = col_type
+            self._col_types[idx] = col_type
+
+        # Conversion of each column that Pyjnius does not convert to Python already, resolved once
+        # for all rows.
+        self._converters: List[Tuple[int, Callable[[Any], Any]]] = []
+        for idx, col_type in self._col_types.items():
+            converter = conversion.column_converter(col_type, graph)
+            if converter is not None:
+                self._converters.append((idx, converter))
 
     def _assert_not_closed(self) -> None:
         if self.is_closed:
             raise RuntimeError("result set closed")
 
+    def configure_cache(
+        self,
+        policy: str = 'lru',
+        max_rows: Optional[int] = DEFAULT_CACHE_MAX_ROWS,
+        max_bytes: Optional[int] = None,
+        page_size: int = DEFAULT_BATCH_SIZE,
+    ) -> None:
+        """Configure the cache of rows read by :meth:`get_row`, :meth:`get_slice` and iteration.
+
+        The cache keeps track of which ranges of rows have been fetched, so that only the rows
+        that are not cached yet are fetched from the server. When the cache exceeds its budget,
+        the least recently used ranges are evicted. The cache is emptied by this method.
+
+        Possible policies are:
+
+            - 'lru': evict the least recently used rows first
+            - 'scan': like 'lru', but rows read by iterating over the result set are evicted first,
+              so that a full scan does not flush rows that are accessed repeatedly
+            - 'none': do not cache rows, only the requested rows are fetched
+
+        :param policy: Cache policy
+        :param max_rows: Maximum number of cached rows, or None for no limit
+        :param max_bytes: Approximate maximum size of the cached rows in bytes, or None for no
+            limit
+        :param page_size: Number of rows fetched at once by :meth:`get_row` when a row is not
+            cached
+        """
+        if not isinstance(page_size, int) or page_size < 1:
+            raise ValueError(ARG_MUST_BE.format(arg='page_size', type='a positive integer'))
+        self._cache = RowCache(policy, max_rows=max_rows, max_bytes=max_bytes)
+        self._page_size = page_size
+
+    @property
+    def cache_policy(self) -> str:
+        """Get the policy of the row cache."""
+        return self._cache.policy
+
+    @property
+    def cache_hits(self) -> int:
+        """Get the number of row reads served from the row cache."""
+        return self._cache.hits
+
+    @property
+    def cache_misses(self) -> int:
+        """Get the number of row reads that had to be fetched from the server."""
+        return self._cache.misses
+
+    def _get_rows(self, start: int, stop: int, count: bool = True) -> List[list]:
+        """Get the converted rows from `start` (inclusive) to `stop` (exclusive).
+
+        Only the rows that are not cached are fetched, with one request per uncached range.
+        """
+        rows = self._cache.get_range(start, stop, count=count)
+        if rows is not None:
+            return rows
+        if not self._cache.enabled:
+            return self._fetch_rows(start, stop)
+
+        rows = []
+        for segment_start, segment_stop, segment in self._cache.segments(start, stop):
+            if segment is None:
+                segment = self._fetch_rows(segment_start, segment_stop)
+                self._cache.put(segment_start, segment)
+            rows.extend(segment)
+        return rows
+
     def get_row(self, row: int) -> Any:
         """Get row from result_set.
         This method may change result_set cursor.
@@ -72,44 +167,99 @@ class PgqlResultSet(PgxContextManager):
         if row < 0 or row > self.num_results - 1:
             raise RuntimeError(INDEX_OUT_OF_BOUNDS.format(idx='row', max_idx=self.num_results - 1))
 
-        if row in self._cached_data:
-            return self._cached_data[row]
-        else:
-            tmp_row = self._result_set_util.toList(row, row + 1)[0]
-            cached_row = list(tmp_row)
-
-            for idx in self._id_cols.keys():
-                cached_row[idx] = conversion.anything_to_python(tmp_row[idx], self.graph)
-
-            if len(self.pgql_result_elements) == 1:
-                cached_row = cached_row[0]
-            self._cached_data[row] = cached_row
+        cached_rows = self._cache.get_range(row, row + 1)
+        if cached_rows is not None:
+            return self._unwrap_row(cached_rows[0])
+        if not self._cache.enabled:
+            return self._unwrap_row(self._fetch_rows(row, row + 1)[0])
 
-        return cached_row
+        # Read ahead the rest of the page containing the row, which is typically read next.
+        page_start = row - row % self._page_size
+        page_stop = min(page_start + self._page_size, self.num_results)
+        page = self._get_rows(page_start, page_stop, count=False)
+        return self._unwrap_row(page[row - page_start])
 
-    def _insert_slice_to_cache(self, typed_query_list, start, stop):
-        """Insert whole slice of rows from result_list into cache."""
-        for i in range(0, stop - start + 1):
-            self._cached_data[i + start] = typed_query_list[i]
+    def _convert_row_to_python(self, row: list) -> list:
+        """Convert the values of `row` in place, with the conversion of each column.
 
-    def _convert_row_to_python(self, item):
-        """Wrap anything_to_python to convert whole row,
-        since lambdas are not allowed.
+        :param row: row to convert
+        """
+        for idx, convert in self._converters:
+            row[idx] = convert(row[idx])
+        return row
 
-        :param item: row to convert
+    def _fetch_rows(self, start: int, stop: int) -> List[list]:
+        """Fetch the rows from `start` (inclusive) to `stop` (exclusive) in a single request
+        and convert them to Python.
         """
-        row = item
-        for i in self._id_cols.keys():
-            row[i] = conversion.anything_to_python(item[i], self.graph)
+        query_list = java_handler(self._result_set_util.toList, [start, stop])
+        return [self._convert_row_to_python(list(row)) for row in query_list]
+
+    def _unwrap_row(self, row: list) -> Any:
+        """Return the single element of `row` if the result set has only one column."""
+        if len(self.pgql_result_elements) == 1:
+            return row[0]
         return row
 
-    def _convert_item_to_python(self, item):
-        """Wrap anything_to_python to add argument,
-        since lambdas are not allowed.
+    def _prefetch_batches(self, bounds: List[Tuple[int, int]]) -> Iterator[List[list]]:
+        """Yield the batches delimited by `bounds`, fetching the next batch on a worker thread
+        while the current one is consumed.
+        """
+        executor = concurrency.get_executor()
+        future = executor.submit(self._fetch_rows, *bounds[0]) if bounds else None
+        try:
+            for idx, (start, _) in enumerate(bounds):
+                batch = future.result()
+                # One fetch at a time, since fetching moves the cursor of the result set.
+                future = None
+                if idx + 1 < len(bounds):
+                    future = executor.submit(self._fetch_rows, *bounds[idx + 1])
+                self._cache.put(start, batch, scan=True)
+                yield batch
+        finally:
+            if future is not None:
+                future.cancel()
+
+    def _get_batch(self, start: int, stop: int) -> List[list]:
+        """Get the rows of an iteration batch, from the cache if they are all cached."""
+        batch = self._cache.get_range(start, stop)
+        if batch is None:
+            batch = self._fetch_rows(start, stop)
+            self._cache.put(start, batch, scan=True)
+        return batch
+
+    def _iter_rows(self, batch_size: int, prefetch: bool) -> Iterator[Any]:
+        bounds = [
+            (start, min(start + batch_size, self.num_results))
+            for start in range(0, self.num_results, batch_size)
+        ]
+        if prefetch:
+            batches = self._prefetch_batches(bounds)
+        else:
+            batches = (self._get_batch(start, stop) for start, stop in bounds)
+        for batch in batches:
+            for row in batch:
+                yield self._unwrap_row(row)
+
+    def iter_rows(
+        self, batch_size: int = DEFAULT_BATCH_SIZE, prefetch: bool = False
+    ) -> Iterator[Any]:
+        """Iterate over the rows of the result set, fetching them from the server in batches.
+
+        Each batch of rows is transferred in a single request. Rows are converted to Python in the
+        same way as by :meth:`get_row`.
+        This method may change result_set cursor.
 
-        :param item: Item to convert
+        :param batch_size: Number of rows fetched per request
+        :param prefetch: If True, the next batch is fetched on a background thread while the
+            current one is consumed, even if it is already cached. The result set must not be
+            accessed otherwise until the iteration is over.
+        :return: An iterator over the rows
         """
-        return conversion.anything_to_python(item, self.graph)
+        self._assert_not_closed()
+        if not isinstance(batch_size, int) or batch_size < 1:
+            raise ValueError(ARG_MUST_BE.format(arg='batch_size', type='a positive integer'))
+        return self._iter_rows(batch_size, prefetch)
 
     def get_slice(self, start: int, stop: int, step: int = 1) -> List[list]:
         """Get slice from result_set.
@@ -126,19 +276,7 @@ class PgqlResultSet(PgxContextManager):
                 VALID_INTERVAL.format(start=start, stop=stop, max_idx=self.num_results)
             )
 
-        # fill cache first if data is not available
-        if stop >= self._cache_ceil:
-            query_list = self._result_set_util.toList(self._cache_ceil + 1, stop + 1)
-            typed_query_list = list(map(self._convert_row_to_python, query_list))
-            self._insert_slice_to_cache(typed_query_list, self._cache_ceil + 1, stop)
-            self._cache_ceil = stop
-
-        # fill the slice
-        typed_query_list = []
-        for row in range(start, stop + 1, step):
-            typed_query_list.append(self._cached_data[row])
-
-        return typed_query_list
+        return self._get_rows(start, stop + 1)[::step]
 
     def to_frame(self) -> "PgxFrame":
         """Copy the content of this result set into a new PgxFrames
@@ -151,38 +289,191 @@ class PgqlResultSet(PgxContextManager):
         java_frame = java_handler(self._pgql_result_set.toFrame, [])
         return PgxFrame(java_frame)
 
-    def to_pandas(self):
+    def _resolve_columns(self, columns: Optional[Sequence[Union[str, int]]]) -> List[int]:
+        """Return the indices of the given column names or indices, or of all columns."""
+        if columns is None:
+            return list(range(self.col_count))
+        indices = []
+        for column in columns:
+            if isinstance(column, int) and not isinstance(column, bool):
+                if column < 0 or column >= self.col_count:
+                    raise RuntimeError(
+                        INDEX_OUT_OF_BOUNDS.format(idx='column', max_idx=self.col_count - 1)
+                    )
+                indices.append(column)
+            elif column in self.columns:
+                indices.append(self.columns.index(column))
+            else:
+                raise ValueError(INVALID_OPTION.format(var='column', opts=self.columns))
+        return indices
+
+    def _fetch_columns(self, start: int, stop: int, col_indices: List[int]) -> List[Sequence]:
+        """Fetch the rows from `start` (inclusive) to `stop` (exclusive) in a single request
+        and return the unconverted values of the given columns.
+        """
+        query_list = java_handler(self._result_set_util.toList, [start, stop])
+        if len(query_list) == 0:
+            return [() for _ in col_indices]
+        columns = list(zip(*query_list))
+        return [columns[idx] for idx in col_indices]
+
+    def _iter_column_chunks(
+        self, col_indices: List[int], chunksize: int
+    ) -> Iterator[Tuple[int, int, List[Sequence]]]:
+        for start in range(0, self.num_results, chunksize):
+            stop = min(start + chunksize, self.num_results)
+            yield start, stop, self._fetch_columns(start, stop, col_indices)
+
+    def _get_all_columns(self, col_indices: List[int]) -> List[Sequence]:
+        """Fetch the unconverted values of the given columns for all rows."""
+        values: List[list] = [[] for _ in col_indices]
+        for _, _, chunk in self._iter_column_chunks(col_indices, DEFAULT_EXPORT_CHUNK_SIZE):
+            for column_values, chunk_values in zip(values, chunk):
+                column_values.extend(chunk_values)
+        return values
+
+    def _columns_to_pandas(
+        self,
+        col_indices: List[int],
+        values: List[Sequence],
+        categorical: bool,
+        index_start: int = 0,
+    ):
+        pd = columnar.import_pandas()
+        data = {
+            pos: columnar.column_to_pandas(
+                column_values, self._col_types[idx], self.graph, categorical
+            )
+            for pos, (idx, column_values) in enumerate(zip(col_indices, values))
+        }
+        index = pd.RangeIndex(index_start, index_start + (len(values[0]) if values else 0))
+        df = pd.DataFrame(data, index=index)
+        # Set the names afterwards, so that duplicate column names are kept.
+        df.columns = [self.columns[idx] for idx in col_indices]
+        return df
+
+    def _iter_pandas_chunks(self, col_indices: List[int], chunksize: int, categorical: bool):
+        for start, _, chunk in self._iter_column_chunks(col_indices, chunksize):
+            yield self._columns_to_pandas(col_indices, chunk, categorical, index_start=start)
+
+    def to_pandas(
+        self,
+        columns: Optional[Sequence[Union[str, int]]] = None,
+        chunksize: Optional[int] = None,
+        categorical: bool = False,
+    ):
         """
         Convert to pandas DataFrame.
 
+        The rows are transferred in chunks and converted column by column: numeric and boolean
+        columns get a primitive dtype ('Int32', 'Int64' or 'boolean' if they contain nulls), date
+        and timestamp columns get a datetime64 dtype (timestamps with timezone are converted to
+        UTC), and other columns hold Python objects.
+
         This method may change result_set cursor.
 
         This method requires pandas.
 
-        :return: PgqlResultSet as a Pandas Dataframe
+        :param columns: Names or indices of the columns to convert, or None for all columns
+        :param chunksize: If given, return an iterator over DataFrames of at most `chunksize`
+            rows each instead of a single DataFrame
+        :param categorical: Whether to convert string columns to the 'category' dtype
+        :return: PgqlResultSet as a Pandas Dataframe, or an iterator over Pandas Dataframes if
+            `chunksize` is given
         """
         self._assert_not_closed()
-        try:
-            import pandas as pd
-        except Exception:
-            raise ImportError("Could not find pandas package")
-
-        untyped_results = self._result_set_util.toList(0, self.num_results)
-
-        df = pd.DataFrame(untyped_results, columns=self.columns)
-        for idx in self._id_cols.keys():
-            if self._id_cols[idx] == 'boolean':
-                df[self.pgql_result_elements[idx]] = df[self.pgql_result_elements[idx]].astype(
-                    'bool'
-                )
-                continue
-            df[self.pgql_result_elements[idx]] = df[self.pgql_result_elements[idx]].apply(
-                self._convert_item_to_python
+        columnar.import_pandas()
+        col_indices = self._resolve_columns(columns)
+        if chunksize is not None:
+            if not isinstance(chunksize, int) or chunksize < 1:
+                raise ValueError(ARG_MUST_BE.format(arg='chunksize', type='a positive integer'))
+            return self._iter_pandas_chunks(col_indices, chunksize, categorical)
+
+        values = self._get_all_columns(col_indices)
+        return self._columns_to_pandas(col_indices, values, categorical)
+
+    def to_numpy(self, columns: Optional[Sequence[Union[str, int]]] = None) -> Dict[str, Any]:
+        """Convert to a dictionary of NumPy arrays, one per column.
+
+        Numeric and boolean columns without nulls become arrays of the matching primitive dtype,
+        date and timestamp columns become datetime64 arrays (timestamps with timezone are
+        converted to UTC), and other columns become object arrays.
+
+        This method may change result_set cursor.
+
+        This method requires NumPy.
+
+        :param columns: Names or indices of the columns to convert, or None for all columns
+        :return: A dictionary mapping column names to NumPy arrays
+        """
+        self._assert_not_closed()
+        columnar.import_numpy()
+        col_indices = self._resolve_columns(columns)
+        values = self._get_all_columns(col_indices)
+        return {
+            self.columns[idx]: columnar.column_to_numpy(
+                column_values, self._col_types[idx], self.graph
             )
+            for idx, column_values in zip(col_indices, values)
+        }
+
+    def _columns_to_arrow(self, col_indices: List[int], values: List[Sequence]):
+        pa = columnar.import_pyarrow()
+        arrays = [
+            columnar.column_to_arrow(column_values, self._col_types[idx], self.graph)
+            for idx, column_values in zip(col_indices, values)
+        ]
+        return pa.RecordBatch.from_arrays(arrays, names=[self.columns[idx] for idx in col_indices])
 
-        created_df = df.sort_index().infer_objects()
+    def _iter_arrow_batches(self, col_indices: List[int], batch_rows: int):
+        for _, _, chunk in self._iter_column_chunks(col_indices, batch_rows):
+            yield self._columns_to_arrow(col_indices, chunk)
 
-        return created_df
+    def to_arrow(self, columns: Optional[Sequence[Union[str, int]]] = None):
+        """Convert to a pyarrow Table.
+
+        Primitive columns are converted directly from the transferred values, without creating
+        intermediate Python objects such as PgxVertex. Vertices and edges are represented by their
+        IDs, vertex labels by sorted lists, 2D points by structs with 'x' and 'y' fields and times
+        with timezone by ISO 8601 strings. Timestamps with timezone are converted to UTC.
+
+        This method may change result_set cursor.
+
+        This method requires pyarrow.
+
+        :param columns: Names or indices of the columns to convert, or None for all columns
+        :return: PgqlResultSet as a pyarrow Table
+        """
+        self._assert_not_closed()
+        pa = columnar.import_pyarrow()
+        col_indices = self._resolve_columns(columns)
+        values = self._get_all_columns(col_indices)
+        return pa.Table.from_batches([self._columns_to_arrow(col_indices, values)])
+
+    def to_arrow_batches(
+        self,
+        batch_rows: int = DEFAULT_EXPORT_CHUNK_SIZE,
+        columns: Optional[Sequence[Union[str, int]]] = None,
+    ) -> Iterator[Any]:
+        """Iterate over the result set as pyarrow RecordBatches.
+
+        Each batch is transferred in a single request, so that the whole result set never has to
+        fit in memory. The columns are converted like in :meth:`to_arrow`.
+
+        This method may change result_set cursor.
+
+        This method requires pyarrow.
+
+        :param batch_rows: Maximum number of rows per batch
+        :param columns: Names or indices of the columns to convert, or None for all columns
+        :return: An iterator over pyarrow RecordBatches
+        """
+        self._assert_not_closed()
+        columnar.import_pyarrow()
+        if not isinstance(batch_rows, int) or batch_rows < 1:
+            raise ValueError(ARG_MUST_BE.format(arg='batch_rows', type='a positive integer'))
+        col_indices = self._resolve_columns(columns)
+        return self._iter_arrow_batches(col_indices, batch_rows)
 
     def absolute(self, row: int) -> bool:
         """Move the cursor to the given row number in this ResultSet object.
@@ -478,9 +769,10 @@ class PgqlResultSet(PgxContextManager):
     def __iter__(self) -> Iterator[List[Any]]:
         """Iterate over result_set object
         This method may change result_set cursor.
+
+        Rows are fetched in batches of ``DEFAULT_BATCH_SIZE``, see :meth:`iter_rows`.
         """
-        self._assert_not_closed()
-        return (self.get_row(row) for row in range(self.num_results))
+        return self.iter_rows()
 
     def __repr__(self) -> str:
         self._assert_not_closed()
@@ -90,7 +90,7 @@ class Pgx:
         else:
             java_session = java_handler(self._pgx.createSession, [base_url, source])
 
-        return PgxSession(java_session)
+        return PgxSession._from_java(java_session)
 
     def __repr__(self) -> str:
         return "Pgx"
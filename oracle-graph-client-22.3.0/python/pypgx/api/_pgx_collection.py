@@ -5,21 +5,47 @@
 import collections.abc
 from itertools import islice
 
-from jnius import autoclass
+from jnius import autoclass, cast
 
 from pypgx.api._pgx_entity import PgxEdge, PgxVertex
 from pypgx.api._pgx_context_manager import PgxContextManager
 from pypgx._utils.error_handling import java_handler
-from pypgx._utils.error_messages import UNHASHABLE_TYPE
-from pypgx._utils import conversion
+from pypgx._utils.error_messages import (
+    ABSTRACT_METHOD,
+    ARG_MUST_BE,
+    INDEX_OUT_OF_BOUNDS,
+    INVALID_OPTION,
+    UNHASHABLE_TYPE,
+)
+from pypgx._utils import columnar, conversion
 from pypgx.api._pgx_id import PgxId
-from typing import Iterable, Iterator, List, Optional, Union, TYPE_CHECKING, NoReturn, Any
+from pypgx.api._pgql_result_set import DEFAULT_BATCH_SIZE
+from typing import (
+    Any,
+    Iterable,
+    Iterator,
+    List,
+    NoReturn,
+    Optional,
+    Tuple,
+    TYPE_CHECKING,
+    Union,
+)
 
 if TYPE_CHECKING:
     # Don't import at runtime, to avoid circular imports.
     from pypgx.api._pgx_graph import PgxGraph
     from pypgx.api._pgx_map import PgxMap
 
+Arrays = autoclass('java.util.Arrays')
+
+# Pattern of the edges followed by VertexCollection.expand(), SRC being in the collection.
+_EXPANSION_PATTERNS = {
+    'outgoing': '(SRC)-[E{label}]->(DST)',
+    'incoming': '(SRC)<-[E{label}]-(DST)',
+    'both': '(SRC)-[E{label}]-(DST)',
+}
+
 
 class PgxCollection(PgxContextManager):
     """Superclass for Pgx collections."""
@@ -37,12 +63,17 @@ class PgxCollection(PgxContextManager):
             self.id_type = None
         self.is_mutable = java_collection.isMutable()
         self.graph = graph
+        # Elements fetched for indexing, see _get_items().
+        self._snapshot: Optional[List[Any]] = None
+        self._snapshot_iterator: Optional[Iterator[Any]] = None
+        self._snapshot_size = 0
 
     def clear(self) -> None:
         """Clear an existing collection.
 
         :return: None
         """
+        self._clear_snapshot()
         return java_handler(self._collection.clear, [])
 
     def clone(self, name: Optional[str] = None) -> "PgxCollection":
@@ -67,11 +98,26 @@ class PgxCollection(PgxContextManager):
         return self._collection.size()
 
     def _create_ids_array(self, collection, entity_type):
+        """Convert the entities in `collection`, which can also be a NumPy array of IDs, to a
+        java.util.List of IDs.
 
-        array_ids = autoclass('java.util.ArrayList')()
-        for item in collection:
-            array_ids.add(item.id if isinstance(item, entity_type) else item)
-        return array_ids
+        The list is built with a single call into Java: Pyjnius converts the IDs to a Java array in
+        one go, instead of one ArrayList.add() call per ID. It is cast to a Collection, so that
+        Pyjnius picks the overloads that take a Collection.
+        """
+        ids = [
+            item.id if isinstance(item, entity_type) else item
+            for item in columnar.to_list(collection)
+        ]
+        return cast('java.util.Collection', Arrays.asList(*ids))
+
+    def _create_elements_list(self, elements: Iterable[Any]):
+        """Convert `elements` to a java.util.List, which is built with a single call into Java."""
+        java_elements = [
+            conversion.property_to_java(element, self.content_type)
+            for element in columnar.to_list(elements)
+        ]
+        return cast('java.util.Collection', Arrays.asList(*java_elements))
 
     def destroy(self) -> None:
         """Request destruction of this object.
@@ -82,6 +128,88 @@ class PgxCollection(PgxContextManager):
         """
         java_handler(self._collection.destroy, [])
 
+    def _wrap(self, java_element: Any) -> Any:
+        """Convert an element, as returned by the Java iterator, to Python."""
+        raise NotImplementedError(ABSTRACT_METHOD)
+
+    def _iter_java_pages(self, page_size: int) -> Iterator[List[Any]]:
+        """Iterate over the Java elements of the collection, in lists of `page_size` elements."""
+        it = islice(self._collection.iterator(), self.size)
+        while True:
+            page = list(islice(it, page_size))
+            if not page:
+                return
+            yield page
+
+    def to_list(self, page_size: Optional[int] = None) -> Union[List[Any], Iterator[List[Any]]]:
+        """Get the elements of the collection.
+
+        :param page_size: If None, return a list of all the elements. Otherwise, return an
+            iterator over lists of at most `page_size` elements, so that the elements are fetched
+            page by page while iterating.
+        """
+        if page_size is None:
+            return list(self)
+        if page_size < 1:
+            raise ValueError(ARG_MUST_BE.format(arg='page_size', type='a positive integer'))
+        return ([self._wrap(item) for item in page] for page in self._iter_java_pages(page_size))
+
+    def _get_ids(self, id_type: str):
+        """Return the IDs of the vertices or edges of the collection as a NumPy array."""
+        columnar.import_numpy()
+        return columnar.column_to_numpy(self._get_id_list(), id_type)
+
+    def _get_id_list(self) -> List[Any]:
+        """Return the IDs of the vertices or edges of the collection, fetched page by page."""
+        ids: List[Any] = []
+        for page in self._iter_java_pages(DEFAULT_BATCH_SIZE):
+            ids.extend(item.getId() for item in page)
+        return ids
+
+    def _clear_snapshot(self) -> None:
+        """Forget the elements fetched for indexing, because the collection changes."""
+        self._snapshot = None
+        self._snapshot_iterator = None
+
+    def _fetch_snapshot(self, stop: int) -> List[Any]:
+        """Fetch the Java elements of the collection page by page, until at least the first
+        `stop` elements are cached, and return the cached elements.
+        """
+        if self._snapshot is None:
+            self._snapshot = []
+            self._snapshot_size = self.size
+            self._snapshot_iterator = islice(self._collection.iterator(), self._snapshot_size)
+        missing = stop - len(self._snapshot)
+        if missing > 0:
+            num_pages = -(-missing // DEFAULT_BATCH_SIZE)
+            self._snapshot.extend(islice(self._snapshot_iterator, num_pages * DEFAULT_BATCH_SIZE))
+        return self._snapshot
+
+    def _get_items(self, idx: Union[slice, int]) -> Any:
+        """Get the element at index `idx`, or a list of elements if `idx` is a slice.
+
+        The elements are read from a snapshot that is fetched page by page as needed, and kept
+        until the collection is changed through this object.
+        """
+        if self._snapshot is None:
+            self._fetch_snapshot(0)
+        size = self._snapshot_size
+        if isinstance(idx, slice):
+            indices = range(*idx.indices(size))
+            if len(indices) == 0:
+                return []
+            snapshot = self._fetch_snapshot(max(indices[0], indices[-1]) + 1)
+            return [self._wrap(snapshot[i]) for i in indices]
+        if idx < 0:
+            idx += size
+        if not 0 <= idx < size:
+            raise IndexError(INDEX_OUT_OF_BOUNDS.format(idx='idx', max_idx=size - 1))
+        return self._wrap(self._fetch_snapshot(idx + 1)[idx])
+
+    def __iter__(self) -> Iterator[Any]:
+        it = self._collection.iterator()
+        return (self._wrap(item) for item in islice(it, 0, self.size))
+
     def __len__(self) -> int:
         return self.size
 
@@ -130,20 +258,16 @@ class PgxCollection(PgxContextManager):
 
         :param source: Elements to add
         """
-        java_elements = autoclass('java.util.ArrayList')()
-        for element in source:
-            java_elements.add(conversion.property_to_java(element, self.content_type))
-        java_handler(self._collection.addAllElements, [java_elements])
+        self._clear_snapshot()
+        java_handler(self._collection.addAllElements, [self._create_elements_list(source)])
 
     def remove_all_elements(self, source: Iterable[Union[PgxEdge, PgxVertex]]) -> None:
         """Remove elements from an existing collection.
 
         :param source: Elements to remove
         """
-        java_elements = autoclass('java.util.ArrayList')()
-        for element in source:
-            java_elements.add(conversion.property_to_java(element, self.content_type))
-        java_handler(self._collection.removeAllElements, [java_elements])
+        self._clear_snapshot()
+        java_handler(self._collection.removeAllElements, [self._create_elements_list(source)])
 
     def contains(self, element):  # noqa: D102
         raise NotImplementedError
@@ -180,10 +304,11 @@ class VertexCollection(PgxCollection):
 
         :param v: Vertex or vertex id. Can also be an iterable of vertices/Vetrices ids
         """
-        if isinstance(v, collections.abc.Iterable):
+        if isinstance(v, collections.abc.Iterable) and not isinstance(v, str):
             return self.add_all(v)
         elif not isinstance(v, PgxVertex):
             v = self.graph.get_vertex(v)
+        self._clear_snapshot()
         java_handler(self._collection.add, [v._vertex])
 
     def add_all(self, vertices: Iterable[Union[PgxVertex, int, str]]) -> None:
@@ -192,6 +317,7 @@ class VertexCollection(PgxCollection):
         :param vertices: Iterable of vertices/Vertices ids
         """
         vids = self._create_ids_array(vertices, PgxVertex)
+        self._clear_snapshot()
         java_handler(self._collection.addAllById, [vids])
 
     def remove(self, v: Union[PgxVertex, int, str, Iterable[Union[PgxVertex, int, str]]]) -> None:
@@ -199,33 +325,100 @@ class VertexCollection(PgxCollection):
 
         :param v: Vertex or vertex id. Can also be an iterable of vertices/Vetrices ids.
         """
-        if isinstance(v, collections.abc.Iterable):
+        if isinstance(v, collections.abc.Iterable) and not isinstance(v, str):
             self.remove_all(v)
         else:
             if not isinstance(v, PgxVertex):
                 v = self.graph.get_vertex(v)
+            self._clear_snapshot()
             java_handler(self._collection.remove, [v._vertex])
 
     def remove_all(self, vertices: Iterable[Union[PgxVertex, int, str]]):
         """Remove multiple vertices from the collection.
 
-        :param vertices: Iterable of vertices/Vetrices ids
+        All the vertices are sent to the server in a single request.
+
+        :param vertices: Iterable of vertices/Vetrices ids, e.g. a NumPy array of IDs
         """
         vids = self._create_ids_array(vertices, PgxVertex)
+        self._clear_snapshot()
         java_handler(self._collection.removeAllById, [vids])
 
-    def __iter__(self) -> Iterator[PgxVertex]:
-        it = self._collection.iterator()
-        return (PgxVertex(self.graph, item) for item in islice(it, 0, self.size))
+    def expand(
+        self,
+        direction: str = 'outgoing',
+        edge_label: Optional[str] = None,
+        with_edges: bool = False,
+    ) -> Union["VertexSet", Tuple["VertexSet", Any, Any, Any]]:
+        """Return the neighbors of all the vertices of this collection.
+
+        The neighbors are found with a single PGQL query and collected into a new vertex set on
+        the server, so the number of round trips does not depend on the number of vertices. This
+        makes it possible to walk a graph level by level, e.g. for a breadth-first search, with one
+        expansion per level. The source and the destination of an edge are the vertex of this
+        collection and its neighbor, whatever the direction of the edge.
+
+        :param direction: Direction of the followed edges, one of ('outgoing', 'incoming', 'both')
+        :param edge_label: Label of the followed edges, or None to follow all edges
+        :param with_edges: Whether to also return the followed edges, as three NumPy arrays
+            holding the source, destination and edge IDs. This requires NumPy.
+        :return: A new vertex set of the neighbors, or a (neighbors, source IDs, destination IDs,
+            edge IDs) tuple if `with_edges` is True
+        """
+        from pypgx.api.filters import VertexFilter
 
-    def __getitem__(self, idx: Union[slice, int]) -> Union[List[PgxVertex], PgxVertex]:
-        it = self._collection.iterator()
-        if isinstance(idx, slice):
-            return list(
-                PgxVertex(self.graph, item) for item in islice(it, idx.start, idx.stop, idx.step)
+        if direction not in _EXPANSION_PATTERNS:
+            raise ValueError(
+                INVALID_OPTION.format(var='direction', opts=list(_EXPANSION_PATTERNS.keys()))
             )
-        else:
-            return list(PgxVertex(self.graph, item) for item in islice(it, idx, idx + 1))[0]
+        if with_edges:
+            # Fail before querying if NumPy is missing.
+            columnar.import_numpy()
+
+        vertex_ids = self._get_id_list()
+        if len(vertex_ids) == 0:
+            neighbors = self.graph.create_vertex_set()
+            if not with_edges:
+                return neighbors
+            vertex_id_type = getattr(self.graph, 'vertex_id_type', None) or 'long'
+            no_vertex_ids = columnar.column_to_numpy([], vertex_id_type)
+            no_edge_ids = columnar.column_to_numpy([], 'long')
+            return neighbors, no_vertex_ids, no_vertex_ids.copy(), no_edge_ids
+
+        label = '' if edge_label is None else ':' + conversion.to_pgql_identifier(edge_label)
+        pattern = _EXPANSION_PATTERNS[direction].format(label=label)
+        statement = self.graph.prepare_pgql(
+            'SELECT DST, ID(SRC) AS SRC_ID, ID(DST) AS DST_ID, ID(E) AS E_ID '
+            'MATCH {} WHERE ID(SRC) IN ?'.format(pattern)
+        )
+        result_set = None
+        try:
+            statement.set_array(1, vertex_ids)
+            result_set = statement.execute_query()
+            neighbors_filter = VertexFilter.from_pgql_result_set(result_set, 'DST')
+            neighbors = self.graph.get_vertices(neighbors_filter)
+            if not with_edges:
+                return neighbors
+            edges = result_set.to_numpy(columns=[1, 2, 3])
+            return (neighbors,) + tuple(edges.values())
+        finally:
+            if result_set is not None:
+                result_set.close()
+            statement.close()
+
+    def to_ids(self):
+        """Get the IDs of the vertices of the collection as a NumPy array.
+
+        The vertices are not wrapped as :class:`PgxVertex` objects. This method requires NumPy.
+        """
+        id_type = self.id_type or getattr(self.graph, 'vertex_id_type', None) or 'long'
+        return self._get_ids(id_type)
+
+    def _wrap(self, java_element: Any) -> PgxVertex:
+        return PgxVertex(self.graph, java_element)
+
+    def __getitem__(self, idx: Union[slice, int]) -> Union[List[PgxVertex], PgxVertex]:
+        return self._get_items(idx)
 
     def __hash__(self) -> NoReturn:
         raise TypeError(UNHASHABLE_TYPE.format(type_name=self.__class__))
@@ -258,14 +451,18 @@ class EdgeCollection(PgxCollection):
             return self.add_all(e)
         elif not isinstance(e, PgxEdge):
             e = self.graph.get_edge(e)
+        self._clear_snapshot()
         java_handler(self._collection.add, [e._edge])
 
     def add_all(self, edges: Iterable[Union[PgxEdge, int]]) -> None:
         """Add multiple vertices to the collection.
 
-        :param edges: Iterable of edges/edges ids
+        All the edges are sent to the server in a single request.
+
+        :param edges: Iterable of edges/edges ids, e.g. a NumPy array of IDs
         """
         eids = self._create_ids_array(edges, PgxEdge)
+        self._clear_snapshot()
         java_handler(self._collection.addAllById, [eids])
 
     def remove(self, e: Union[PgxEdge, int, Iterable[Union[PgxEdge, int]]]):
@@ -277,28 +474,32 @@ class EdgeCollection(PgxCollection):
             return self.remove_all(e)
         elif not isinstance(e, PgxEdge):
             e = self.graph.get_edge(e)
+        self._clear_snapshot()
         java_handler(self._collection.remove, [e._edge])
 
     def remove_all(self, edges: Iterable[Union[PgxEdge, int]]):
         """Remove multiple edges from the collection.
 
-        :param edges: Iterable of edges/edges ids
+        All the edges are sent to the server in a single request.
+
+        :param edges: Iterable of edges/edges ids, e.g. a NumPy array of IDs
         """
         eids = self._create_ids_array(edges, PgxEdge)
+        self._clear_snapshot()
         java_handler(self._collection.removeAllById, [eids])
 
-    def __iter__(self) -> Iterator[PgxEdge]:
-        it = self._collection.iterator()
-        return (PgxEdge(self.graph, item) for item in islice(it, 0, self.size))
+    def to_ids(self):
+        """Get the IDs of the edges of the collection as a NumPy array.
+
+        The edges are not wrapped as :class:`PgxEdge` objects. This method requires NumPy.
+        """
+        return self._get_ids('long')
+
+    def _wrap(self, java_element: Any) -> PgxEdge:
+        return PgxEdge(self.graph, java_element)
 
     def __getitem__(self, idx: Union[slice, int]) -> Union[List[PgxEdge], PgxEdge]:
-        it = self._collection.iterator()
-        if isinstance(idx, slice):
-            return list(
-                PgxEdge(self.graph, item) for item in islice(it, idx.start, idx.stop, idx.step)
-            )
-        else:
-            return list(PgxEdge(self.graph, item) for item in islice(it, idx, idx + 1))[0]
+        return self._get_items(idx)
 
     def __hash__(self) -> NoReturn:
         raise TypeError(UNHASHABLE_TYPE.format(type_name=self.__class__))
@@ -319,6 +520,7 @@ class VertexSet(VertexCollection):
         :param k:   how many keys to extract
         """
         java_pgx_map = pgx_map._map
+        self._clear_snapshot()
         java_handler(self._collection.extractTopKFromMap, [java_pgx_map, k])
 
 
@@ -357,31 +559,32 @@ class ScalarCollection(PgxCollection):
     def __init__(self, java_scalar_collection) -> None:
         super().__init__(None, java_scalar_collection)
 
-    def __iter__(self) -> Iterable[Any]:
-        it = self._collection.iterator()
-        return (conversion.property_to_python(item, self.content_type, self.graph) for item in it)
+    def _wrap(self, java_element: Any) -> Any:
+        return conversion.property_to_python(java_element, self.content_type, self.graph)
 
     def add(self, items) -> None:
         """Add one or multiple elements to the collection.
 
-        :param items: An element of the predefined type. Can also be an iterable of the same type.
+        All the elements are sent to the server in a single request.
+
+        :param items: An element of the predefined type. Can also be an iterable of the same type,
+            e.g. a NumPy array.
         """
-        if not isinstance(items, Iterable):
+        if isinstance(items, str) or not isinstance(items, Iterable):
             items = [items]
-        for item in items:
-            java_value = conversion.property_to_java(item, self.content_type)
-            java_handler(self._collection.add, [java_value])
+        self.add_all_elements(items)
 
     def remove(self, items) -> None:
         """Remove one or multiple elements from the collection.
 
-        :param items: An element of the predefined type. Can also be an iterable of the same type.
+        All the elements are sent to the server in a single request.
+
+        :param items: An element of the predefined type. Can also be an iterable of the same type,
+            e.g. a NumPy array.
         """
-        if not isinstance(items, Iterable):
+        if isinstance(items, str) or not isinstance(items, Iterable):
             items = [items]
-        for item in items:
-            java_value = conversion.property_to_java(item, self.content_type)
-            java_handler(self._collection.remove, [java_value])
+        self.remove_all_elements(items)
 
     def contains(self, element) -> bool:
         """Check whether the element is in the collection."""
@@ -396,18 +599,8 @@ class ScalarSequence(ScalarCollection):
 
     _java_class = 'oracle.pgx.api.ScalarSequence'
 
-    def __getitem__(self, idx):
-        it = self._collection.iterator()
-        if isinstance(idx, slice):
-            return list(
-                conversion.property_to_python(item, self.content_type, self.graph)
-                for item in islice(it, idx.start, idx.stop, idx.step)
-            )
-        else:
-            return list(
-                conversion.property_to_python(item, self.content_type, self.graph)
-                for item in islice(it, idx, idx + 1)
-            )[0]
+    def __getitem__(self, idx: Union[slice, int]) -> Any:
+        return self._get_items(idx)
 
 
 class ScalarSet(ScalarCollection):
@@ -19,11 +19,22 @@ class PgxEntity:
 
     _java_class = 'oracle.pgx.api.PgxEntity'
 
+    # Many entities may be created at once, e.g. when iterating over a collection, so they don't
+    # have a __dict__ and only fetch their attributes from the server when first accessed.
+    __slots__ = ('_entity', '_type', 'graph')
+
     def __init__(self, graph: "PgxGraph", java_entity) -> None:
         self._entity = java_entity
-        self.type = java_entity.getType().toString()
+        self._type: Optional[str] = None
         self.graph = graph
 
+    @property
+    def type(self) -> str:
+        """Get the entity type, 'vertex' or 'edge'."""
+        if self._type is None:
+            self._type = java_handler(self._entity.getType, []).toString()
+        return self._type
+
     @property
     def id(self):
         """Get the entity id."""
@@ -85,12 +96,32 @@ class PgxVertex(PgxEntity):
 
     _java_class = 'oracle.pgx.api.PgxVertex'
 
+    __slots__ = ('_vertex', '_out_degree', '_in_degree')
+
     def __init__(self, graph: "PgxGraph", java_vertex) -> None:
         super().__init__(graph, java_vertex)
         self._vertex = java_vertex
-        self.out_degree = java_vertex.getOutDegree()
-        self.in_degree = java_vertex.getInDegree()
-        self.degree = self.out_degree
+        self._out_degree: Optional[int] = None
+        self._in_degree: Optional[int] = None
+
+    @property
+    def out_degree(self) -> int:
+        """Get the number of outgoing edges of this vertex."""
+        if self._out_degree is None:
+            self._out_degree = java_handler(self._vertex.getOutDegree, [])
+        return self._out_degree
+
+    @property
+    def in_degree(self) -> int:
+        """Get the number of incoming edges of this vertex."""
+        if self._in_degree is None:
+            self._in_degree = java_handler(self._vertex.getInDegree, [])
+        return self._in_degree
+
+    @property
+    def degree(self) -> int:
+        """Get the number of outgoing edges of this vertex, same as :attr:`out_degree`."""
+        return self.out_degree
 
     @property
     def labels(self) -> List[str]:
@@ -175,11 +206,27 @@ class PgxEdge(PgxEntity):
 
     _java_class = 'oracle.pgx.api.PgxEdge'
 
+    __slots__ = ('_edge', '_source', '_destination')
+
     def __init__(self, graph, java_edge) -> None:
         super().__init__(graph, java_edge)
         self._edge = java_edge
-        self.source = PgxVertex(graph, java_edge.getSource())
-        self.destination = PgxVertex(graph, java_edge.getDestination())
+        self._source: Optional[PgxVertex] = None
+        self._destination: Optional[PgxVertex] = None
+
+    @property
+    def source(self) -> PgxVertex:
+        """Get the source vertex of this edge."""
+        if self._source is None:
+            self._source = PgxVertex(self.graph, java_handler(self._edge.getSource, []))
+        return self._source
+
+    @property
+    def destination(self) -> PgxVertex:
+        """Get the destination vertex of this edge."""
+        if self._destination is None:
+            self._destination = PgxVertex(self.graph, java_handler(self._edge.getDestination, []))
+        return self._destination
 
     @property
     def vertices(self) -> Tuple[PgxVertex, PgxVertex]:
@@ -2,10 +2,13 @@
 # Copyright (C) 2013 - 2022 Oracle and/or its affiliates. All rights reserved.
 #
 
+import re
+import threading
+import weakref
 from collections.abc import Iterable
 from jnius import autoclass
 
-from pypgx._utils import conversion
+from pypgx._utils import columnar, conversion
 from pypgx.api._all_paths import AllPaths
 from pypgx.api._graph_alteration_builder import GraphAlterationBuilder
 from pypgx.api._graph_offloading import PreparedPgqlQuery, _apply_prepared_query_arguments
@@ -35,10 +38,14 @@ from pypgx.api._graph_meta_data import GraphMetaData
 from pypgx.api.auth import PgxResourcePermission
 from pypgx.api.filters import GraphFilter, EdgeFilter, VertexFilter
 from pypgx.api.redaction._redaction_rule_config import PgxRedactionRuleConfig
+from pypgx._utils.concurrency import with_async_methods
 from pypgx._utils.error_handling import java_handler
+from pypgx._utils.lazy import lazy_property, reset_lazy_properties
 from pypgx._utils.error_messages import (
     ARG_MUST_BE,
+    ENTITY_NOT_FOUND,
     INVALID_OPTION,
+    PROPERTY_NOT_FOUND,
     UNSUPPORTED_QUERY_TYPE,
     INVALID_FORMAT_HOMOGENEOUS,
     INVALID_FORMAT_PARTITIONED,
@@ -66,7 +73,7 @@ from pypgx._utils.pgx_types import (
     property_merge_strategies,
 )
 from pypgx.api.auth import PermissionEntity
-from typing import Any, Dict, List, Optional, Tuple, Union, Mapping, TYPE_CHECKING
+from typing import Any, Dict, Iterator, List, Optional, Tuple, Union, Mapping, TYPE_CHECKING
 
 if TYPE_CHECKING:
     # Don't import at runtime, to avoid circular imports.
@@ -75,6 +82,31 @@ if TYPE_CHECKING:
     from pypgx.api._graph_change_set import GraphChangeSet
 
 
+# The PgxGraph wrappers in use, by graph ID and session, so that wrapping the same graph again
+# reuses the wrapper and its caches. Entries go away with the last reference to their wrapper.
+_graph_wrappers: "weakref.WeakValueDictionary[Tuple[str, int], PgxGraph]" = (
+    weakref.WeakValueDictionary()
+)
+_graph_wrappers_lock = threading.Lock()
+
+# PGQL statements that may create, drop or alter properties.
+_DDL_STATEMENT_PATTERN = re.compile(r'\s*(ALTER|CREATE|DROP)\b', re.IGNORECASE)
+
+
+def _graph_wrapper_key(session: "PgxSession", java_graph) -> Tuple[str, int]:
+    # The wrapper references the session, so the session's id() is unique while the entry exists.
+    return java_handler(java_graph.getId, []).toString(), id(session)
+
+
+@with_async_methods(
+    'bipartite_sub_graph_from_in_degree', 'bipartite_sub_graph_from_left_set', 'clone',
+    'clone_and_execute_pgql', 'combine_edge_properties_into_vector_property',
+    'combine_vertex_properties_into_vector_property', 'create_all_paths', 'create_components',
+    'execute_pgql', 'expand_with_pgql', 'explain_pgql', 'fetch_vertex_table', 'filter',
+    'is_bipartite', 'publish', 'publish_with_snapshots', 'query_pgql', 'simplify',
+    'simplify_with_strategy', 'sort_by_degree', 'sparsify', 'store', 'transpose', 'undirect',
+    'undirect_with_strategy',
+)
 class PgxGraph(PgxContextManager):
     """A reference to a graph on the server side.
 
@@ -88,23 +120,120 @@ class PgxGraph(PgxContextManager):
     def __init__(self, session: "PgxSession", java_graph) -> None:
         self._update_variables(session, java_graph)
 
+    @classmethod
+    def _from_java(
+        cls, session: Optional["PgxSession"], java_graph, new_snapshot: bool = False
+    ) -> "PgxGraph":
+        """Return the wrapper of `java_graph` in `session`, reusing the existing one if any.
+
+        If `session` is None, the graph is attributed to the wrapper of its Java session.
+
+        :param new_snapshot: Whether `java_graph` may be a new snapshot of the graph, in which
+            case the caches of a reused wrapper are cleared
+        """
+        if session is None:
+            # need to import here to avoid import loop
+            from pypgx.api._pgx_session import PgxSession
+
+            session = PgxSession._from_java(java_handler(java_graph.getSession, []))
+        with _graph_wrappers_lock:
+            graph = _graph_wrappers.get(_graph_wrapper_key(session, java_graph))
+        if not isinstance(graph, cls) or graph.session is not session:
+            return cls(session, java_graph)
+        if new_snapshot:
+            graph._update_variables(session, java_graph)
+        return graph
+
     def _update_variables(self, session, java_graph):
         self._graph = java_graph
         self.session = session
-        self.name = java_graph.getName()
-        self.is_transient = java_graph.isTransient()
-        self.num_vertices = java_graph.getNumVertices()
-        self.num_edges = java_graph.getNumEdges()
-        self.memory_mb = java_graph.getMemoryMb()
-        self.data_source_version = java_graph.getDataSourceVersion()
-        self.is_directed = java_graph.isDirected()
-        self.creation_request_timestamp = java_graph.getCreationRequestTimestamp()
-        self.creation_timestamp = java_graph.getCreationTimestamp()
-        # vertex id type can be null in case of graph with no Ids strategy
-        if java_graph.getVertexIdType() is not None:
-            self.vertex_id_type = java_graph.getVertexIdType().toString()
-        self.vertex_id_strategy = java_graph.getVertexIdStrategy().toString()
-        self.edge_id_strategy = java_graph.getEdgeIdStrategy().toString()
+        # Property handles by (entity type, name), shared by everything that looks up properties
+        # of this graph by name. Cleared when the graph points to a new snapshot.
+        self._properties: Dict[Tuple[str, str], Union[VertexProperty, EdgeProperty]] = {}
+        # The attributes below are fetched when first read.
+        reset_lazy_properties(self)
+        key = _graph_wrapper_key(session, java_graph)
+        with _graph_wrappers_lock:
+            old_key = getattr(self, '_wrapper_key', None)
+            if old_key != key and _graph_wrappers.get(old_key) is self:
+                del _graph_wrappers[old_key]
+            _graph_wrappers[key] = self
+        self._wrapper_key = key
+
+    def refresh(self) -> None:
+        """Fetch the attributes of the graph again when they are next read, e.g. the number of
+        vertices after the graph was modified.
+        """
+        reset_lazy_properties(self)
+
+    def _refresh_after_statement(self, pgql_query: str) -> None:
+        """Refresh the cached attributes of the graph after a PGQL statement, which may have
+        modified it, and the cached property handles after statements that may change them.
+        """
+        self.refresh()
+        if _DDL_STATEMENT_PATTERN.match(pgql_query):
+            self.clear_property_cache()
+
+    @lazy_property
+    def name(self) -> str:
+        """Get the name of the graph."""
+        return self._graph.getName()
+
+    @lazy_property
+    def is_transient(self) -> bool:
+        """Whether the graph is transient."""
+        return self._graph.isTransient()
+
+    @lazy_property
+    def num_vertices(self) -> int:
+        """Get the number of vertices."""
+        return self._graph.getNumVertices()
+
+    @lazy_property
+    def num_edges(self) -> int:
+        """Get the number of edges."""
+        return self._graph.getNumEdges()
+
+    @lazy_property
+    def memory_mb(self) -> int:
+        """Get the amount of memory used by the graph, in megabytes."""
+        return self._graph.getMemoryMb()
+
+    @lazy_property
+    def data_source_version(self) -> str:
+        """Get the version of the data source the graph was loaded from."""
+        return self._graph.getDataSourceVersion()
+
+    @lazy_property
+    def is_directed(self) -> bool:
+        """Whether the graph is directed."""
+        return self._graph.isDirected()
+
+    @lazy_property
+    def creation_request_timestamp(self) -> int:
+        """Get the time the graph was requested, in milliseconds since the epoch."""
+        return self._graph.getCreationRequestTimestamp()
+
+    @lazy_property
+    def creation_timestamp(self) -> int:
+        """Get the time the graph was created, in milliseconds since the epoch."""
+        return self._graph.getCreationTimestamp()
+
+    @lazy_property
+    def vertex_id_type(self) -> Optional[str]:
+        """Get the type of the vertex IDs, or None if the graph has no vertex IDs."""
+        java_id_type = self._graph.getVertexIdType()
+        return java_id_type.toString() if java_id_type is not None else None
+
+    @lazy_property
+    def vertex_id_strategy(self) -> str:
+        """Get the vertex ID strategy."""
+        return self._graph.getVertexIdStrategy().toString()
+
+    @lazy_property
+    def edge_id_strategy(self) -> str:
+        """Get the edge ID strategy."""
+        return self._graph.getEdgeIdStrategy().toString()
 
     @property
     def pgx_instance(self) -> ServerInstance:
@@ -204,7 +333,7 @@ class PgxGraph(PgxContextManager):
         java_props = self._graph.getVertexProperties()
         props = []
         for prop in java_props:
-            props.append(VertexProperty(self, prop))
+            props.append(self._remember_property(VertexProperty(self, prop)))
         props.sort(key=lambda prop: prop.name)
         return props
 
@@ -216,29 +345,61 @@ class PgxGraph(PgxContextManager):
         java_props = self._graph.getEdgeProperties()
         props = []
         for prop in java_props:
-            props.append(EdgeProperty(self, prop))
+            props.append(self._remember_property(EdgeProperty(self, prop)))
         props.sort(key=lambda prop: prop.name)
         return props
 
     def get_vertex_property(self, name: str) -> Optional[VertexProperty]:
         """Get a vertex property by name.
 
+        The property handle is cached, so that looking up the same property again does not
+        involve the server.
+
         :param name: Property name
         """
-        prop = java_handler(self._graph.getVertexProperty, [name])
-        if prop:
-            return VertexProperty(self, prop)
-        return None
+        prop = self._properties.get(('vertex', name))
+        if prop is None:
+            java_prop = java_handler(self._graph.getVertexProperty, [name])
+            if not java_prop:
+                return None
+            prop = self._remember_property(VertexProperty(self, java_prop))
+        return prop
 
     def get_edge_property(self, name: str) -> Optional[EdgeProperty]:
         """Get an edge property by name.
 
+        The property handle is cached, so that looking up the same property again does not
+        involve the server.
+
         :param name: Property name
         """
-        prop = java_handler(self._graph.getEdgeProperty, [name])
-        if prop:
-            return EdgeProperty(self, prop)
-        return None
+        prop = self._properties.get(('edge', name))
+        if prop is None:
+            java_prop = java_handler(self._graph.getEdgeProperty, [name])
+            if not java_prop:
+                return None
+            prop = self._remember_property(EdgeProperty(self, java_prop))
+        return prop
+
+    def clear_property_cache(self) -> None:
+        """Forget the cached property handles of this graph.
+
+        Properties created, renamed or destroyed through this client are kept up to date in the
+        cache automatically. Call this method when properties of the graph were changed in some
+        other way, e.g. from another session.
+        """
+        self._properties.clear()
+
+    def _remember_property(
+        self, prop: Union[VertexProperty, EdgeProperty]
+    ) -> Union[VertexProperty, EdgeProperty]:
+        """Cache the handle of a property of this graph, and return it."""
+        self._properties[(prop._entity_kind, prop.name)] = prop
+        return prop
+
+    def _forget_property(self, entity_kind: str, name: str) -> None:
+        """Remove the handle of a property of this graph from the cache, if there is one."""
+        self._properties.pop((entity_kind, name), None)
 
     def create_scalar(self, data_type: str, name: Optional[str] = None) -> Scalar:
         """Create a new Scalar.
@@ -282,7 +443,7 @@ class PgxGraph(PgxContextManager):
                 INVALID_OPTION.format(var="data_type", opts=list(property_types.keys()))
             )
         prop = java_handler(self._graph.createVertexProperty, [property_types[data_type], name])
-        return VertexProperty(self, prop)
+        return self._remember_property(VertexProperty(self, prop))
 
     def create_vertex_vector_property(
         self, data_type: str, dim: int, name: Optional[str] = None
@@ -298,7 +459,7 @@ class PgxGraph(PgxContextManager):
         prop = java_handler(
             self._graph.createVertexVectorProperty, [property_types[data_type], dim, name]
         )
-        return VertexProperty(self, prop)
+        return self._remember_property(VertexProperty(self, prop))
 
     def get_or_create_vertex_vector_property(
         self, data_type: str, dim: int, name: Optional[str] = None
@@ -314,7 +475,7 @@ class PgxGraph(PgxContextManager):
         prop = java_handler(
             self._graph.getOrCreateVertexVectorProperty, [property_types[data_type], dim, name]
         )
-        return VertexProperty(self, prop)
+        return self._remember_property(VertexProperty(self, prop))
 
     def create_edge_property(self, data_type: str, name: Optional[str] = None) -> EdgeProperty:
         """Create a session-bound edge property.
@@ -327,7 +488,7 @@ class PgxGraph(PgxContextManager):
                 INVALID_OPTION.format(var="data_type", opts=list(property_types.keys()))
             )
         prop = java_handler(self._graph.createEdgeProperty, [property_types[data_type], name])
-        return EdgeProperty(self, prop)
+        return self._remember_property(EdgeProperty(self, prop))
 
     def get_or_create_edge_vector_property(
         self, data_type: str, dim: int, name: Optional[str] = None
@@ -345,7 +506,7 @@ class PgxGraph(PgxContextManager):
         prop = java_handler(
             self._graph.getOrCreateEdgeVectorProperty, [property_types[data_type], dim, name]
         )
-        return EdgeProperty(self, prop)
+        return self._remember_property(EdgeProperty(self, prop))
 
     def create_edge_vector_property(
         self, data_type: str, dim: int, name: Optional[str] = None
@@ -361,7 +522,7 @@ class PgxGraph(PgxContextManager):
         prop = java_handler(
             self._graph.createEdgeVectorProperty, [property_types[data_type], dim, name]
         )
-        return EdgeProperty(self, prop)
+        return self._remember_property(EdgeProperty(self, prop))
 
     def get_or_create_vertex_property(
         self, name: str, data_type: Optional[str] = None, dim: int = 0
@@ -427,7 +588,7 @@ class PgxGraph(PgxContextManager):
             self._graph.createComponents, [components._prop, num_components]
         )
         java_vertex_property = java_handler(java_partition.getComponentsProperty, [])
-        property = VertexProperty(self, java_vertex_property)
+        property = self._remember_property(VertexProperty(self, java_vertex_property))
 
         return PgxPartition(self, java_partition, property)
 
@@ -488,6 +649,7 @@ class PgxGraph(PgxContextManager):
 
     def close(self) -> None:
         """Destroy without waiting for completion."""
+        self._properties.clear()
         return java_handler(self._graph.close, [])
 
     def destroy_vertex_property_if_exists(self, name: str) -> None:
@@ -495,6 +657,7 @@ class PgxGraph(PgxContextManager):
 
         :param name: Property name
         """
+        self._forget_property('vertex', name)
         return java_handler(self._graph.destroyVertexPropertyIfExists, [name])
 
     def destroy_edge_property_if_exists(self, name: str) -> None:
@@ -502,6 +665,7 @@ class PgxGraph(PgxContextManager):
 
         :param name: Property name
         """
+        self._forget_property('edge', name)
         return java_handler(self._graph.destroyEdgePropertyIfExists, [name])
 
     @property
@@ -541,6 +705,162 @@ class PgxGraph(PgxContextManager):
             raise TypeError(ARG_MUST_BE.format(arg="filter_expr", type=EdgeFilter.__name__))
         return EdgeSet(self, java_handler(self._graph.getEdges, [filter_expr._filter, name]))
 
+    def fetch_vertex_table(
+        self,
+        ids: Optional["Iterable[Union[PgxVertex, int, str]]"] = None,
+        properties: Optional[List[Union[VertexProperty, str]]] = None,
+        include_labels: bool = True,
+        include_degrees: bool = True,
+        format: str = 'pandas',
+    ) -> Any:
+        """Fetch the IDs, properties, labels and degrees of many vertices as a table.
+
+        All scalar property values, the labels and the degrees are read with a single PGQL query
+        and transferred column by column, see :meth:`PgqlResultSet.to_pandas` and
+        :meth:`PgqlResultSet.to_arrow`. Values of vector properties are read vertex by vertex.
+
+        The table has the columns 'id', one column per property (named after the property),
+        'labels' (if the graph has vertex labels and `include_labels` is True) and 'out_degree'
+        and 'in_degree' (if `include_degrees` is True).
+
+        This method requires pandas or pyarrow, depending on `format`.
+
+        :param ids: The vertices (or their IDs) to fetch, in the order of the rows of the table.
+            If None, all vertices are fetched, in no particular order.
+        :param properties: The vertex properties (or their names) to fetch. If None, all vertex
+            properties are fetched.
+        :param include_labels: Whether to fetch the labels of the vertices
+        :param include_degrees: Whether to fetch the out- and in-degrees of the vertices
+        :param format: 'pandas' for a pandas DataFrame, or 'arrow' for a pyarrow Table
+        :return: The table
+        """
+        if format not in ('pandas', 'arrow'):
+            raise ValueError(INVALID_OPTION.format(var='format', opts=['pandas', 'arrow']))
+        if format == 'pandas':
+            columnar.import_pandas()
+        else:
+            columnar.import_pyarrow()
+
+        if properties is None:
+            props = self.get_vertex_properties()
+        else:
+            props = []
+            for prop in properties:
+                if isinstance(prop, str):
+                    name = prop
+                    prop = self.get_vertex_property(name)
+                    if prop is None:
+                        raise LookupError(PROPERTY_NOT_FOUND.format(prop=name))
+                elif not isinstance(prop, VertexProperty):
+                    raise TypeError(
+                        ARG_MUST_BE.format(arg='properties', type='list of VertexProperty or str')
+                    )
+                props.append(prop)
+        queried_props = [prop for prop in props if prop._is_queryable()]
+        include_labels = include_labels and self.has_vertex_labels()
+
+        select = ['ID(N)']
+        select.extend('N.' + conversion.to_pgql_identifier(prop.name) for prop in queried_props)
+        if include_labels:
+            select.append('LABELS(N)')
+        if include_degrees:
+            select.extend(['OUT_DEGREE(N)', 'IN_DEGREE(N)'])
+        query = 'SELECT {} MATCH (N)'.format(', '.join(select))
+
+        if ids is None:
+            result_set = self.query_pgql(query)
+            try:
+                columns = result_set._get_all_columns(list(range(len(select))))
+                col_types = [result_set._col_types[idx] for idx in range(len(select))]
+            finally:
+                result_set.close()
+            ids = columns[0]
+        else:
+            ids = [vid.id if isinstance(vid, PgxVertex) else vid for vid in columnar.to_list(ids)]
+            columns, col_types = self._fetch_entity_rows(query + ' WHERE ID(N) IN ?', ids, select)
+
+        values = {}
+        for prop, column, col_type in zip(queried_props, columns[1:], col_types[1:]):
+            values[prop.name] = (column, col_type)
+        for prop in props:
+            if not prop._is_queryable():
+                values[prop.name] = ([prop.get(vid) for vid in ids], None)
+
+        names = ['id'] + [prop.name for prop in props]
+        table = [(columns[0], col_types[0])] + [values[prop.name] for prop in props]
+        if include_labels:
+            names.append('labels')
+            table.append((columns[len(queried_props) + 1], col_types[len(queried_props) + 1]))
+        if include_degrees:
+            names.extend(['out_degree', 'in_degree'])
+            table.extend(zip(columns[-2:], col_types[-2:]))
+
+        if format == 'arrow':
+            pa = columnar.import_pyarrow()
+            arrays = [
+                pa.array(column) if col_type is None
+                else columnar.column_to_arrow(column, col_type, self)
+                for column, col_type in table
+            ]
+            return pa.Table.from_arrays(arrays, names=names)
+        pd = columnar.import_pandas()
+        frame = pd.DataFrame(
+            {
+                idx: columnar.object_array(column) if col_type is None
+                else columnar.column_to_pandas(column, col_type, self)
+                for idx, (column, col_type) in enumerate(table)
+            }
+        )
+        frame.columns = names
+        return frame
+
+    def _fetch_entity_rows(
+        self, query: str, ids: List[Any], select: List[str], entity_type: str = 'vertex'
+    ) -> Tuple[List[List[Any]], List[str]]:
+        """Run a query that selects `select` for the vertices (or edges) whose ID is in the list
+        bound to its parameter, and return the columns in the order of `ids`, and the column types.
+        """
+        statement = self.prepare_pgql(query)
+        try:
+            statement.set_array(1, list(set(ids)))
+            result_set = statement.execute_query()
+            columns = result_set._get_all_columns(list(range(len(select))))
+            col_types = [result_set._col_types[idx] for idx in range(len(select))]
+        finally:
+            statement.close()
+
+        positions = {entity_id: idx for idx, entity_id in enumerate(columns[0])}
+        rows = []
+        for entity_id in ids:
+            if entity_id not in positions:
+                raise LookupError(ENTITY_NOT_FOUND.format(entity_type=entity_type, id=entity_id))
+            rows.append(positions[entity_id])
+        return [[column[row] for row in rows] for column in columns], col_types
+
+    def _get_java_entities(self, keys: List[Any], entity_type: str) -> List[Any]:
+        """Return the Java vertices (or edges) of `keys`, which are PgxVertex (PgxEdge) objects or
+        IDs.
+
+        The entities given by their ID are looked up with a single PGQL query, instead of one
+        getVertex() or getEdge() request per ID.
+        """
+        ids = [key for key in keys if isinstance(key, (int, str))]
+        java_entities: Iterator[Any] = iter(())
+        if len(ids) > 0:
+            pattern = '(N)' if entity_type == 'vertex' else '()-[N]->()'
+            columns, _ = self._fetch_entity_rows(
+                'SELECT ID(N), N MATCH {} WHERE ID(N) IN ?'.format(pattern),
+                ids,
+                ['ID(N)', 'N'],
+                entity_type,
+            )
+            java_entities = iter(columns[1])
+        return [
+            next(java_entities) if isinstance(key, (int, str))
+            else conversion.property_to_java(key, entity_type)
+            for key in keys
+        ]
+
     def create_vertex_set(self, name: Optional[str] = None) -> VertexSet:
         """Create a new vertex set.
 
@@ -548,6 +868,20 @@ class PgxGraph(PgxContextManager):
         """
         return VertexSet(self, java_handler(self._graph.createVertexSet, [name]))
 
+    def create_vertex_set_from_ids(
+        self, ids: "Iterable[Union[PgxVertex, int, str]]", name: Optional[str] = None
+    ) -> VertexSet:
+        """Create a new vertex set containing the given vertices.
+
+        The number of requests to the server does not depend on the number of vertices.
+
+        :param ids: The vertices or their IDs, e.g. a NumPy array of IDs
+        :param name:  Set name
+        """
+        vertex_set = self.create_vertex_set(name)
+        vertex_set.add_all(ids)
+        return vertex_set
+
     def create_vertex_sequence(self, name: Optional[str] = None) -> VertexSequence:
         """Create a new vertex sequence.
 
@@ -1065,7 +1399,7 @@ class PgxGraph(PgxContextManager):
                 )
             props.add(prop._prop)
         vprop = java_handler(self._graph.combineVertexPropertiesIntoVectorProperty, [props, name])
-        return VertexProperty(self, vprop)
+        return self._remember_property(VertexProperty(self, vprop))
 
     def combine_edge_properties_into_vector_property(
         self, properties: List[Union[EdgeProperty, str]], name: Optional[str] = None
@@ -1088,7 +1422,7 @@ class PgxGraph(PgxContextManager):
                 )
             props.add(prop._prop)
         vprop = java_handler(self._graph.combineEdgePropertiesIntoVectorProperty, [props, name])
-        return EdgeProperty(self, vprop)
+        return self._remember_property(EdgeProperty(self, vprop))
 
     def get_collections(self) -> Dict[str, PgxCollection]:
         """Retrieve all currently allocated collections associated with the graph."""
@@ -1181,7 +1515,7 @@ class PgxGraph(PgxContextManager):
         from pypgx.api._prepared_statement import PreparedStatement
 
         java_prepared_statement = java_handler(self._graph.preparePgql, [pgql_query])
-        return PreparedStatement(java_prepared_statement)
+        return PreparedStatement(java_prepared_statement, self.session)
 
     def execute_pgql(self, pgql_query: str) -> Optional[PgqlResultSet]:
         """(BETA) Blocking version of cloneAndExecutePgqlAsync(String).
@@ -1198,11 +1532,11 @@ class PgxGraph(PgxContextManager):
         :return: The query result set as PgqlResultSet object
         """
         java_pgql_result_set = java_handler(self._graph.executePgql, [pgql_query])
-        graph = PgxGraph(self, self._graph)
+        self._refresh_after_statement(pgql_query)
 
         if java_pgql_result_set is None:
             return None
-        return PgqlResultSet(graph, java_pgql_result_set)
+        return PgqlResultSet(self, java_pgql_result_set)
 
     def explain_pgql(self, pgql_query: str) -> Operation:
         """Explain the execution plan of a pattern matching query.
@@ -1227,7 +1561,7 @@ class PgxGraph(PgxContextManager):
             The actual exception will be nested.
         """
         java_graph = java_handler(self._graph.cloneAndExecutePgql, [pgql_query])
-        return PgxGraph(self, java_graph)
+        return PgxGraph(self.session, java_graph)
 
     def expand_with_pgql(
         self,
@@ -1374,6 +1708,7 @@ class PgxGraph(PgxContextManager):
             same argument), they will ALL become invalid after calling this method;
             therefore, subsequent operations on ANY of them will result in an exception.
         """
+        self._properties.clear()
         java_handler(self._graph.destroy, [])
 
     def is_pinned(self) -> bool:
@@ -1438,7 +1773,8 @@ class PgxGraph(PgxContextManager):
                 )
             t = on_invalid_change_types[invalid_change_policy]
             return Synchronizer(
-                java_handler(self._graph.createSynchronizer, [synchronizer_class, connection, t])
+                java_handler(self._graph.createSynchronizer, [synchronizer_class, connection, t]),
+                self.session,
             )
         if connection is None and invalid_change_policy is not None:
             raise ValueError(
@@ -1446,9 +1782,12 @@ class PgxGraph(PgxContextManager):
             )
         if connection is not None:
             return Synchronizer(
-                java_handler(self._graph.createSynchronizer, [synchronizer_class, connection])
+                java_handler(self._graph.createSynchronizer, [synchronizer_class, connection]),
+                self.session,
             )
-        return Synchronizer(java_handler(self._graph.createSynchronizer, [synchronizer_class]))
+        return Synchronizer(
+            java_handler(self._graph.createSynchronizer, [synchronizer_class]), self.session
+        )
 
     def alter_graph(self) -> GraphAlterationBuilder:
         """Create a graph alteration builder to define the graph schema alterations to perform on
@@ -1456,7 +1795,7 @@ class PgxGraph(PgxContextManager):
 
         :return: an empty graph alteration builder
         """
-        return GraphAlterationBuilder(java_handler(self._graph.alterGraph, []))
+        return GraphAlterationBuilder(java_handler(self._graph.alterGraph, []), self.session)
 
     def get_redaction_rules(
         self, authorization_type: str, name: str
@@ -1597,4 +1936,4 @@ class BipartiteGraph(PgxGraph):
     def get_is_left_property(self) -> VertexProperty:
         """Get the 'is Left' vertex property of the graph."""
         is_left_prop = java_handler(self._graph.getIsLeftProperty, [])
-        return VertexProperty(self, is_left_prop)
+        return self._remember_property(VertexProperty(self, is_left_prop))
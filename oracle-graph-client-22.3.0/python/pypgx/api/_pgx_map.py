@@ -2,11 +2,26 @@
 # Copyright (C) 2013 - 2022 Oracle and/or its affiliates. All rights reserved.
 #
 
-from typing import Any, Iterator, Optional, TYPE_CHECKING
+from collections.abc import Mapping
+from itertools import islice
+from typing import (
+    Any,
+    Callable,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Tuple,
+    TYPE_CHECKING,
+    Union,
+)
 
+from pypgx.api._pgql_result_set import DEFAULT_BATCH_SIZE
 from pypgx.api._pgx_context_manager import PgxContextManager
 from pypgx._utils.error_handling import java_handler
-from pypgx._utils import conversion
+from pypgx._utils.lazy import lazy_property, reset_lazy_properties
+from pypgx._utils.error_messages import ARG_MUST_BE
+from pypgx._utils import columnar, conversion
 
 if TYPE_CHECKING:
     # Don't import at runtime, to avoid circular imports.
@@ -20,11 +35,31 @@ class PgxMap(PgxContextManager):
 
     def __init__(self, graph: Optional["PgxGraph"], java_map) -> None:
         self._map = java_map
-        self.name = java_map.getName()
-        self.key_type = java_map.getKeyType().toString()
-        self.value_type = java_map.getValueType().toString()
         self.graph = graph
-        self.session_id = java_handler(self._map.getSessionId, [])
+
+    def refresh(self) -> None:
+        """Fetch the attributes of the map again when they are next read."""
+        reset_lazy_properties(self)
+
+    @lazy_property
+    def name(self) -> str:
+        """Get the name of the map."""
+        return self._map.getName()
+
+    @lazy_property
+    def key_type(self) -> str:
+        """Get the type of the keys."""
+        return self._map.getKeyType().toString()
+
+    @lazy_property
+    def value_type(self) -> str:
+        """Get the type of the values."""
+        return self._map.getValueType().toString()
+
+    @lazy_property
+    def session_id(self) -> str:
+        """Get the ID of the session the map belongs to."""
+        return java_handler(self._map.getSessionId, [])
 
     @property
     def size(self) -> int:
@@ -75,12 +110,120 @@ class PgxMap(PgxContextManager):
         """Return a key set."""
         return list(self)
 
-    def entries(self) -> dict:
-        """Return an entry set."""
-        map_dict = {}
-        for key in self:
-            map_dict[key] = self.get(key)
-        return map_dict
+    def entries(self, page_size: Optional[int] = None) -> Union[dict, Iterator[dict]]:
+        """Return an entry set.
+
+        The entries are streamed from the server, instead of getting the value of each key
+        separately.
+
+        :param page_size: If None, return a dict of all the entries. Otherwise, return an
+            iterator over dicts of at most `page_size` entries, so that the entries are fetched
+            page by page while iterating.
+        """
+        if page_size is None:
+            return dict(self._iter_entries())
+        if page_size < 1:
+            raise ValueError(ARG_MUST_BE.format(arg='page_size', type='a positive integer'))
+        return self._iter_entry_pages(page_size)
+
+    def _iter_entries(self) -> Iterator[Tuple[Any, Any]]:
+        for entry in self._map.entries().iterator():
+            key = conversion.property_to_python(entry.getKey(), self.key_type, self.graph)
+            value = conversion.property_to_python(entry.getValue(), self.value_type, self.graph)
+            yield key, value
+
+    def _iter_entry_pages(self, page_size: int) -> Iterator[dict]:
+        entries = self._iter_entries()
+        while True:
+            page = dict(islice(entries, page_size))
+            if not page:
+                return
+            yield page
+
+    def put_all(self, entries: Union[Mapping, Tuple[Iterable[Any], Iterable[Any]]]) -> None:
+        """Set the values of multiple keys.
+
+        Vertices and edges given by their ID are looked up with a single query. The requests are
+        sent to the server without waiting for each other, in batches.
+
+        :param entries: A dict, or a (keys, values) tuple of sequences of the same length, e.g.
+            NumPy arrays
+        """
+        if isinstance(entries, Mapping):
+            keys = columnar.to_list(list(entries.keys()))
+            values = columnar.to_list(list(entries.values()))
+        elif isinstance(entries, tuple) and len(entries) == 2:
+            keys = columnar.to_list(entries[0])
+            values = columnar.to_list(entries[1])
+        else:
+            raise TypeError(ARG_MUST_BE.format(arg='entries', type='dict or (keys, values) tuple'))
+        if len(keys) != len(values):
+            raise ValueError(ARG_MUST_BE.format(arg='values', type="a sequence as long as 'keys'"))
+        java_keys = self._to_java_values(keys, self.key_type)
+        java_values = self._to_java_values(values, self.value_type)
+        java_args = ([key, value] for key, value in zip(java_keys, java_values))
+        self._call_batched(self._map.putAsync, java_args)
+
+    def get_all(self, keys: Iterable[Any]) -> List[Any]:
+        """Get the values of multiple keys.
+
+        Vertices and edges given by their ID are looked up with a single query. The requests are
+        sent to the server without waiting for each other, in batches.
+
+        :param keys: The keys, e.g. a NumPy array
+        :returns: The value of each key, in the order of `keys`. None for keys that are not in
+            the map.
+        """
+        java_keys = self._to_java_values(columnar.to_list(keys), self.key_type)
+        values = self._call_batched(self._map.getAsync, ([key] for key in java_keys))
+        return [
+            conversion.property_to_python(value, self.value_type, self.graph) for value in values
+        ]
+
+    def _to_java_values(self, values: List[Any], type_name: str) -> List[Any]:
+        """Convert keys or values to Java. Vertices and edges given by their ID are looked up
+        with a single PGQL query, see :meth:`PgxGraph._get_java_entities`.
+        """
+        if type_name in ('vertex', 'edge'):
+            return self.graph._get_java_entities(values, type_name)
+        return [conversion.property_to_java(value, type_name) for value in values]
+
+    def _call_batched(self, method: Callable, java_args: Iterator[List[Any]]) -> List[Any]:
+        """Call the asynchronous Java `method` once per argument list, with up to
+        DEFAULT_BATCH_SIZE requests in flight, and return the results in order.
+        """
+        results = []
+        while True:
+            futures = [java_handler(method, args) for args in islice(java_args, DEFAULT_BATCH_SIZE)]
+            if not futures:
+                return results
+            results.extend(java_handler(future.get, []) for future in futures)
+
+    def to_numpy(self) -> Tuple[Any, Any]:
+        """Get the keys and the values of the map as two NumPy arrays.
+
+        Vertices and edges are represented by their IDs. Numeric and boolean keys and values
+        become arrays of the matching dtype, see :meth:`PgqlResultSet.to_numpy`. This method
+        requires NumPy.
+
+        :returns: A (keys, values) tuple of arrays of the same length, in no particular order
+        """
+        columnar.import_numpy()
+        keys = []
+        values = []
+        for entry in self._map.entries().iterator():
+            keys.append(entry.getKey())
+            values.append(entry.getValue())
+        return self._to_numpy(keys, self.key_type), self._to_numpy(values, self.value_type)
+
+    def _to_numpy(self, values: List[Any], type_name: str) -> Any:
+        if type_name in ('vertex', 'edge'):
+            ids = [None if value is None else value.getId() for value in values]
+            if type_name == 'vertex':
+                id_type = getattr(self.graph, 'vertex_id_type', None) or 'long'
+                return columnar.column_to_numpy(ids, id_type)
+            return columnar.column_to_numpy(ids, 'long')
+        return columnar.column_to_numpy(values, columnar.column_type(type_name), self.graph)
 
     def destroy(self) -> None:
         """Destroy this map."""
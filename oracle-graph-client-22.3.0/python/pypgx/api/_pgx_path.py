@@ -2,11 +2,13 @@
 # Copyright (C) 2013 - 2022 Oracle and/or its affiliates. All rights reserved.
 #
 
-from itertools import islice, zip_longest
+from itertools import islice
 from pypgx.api._pgx_entity import PgxEdge, PgxVertex
 from pypgx.api._pgx_context_manager import PgxContextManager
+from pypgx._utils import columnar
 from pypgx._utils.error_handling import java_handler
-from typing import List, Optional, Tuple, Iterator, Union, TYPE_CHECKING
+from pypgx._utils.error_messages import INDEX_OUT_OF_BOUNDS
+from typing import Any, List, Optional, Tuple, Iterator, Union, TYPE_CHECKING
 
 if TYPE_CHECKING:
     # Don't import at runtime, to avoid circular imports.
@@ -14,55 +16,113 @@ if TYPE_CHECKING:
 
 
 class PgxPath(PgxContextManager):
-    """A path from a source to a destination vertex in a :class:`PgxGraph`."""
+    """A path from a source to a destination vertex in a :class:`PgxGraph`.
+
+    The vertices and edges of the path are fetched once, when first accessed, and only wrapped as
+    :class:`PgxVertex` and :class:`PgxEdge` objects when returned.
+    """
 
     _java_class = 'oracle.pgx.api.PgxPath'
 
     def __init__(self, graph: "PgxGraph", java_path) -> None:
         self._path = java_path
         self.exists = java_path.exists()
-        src = java_path.getSource()
-        self.source = PgxVertex(graph, src) if src is not None else None
-        dst = java_path.getDestination()
-        self.destination = PgxVertex(graph, dst) if dst is not None else None
         self.cost = java_path.getPathLengthWithCost()
         self.hops = java_path.getPathLengthWithHop()
         self.graph = graph
+        self._source: Optional[PgxVertex] = None
+        self._destination: Optional[PgxVertex] = None
+        self._java_vertices: Optional[List[Any]] = None
+        self._java_edges: Optional[List[Any]] = None
+
+    @property
+    def source(self) -> Optional[PgxVertex]:
+        """Return the source vertex of the path."""
+        if self._source is None:
+            src = java_handler(self._path.getSource, [])
+            self._source = PgxVertex(self.graph, src) if src is not None else None
+        return self._source
+
+    @property
+    def destination(self) -> Optional[PgxVertex]:
+        """Return the destination vertex of the path."""
+        if self._destination is None:
+            dst = java_handler(self._path.getDestination, [])
+            self._destination = PgxVertex(self.graph, dst) if dst is not None else None
+        return self._destination
+
+    def _get_java_vertices(self) -> List[Any]:
+        if self._java_vertices is None:
+            it = self._path.getVertices().iterator()
+            self._java_vertices = list(islice(it, 0, None))
+        return self._java_vertices
+
+    def _get_java_edges(self) -> List[Any]:
+        if self._java_edges is None:
+            it = self._path.getEdges().iterator()
+            self._java_edges = list(islice(it, 0, None))
+        return self._java_edges
 
     @property
     def vertices(self) -> List[PgxVertex]:
         """Return a list of vertices in the path."""
-        it = self._path.getVertices().iterator()
-        return list(PgxVertex(self.graph, item) for item in islice(it, 0, None))
+        return [PgxVertex(self.graph, item) for item in self._get_java_vertices()]
 
     @property
     def edges(self) -> List[PgxEdge]:
         """Return a list of edges in the path."""
-        it = self._path.getEdges().iterator()
-        return list(PgxEdge(self.graph, item) for item in islice(it, 0, None))
+        return [PgxEdge(self.graph, item) for item in self._get_java_edges()]
 
     @property
     def path(self) -> List[Tuple[PgxVertex, Optional[PgxEdge]]]:
         """Return path as a list of (vertex,edge) tuples."""
-        return list(zip_longest(self.vertices, self.edges))
+        return list(self)
+
+    def to_ids(self) -> Tuple[Any, Any]:
+        """Return the IDs of the vertices and of the edges of the path as NumPy arrays.
+
+        The vertices and edges are not wrapped as :class:`PgxVertex` and :class:`PgxEdge`
+        objects. This method requires NumPy.
+
+        :returns: A (vertex IDs, edge IDs) tuple of arrays
+        """
+        columnar.import_numpy()
+        vertex_ids = [item.getId() for item in self._get_java_vertices()]
+        edge_ids = [item.getId() for item in self._get_java_edges()]
+        id_type = getattr(self.graph, 'vertex_id_type', None) or 'long'
+        return (
+            columnar.column_to_numpy(vertex_ids, id_type),
+            columnar.column_to_numpy(edge_ids, 'long'),
+        )
 
     def destroy(self) -> None:
         """Destroy this path."""
         java_handler(self._path.destroy, [])
 
+    def _get_hop(self, idx: int) -> Tuple[PgxVertex, Optional[PgxEdge]]:
+        """Return the `idx`-th vertex of the path, and the edge leaving it (if any)."""
+        java_edges = self._get_java_edges()
+        vertex = PgxVertex(self.graph, self._get_java_vertices()[idx])
+        edge = PgxEdge(self.graph, java_edges[idx]) if idx < len(java_edges) else None
+        return vertex, edge
+
     def __len__(self) -> int:
         return self.hops
 
     def __iter__(self) -> Iterator[Tuple[PgxVertex, Optional[PgxEdge]]]:
-        return islice(self.path, 0, None)
+        return (self._get_hop(idx) for idx in range(len(self._get_java_vertices())))
 
     def __getitem__(
         self, idx: Union[slice, int]
     ) -> Union[List[Tuple[PgxVertex, Optional[PgxEdge]]], Tuple[PgxVertex, Optional[PgxEdge]]]:
+        num_vertices = len(self._get_java_vertices())
         if isinstance(idx, slice):
-            return list(islice(self, idx.start, idx.stop, idx.step))
-        else:
-            return list(islice(self, idx, idx + 1))[0]
+            return [self._get_hop(i) for i in range(*idx.indices(num_vertices))]
+        if idx < 0:
+            idx += num_vertices
+        if not 0 <= idx < num_vertices:
+            raise IndexError(INDEX_OUT_OF_BOUNDS.format(idx='idx', max_idx=num_vertices - 1))
+        return self._get_hop(idx)
 
     def __repr__(self) -> str:
         return "{}(graph: {}, src: {}, dst: {}, num. edges: {} cost: {})".format(
@@ -6,6 +6,9 @@ import datetime
 import json
 import pathlib
 import collections.abc
+import threading
+import time
+import weakref
 
 from jnius import autoclass, cast
 
@@ -15,7 +18,7 @@ from pypgx.api._graph_builder import GraphBuilder
 from pypgx.api._graph_offloading import PreparedPgqlQuery, _apply_prepared_query_arguments
 from pypgx.api._pgx_collection import ScalarSequence, ScalarSet
 from pypgx.api.frames._pgx_frame import PgxFrame
-from pypgx.api.frames._pgx_frame_builder import PgxFrameBuilder
+from pypgx.api.frames._pgx_frame_builder import DEFAULT_UPLOAD_CHUNK_SIZE, PgxFrameBuilder
 from pypgx.api.frames._pgx_frame_reader import PgxGenericFrameReader
 from pypgx.api.frames._vertex_frame_declaration import VertexFrameDeclaration
 from pypgx.api.frames._edge_frame_declaration import EdgeFrameDeclaration
@@ -30,6 +33,7 @@ from pypgx.api._session_context import SessionContext
 from pypgx.api._graph_config import GraphConfig
 from pypgx.api._graph_meta_data import GraphMetaData
 from pypgx._utils.error_handling import java_handler
+from pypgx._utils.lazy import lazy_property, reset_lazy_properties
 from pypgx._utils.error_messages import (
     INVALID_OPTION,
     VALID_CONFIG_ARG,
@@ -37,7 +41,7 @@ from pypgx._utils.error_messages import (
     VALID_PATH_OR_LIST_OF_PATHS,
     UNSUPPORTED_QUERY_TYPE,
 )
-from pypgx._utils import conversion
+from pypgx._utils import concurrency, conversion
 from pypgx._utils.pgx_types import (
     format_types,
     source_types,
@@ -49,7 +53,18 @@ from pypgx._utils.pgx_types import (
 from pypgx.api.frames._pgx_data_types import _get_data_type
 from pypgx._utils.error_messages import UNHASHABLE_TYPE, ARG_MUST_BE, ARG_MUST_BE_REASON
 from pypgx.api._namespace import Namespace
-from typing import Dict, Iterable, List, Optional, Set, Tuple, Union, Any, NoReturn
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    List,
+    NoReturn,
+    Optional,
+    Set,
+    Tuple,
+    Union,
+)
 
 # Read the static final variable LATEST_SNAPSHOT from the corresponding java class
 
@@ -58,6 +73,12 @@ _LATEST_SNAPSHOT = _PgxSession_class.LATEST_SNAPSHOT
 
 _ColumnDescriptor = autoclass('oracle.pgx.api.frames.schema.ColumnDescriptor')
 
+# The wrappers of the sessions created or looked up through the API, by session ID, so that a Java
+# session reached without its wrapper, e.g. the session of the graph of a PreparedStatement created
+# directly, gets the same wrapper. Entries go away with their wrapper.
+_session_wrappers: "weakref.WeakValueDictionary[str, PgxSession]" = weakref.WeakValueDictionary()
+_session_wrappers_lock = threading.Lock()
+
 
 class PgxSession(PgxContextManager):
     """A PGX session represents an active user connected to a ServerInstance.
@@ -76,13 +97,57 @@ class PgxSession(PgxContextManager):
 
     def __init__(self, java_session) -> None:
         self._session = java_session
-        self.id = java_session.getName()
-        self.source = java_session.getSource()
-        self.idle_timeout = java_session.getIdleTimeout()
-        self.task_timeout = java_session.getTaskTimeout()
-        java_analyst = java_session.createAnalyst()
-        self.analyst = Analyst(self, java_analyst)
-        self.context = SessionContext(java_session.getSessionContext())
+
+    @classmethod
+    def _from_java(cls, java_session) -> "PgxSession":
+        """Return a wrapper of `java_session`, reusing the one returned before if it is alive."""
+        session_id = java_handler(java_session.getId, [])
+        with _session_wrappers_lock:
+            session = _session_wrappers.get(session_id)
+            if session is None:
+                session = cls(java_session)
+                _session_wrappers[session_id] = session
+        return session
+
+    def refresh(self) -> None:
+        """Fetch the attributes of the session again when they are next read.
+
+        The analyst of the session is kept.
+        """
+        analyst = self.__dict__.get('analyst')
+        reset_lazy_properties(self)
+        if analyst is not None:
+            self.analyst = analyst
+
+    @lazy_property
+    def id(self) -> str:
+        """Get the ID of the session."""
+        return self._session.getName()
+
+    @lazy_property
+    def source(self) -> str:
+        """Get the descriptive string identifying the client of the session."""
+        return self._session.getSource()
+
+    @lazy_property
+    def idle_timeout(self) -> Optional[int]:
+        """Get the idle timeout of the session."""
+        return self._session.getIdleTimeout()
+
+    @lazy_property
+    def task_timeout(self) -> Optional[int]:
+        """Get the task timeout of the session."""
+        return self._session.getTaskTimeout()
+
+    @lazy_property
+    def analyst(self) -> Analyst:
+        """Get the analyst of the session, created when first used."""
+        return self.create_analyst()
+
+    @lazy_property
+    def context(self) -> SessionContext:
+        """Get the context describing the session."""
+        return SessionContext(self._session.getSessionContext())
 
     LATEST_SNAPSHOT = _LATEST_SNAPSHOT
 
@@ -138,7 +203,7 @@ class PgxSession(PgxContextManager):
             graph = java_handler(self._session.getGraph, [namespace.get_java_namespace(), name])
         if graph is None:
             return None
-        return PgxGraph(self, graph)
+        return PgxGraph._from_java(self, graph)
 
     def get_graphs(self, namespace: Optional[Namespace] = None) -> List[str]:
         """Return a collection of graph names accessible under the given namespace.
@@ -275,17 +340,32 @@ class PgxSession(PgxContextManager):
             self._session.createFrameBuilder,
             [java_column_descriptors],
         )
-        return PgxFrameBuilder(java_builder)
+        return PgxFrameBuilder(java_builder, schema)
 
-    def pandas_to_pgx_frame(self, pandas_dataframe, frame_name: str) -> PgxFrame:
+    def pandas_to_pgx_frame(
+        self,
+        pandas_dataframe,
+        frame_name: str,
+        chunk_size: int = DEFAULT_UPLOAD_CHUNK_SIZE,
+        num_threads: int = 1,
+        progress_callback: Optional[Callable[[int, int, float], None]] = None,
+    ) -> PgxFrame:
         """Create a frame from a pandas dataframe.
 
         Duplicate columns will be renamed. Mixed column types are not supported.
 
+        The rows are uploaded in chunks of `chunk_size` rows. With more than one thread, the next
+        chunks are converted to Java while the current one is being uploaded.
+
         This method requires pandas.
 
         :param pandas_dataframe: The Pandas dataframe to use
         :param frame_name: Name of the frame
+        :param chunk_size: The number of rows uploaded at once
+        :param num_threads: The number of chunks converted at the same time, on the shared worker
+            threads
+        :param progress_callback: A function called after each chunk with the number of rows
+            uploaded so far, the total number of rows and the throughput in rows per second
         :return: the frame created
         """
         # Mixed columns will throw an error on the Java side when validating the columns
@@ -297,72 +377,54 @@ class PgxSession(PgxContextManager):
             raise TypeError(ARG_MUST_BE.format(arg='pandas_dataframe', type=pd.DataFrame))
         if not isinstance(frame_name, str):
             raise TypeError(ARG_MUST_BE.format(arg='frame_name', type=str))
+        if not isinstance(chunk_size, int) or chunk_size < 1:
+            raise ValueError(ARG_MUST_BE.format(arg='chunk_size', type='a positive integer'))
+        if not isinstance(num_threads, int) or num_threads < 1:
+            raise ValueError(ARG_MUST_BE.format(arg='num_threads', type='a positive integer'))
         schema = []
-        data = {}
+        columns = []
         column_name_counts = {}
-        for name, col in pandas_dataframe.iteritems():
+        for name, col in pandas_dataframe.items():
             count = column_name_counts.get(name, 0)
             if count > 0:
                 name = '{}.{}'.format(name, count)
             column_name_counts[name] = count + 1
-            data_type = col.dtype
-            if data_type == 'int64':
-                schema.append((name, "LONG_TYPE"))
-                data[name] = col.values.tolist()
-            elif data_type in ['int32', 'int16', 'int8']:
-                schema.append((name, "INTEGER_TYPE"))
-                data[name] = col.values.tolist()
-            elif data_type == 'float64':
-                schema.append((name, "DOUBLE_TYPE"))
-                data[name] = col.values.tolist()
-            elif data_type in ['float32', 'float16']:
-                schema.append((name, "FLOAT_TYPE"))
-                data[name] = col.values.tolist()
-            elif data_type == 'bool':
-                schema.append((name, "BOOLEAN_TYPE"))
-                data[name] = col.values.tolist()
-            elif data_type == 'object':
-                if len(col) == 0:
-                    schema.append((name, "STRING_TYPE"))
-                    data[name] = col
-                else:
-                    el = col[0]
-                    if isinstance(el, datetime.date) and not isinstance(el, datetime.datetime):
-                        schema.append((name, "LOCAL_DATE_TYPE"))
-                        data[name] = col.values.tolist()
-                    elif isinstance(el, datetime.time):
-                        if el.tzinfo:
-                            schema.append((name, "TIME_WITH_TIMEZONE_TYPE"))
-                        else:
-                            schema.append((name, "TIME_TYPE"))
-                            data[name] = col.values.tolist()
-                    elif isinstance(el, datetime.datetime):
-                        if el.tzinfo:
-                            schema.append((name, "TIMESTAMP_WITH_TIMEZONE_TYPE"))
-                        else:
-                            schema.append((name, "TIMESTAMP_TYPE"))
-                        data[name] = pandas_dataframe[name].values.tolist()
-                    else:
-                        schema.append((name, "STRING_TYPE"))
-                        data[name] = pandas_dataframe[name].apply(str).values.tolist()
+            schema.append((name, _pandas_column_type(col)))
+            columns.append(col)
+
+        def convert_chunk(start: int) -> Any:
+            chunk = {}
+            for (name, data_type), col in zip(schema, columns):
+                values = col.iloc[start:start + chunk_size]
+                chunk[name] = values.apply(str) if data_type == 'STRING_TYPE' else values
+            return builder._to_java_data(chunk)
+
+        num_rows = len(pandas_dataframe)
+        # Upload at least one (possibly empty) chunk, so that empty frames have columns too.
+        chunk_starts = range(0, max(num_rows, 1), chunk_size)
+        builder = self.create_frame_builder(schema)
+        started = time.monotonic()
+
+        def upload_chunk(start: int, java_data: Any) -> None:
+            java_handler(builder._frame_builder.addRows, [java_data])
+            if progress_callback is not None:
+                uploaded = min(start + chunk_size, num_rows)
+                elapsed = time.monotonic() - started
+                progress_callback(uploaded, num_rows, uploaded / elapsed if elapsed > 0 else 0.0)
+
+        try:
+            if num_threads == 1:
+                for start in chunk_starts:
+                    upload_chunk(start, convert_chunk(start))
             else:
-                raise ValueError(
-                    INVALID_OPTION.format(
-                        var='data_type',
-                        opts=[
-                            'int8',
-                            'int16',
-                            'int32',
-                            'int64',
-                            'float16',
-                            'float32',
-                            'float64',
-                            'bool',
-                            'object',
-                        ],
-                    )
-                )
-        return self.create_frame(schema, data, frame_name)
+                # Convert at most num_threads chunks ahead, to bound the memory used.
+                java_chunks = concurrency.imap(convert_chunk, chunk_starts, num_threads)
+                for start, java_data in zip(chunk_starts, java_chunks):
+                    upload_chunk(start, java_data)
+            return builder.build(frame_name)
+        except BaseException:
+            builder.destroy()
+            raise
 
     def read_graph_by_name(self, graph_name: str, graph_source: str) -> PgxGraph:
         """
@@ -714,7 +776,7 @@ class PgxSession(PgxContextManager):
             return None
 
         java_graph = java_handler(java_pgql_result_set.getGraph, [])
-        graph = PgxGraph(self, java_graph)
+        graph = PgxGraph._from_java(self, java_graph)
 
         return PgqlResultSet(graph, java_pgql_result_set)
 
@@ -738,7 +800,7 @@ class PgxSession(PgxContextManager):
             return None
 
         java_graph = java_handler(java_pgql_result_set.getGraph, [])
-        graph = PgxGraph(self, java_graph)
+        graph = PgxGraph._from_java(self, java_graph)
 
         return PgqlResultSet(graph, java_pgql_result_set)
 
@@ -762,7 +824,8 @@ class PgxSession(PgxContextManager):
             return None
 
         java_graph = java_handler(java_pgql_result_set.getGraph, [])
-        graph = PgxGraph(self, java_graph)
+        graph = PgxGraph._from_java(self, java_graph)
+        graph._refresh_after_statement(pgql_query)
 
         return PgqlResultSet(graph, java_pgql_result_set)
 
@@ -789,7 +852,7 @@ class PgxSession(PgxContextManager):
         :return: A prepared statement object
         """
         java_prepared_statement = java_handler(self._session.preparePgql, [pgql_query])
-        return PreparedStatement(java_prepared_statement)
+        return PreparedStatement(java_prepared_statement, self)
 
     def create_set(self, content_type: str, name: Optional[str] = None) -> ScalarSet:
         """Create a set of scalars.
@@ -1056,10 +1119,27 @@ class PgxSession(PgxContextManager):
                 [edge_provider.destination_vertex_column],
             )
         java_graph = java_handler(java_graph_from_frames_creator.create, [])
-        return PgxGraph(self._session, java_graph)
+        return PgxGraph(self, java_graph)
 
-    def run_concurrently(self, async_request=None):  # noqa: D102
-        raise NotImplementedError
+    def run_concurrently(self, async_request: Optional[Union[Any, List[Any]]] = None) -> Any:
+        """Run several operations concurrently and wait for their results.
+
+        Each request is a function without arguments that starts an operation and returns a
+        :class:`concurrent.futures.Future` of its result, such as the `_async` variants of the
+        :class:`Analyst` and :class:`PgxGraph` methods, e.g.
+        ``lambda: analyst.pagerank_async(graph)``. A request can also be such a Future itself.
+
+        If an operation fails, its exception is raised once all operations are finished.
+
+        :param async_request: A request, a list of requests, or None to run nothing
+        :returns: The result of the request, the list of the results of the requests, or None if
+            `async_request` is None
+        """
+        if async_request is None:
+            return None
+        if isinstance(async_request, list):
+            return concurrency.gather(async_request)
+        return concurrency.gather([async_request])[0]
 
     def get_execution_environment(self):  # noqa: D102
         raise NotImplementedError
@@ -1080,3 +1160,49 @@ class PgxSession(PgxContextManager):
 
     def __hash__(self) -> NoReturn:
         raise TypeError(UNHASHABLE_TYPE.format(type_name=self.__class__))
+
+
+def _pandas_column_type(col) -> str:
+    """Return the frame data type of a pandas column, e.g. 'LONG_TYPE'."""
+    data_type = col.dtype
+    if data_type == 'int64':
+        return "LONG_TYPE"
+    if data_type in ['int32', 'int16', 'int8']:
+        return "INTEGER_TYPE"
+    if data_type == 'float64':
+        return "DOUBLE_TYPE"
+    if data_type in ['float32', 'float16']:
+        return "FLOAT_TYPE"
+    if data_type == 'bool':
+        return "BOOLEAN_TYPE"
+    if str(data_type) in ['string', 'str']:
+        # The pandas string dtype.
+        return "STRING_TYPE"
+    if data_type == 'object':
+        if len(col) == 0:
+            return "STRING_TYPE"
+        el = col.iloc[0]
+        if isinstance(el, datetime.date) and not isinstance(el, datetime.datetime):
+            return "LOCAL_DATE_TYPE"
+        if isinstance(el, datetime.time):
+            return "TIME_WITH_TIMEZONE_TYPE" if el.tzinfo else "TIME_TYPE"
+        if isinstance(el, datetime.datetime):
+            return "TIMESTAMP_WITH_TIMEZONE_TYPE" if el.tzinfo else "TIMESTAMP_TYPE"
+        return "STRING_TYPE"
+    raise ValueError(
+        INVALID_OPTION.format(
+            var='data_type',
+            opts=[
+                'int8',
+                'int16',
+                'int32',
+                'int64',
+                'float16',
+                'float32',
+                'float64',
+                'bool',
+                'string',
+                'object',
+            ],
+        )
+    )
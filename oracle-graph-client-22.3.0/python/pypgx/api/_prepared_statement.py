@@ -8,7 +8,11 @@ from pypgx._utils import conversion
 from datetime import date, datetime, time
 from pypgx.api._pgql_result_set import PgqlResultSet
 from pypgx.api._pgx_graph import PgxGraph
-from typing import Sequence, NoReturn
+from typing import Optional, Sequence, NoReturn, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    # Don't import at runtime, to avoid circular imports.
+    from pypgx.api._pgx_session import PgxSession
 
 
 class PreparedStatement:
@@ -20,8 +24,17 @@ class PreparedStatement:
 
     _java_class = 'oracle.pgx.api.PgxPreparedStatement'
 
-    def __init__(self, java_prepared_statement) -> None:
+    def __init__(
+        self, java_prepared_statement, session: Optional["PgxSession"] = None
+    ) -> None:
         self.java_prepared_statement = java_prepared_statement
+        self.session = session
+
+    def _get_graph(self, java_graph) -> PgxGraph:
+        """Return the wrapper of the graph of a result, reused across executions."""
+        graph = PgxGraph._from_java(self.session, java_graph)
+        self.session = graph.session
+        return graph
 
     def execute_query(self) -> PgqlResultSet:
         """Blocking version of execute_query_async().
@@ -34,7 +47,7 @@ class PreparedStatement:
         """
         java_pgql_result_set = java_handler(self.java_prepared_statement.executeQuery, [])
         java_graph = java_handler(java_pgql_result_set.getGraph, [])
-        graph = PgxGraph(self, java_graph)
+        graph = self._get_graph(java_graph)
 
         return PgqlResultSet(graph, java_pgql_result_set)
 
@@ -47,7 +60,7 @@ class PreparedStatement:
         java_pgql_result_set = java_handler(self.java_prepared_statement.executeQueryAsync, [])
         java_graph_future = java_handler(java_pgql_result_set.getGraph, [])
         java_graph = java_handler(java_graph_future.get, [])
-        graph = PgxGraph(self, java_graph)
+        graph = self._get_graph(java_graph)
 
         return PgqlResultSet(graph, java_pgql_result_set)
 
@@ -91,7 +104,7 @@ class PreparedStatement:
         """
         java_pgql_result_set = java_handler(self.java_prepared_statement.getResultSet, [])
         java_graph = java_handler(java_pgql_result_set.getGraph, [])
-        graph = PgxGraph(self, java_graph)
+        graph = self._get_graph(java_graph)
 
         return PgqlResultSet(graph, java_pgql_result_set)
 
@@ -108,7 +121,7 @@ class PreparedStatement:
         java_pgql_result_set = java_handler(self.java_prepared_statement.getResultSetAsync, [])
         java_graph_future = java_handler(java_pgql_result_set.getGraph, [])
         java_graph = java_handler(java_graph_future.get, [])
-        graph = PgxGraph(self, java_graph)
+        graph = self._get_graph(java_graph)
 
         return PgqlResultSet(graph, java_pgql_result_set)
 
@@ -14,15 +14,18 @@ from pypgx.api._pgx_entity import PgxEdge, PgxVertex, PgxEntity
 from pypgx._utils.error_handling import java_handler
 from pypgx._utils.error_messages import (
     ABSTRACT_METHOD,
+    ARG_MUST_BE,
     COMPARE_VECTOR,
+    ENTITY_NOT_FOUND,
     INVALID_OPTION,
     WRONG_SIZE_PROPERTY,
 )
-from pypgx._utils import conversion
+from pypgx._utils import columnar, conversion
 from pypgx._utils.pgx_types import property_types
 from pypgx._utils.pyjnius_helper import PyjniusHelper
 from pypgx.api._pgx_map import PgxMap
-from typing import Any, Iterator, List, Optional, Tuple, Union, TYPE_CHECKING
+from pypgx.api._pgql_result_set import DEFAULT_BATCH_SIZE, PgqlResultSet
+from typing import Any, Iterable, Iterator, List, Optional, Tuple, Union, TYPE_CHECKING
 
 if TYPE_CHECKING:
     # Don't import at runtime, to avoid circular imports.
@@ -30,6 +33,22 @@ if TYPE_CHECKING:
 
 
 JavaPgxVect = autoclass("oracle.pgx.api.PgxVect")
+HashMap = autoclass('java.util.HashMap')
+
+# Property types that can be read with a PGQL query, see PgxProperty.get_many().
+_QUERYABLE_TYPES = {
+    'integer',
+    'long',
+    'float',
+    'double',
+    'boolean',
+    'string',
+    'local_date',
+    'time',
+    'timestamp',
+    'time_with_timezone',
+    'timestamp_with_timezone',
+}
 
 
 class PgxProperty(PgxContextManager):
@@ -48,10 +67,17 @@ class PgxProperty(PgxContextManager):
         self.type = java_prop.getType().toString()
         self.is_transient = java_prop.isTransient()
         self.dimension = java_prop.getDimension()
-        self.size = java_prop.size()
         self.graph = graph
         self.is_vector_property = self.dimension > 0
 
+    @property
+    def size(self) -> int:
+        """Get the number of vertices/edges of this property.
+
+        Read on each access, since handles are cached by the graph and the graph may change.
+        """
+        return java_handler(self._prop.size, [])
+
     @property
     def is_published(self) -> bool:
         """Check if this property is published.
@@ -75,7 +101,9 @@ class PgxProperty(PgxContextManager):
         :return: None
         """
         java_handler(self._prop.rename, [name])
+        self.graph._forget_property(self._entity_kind, self.name)
         self.name = name
+        self.graph._remember_property(self)
 
     def clone(self, name: Optional[str] = None) -> "PgxProperty":
         """Create a copy of this property.
@@ -86,7 +114,7 @@ class PgxProperty(PgxContextManager):
         :rtype: this class
         """
         cloned_prop = java_handler(self._prop.clone, [name])
-        return self.__class__(self.graph, cloned_prop)
+        return self.graph._remember_property(self.__class__(self.graph, cloned_prop))
 
     def get_top_k_values(self, k: int) -> List[Tuple[PgxEntity, Any]]:
         """Get the top k vertex/edge value pairs according to their value.
@@ -142,12 +170,25 @@ class PgxProperty(PgxContextManager):
     def set_values(self, values: PgxMap) -> None:
         """Set the labels values.
 
+        Keys given as IDs are looked up with a single PGQL query, and all the values are sent to
+        the server in a single request.
+
         :param values: pgxmap with ids and values
         :type values: PgxMap
         """
-        values_keys = values.keys()
-        for key in values_keys:
-            self.set(key, values.get(key))
+        keys = []
+        python_values = []
+        for entry in java_handler(values._map.entries, []):
+            keys.append(entry.getKey())
+            python_values.append(
+                conversion.property_to_python(entry.getValue(), values.value_type, self.graph)
+            )
+        if values.key_type not in ('vertex', 'edge'):
+            keys = self.graph._get_java_entities(keys, self.entity_type)
+        java_values = HashMap()
+        for key, value in zip(keys, python_values):
+            java_values.put(key, self._to_java_value(value))
+        java_handler(self._prop.setValues, [java_values])
 
     def get(self, key: Union[PgxEntity, int, str]) -> Any:
         """Get a property value.
@@ -165,22 +206,119 @@ class PgxProperty(PgxContextManager):
         :param value: The property value
         """
         java_key = self._get_java_pgx_entity(key)
-        if self.is_vector_property:
-            java_value = self._to_java_pgx_vect(value)
-        else:
-            java_value = conversion.property_to_java(value, self.type)
-        java_handler(self._prop.set, [java_key, java_value])
+        java_handler(self._prop.set, [java_key, self._to_java_value(value)])
+
+    def get_many(self, keys: Iterable[Union[PgxEntity, int, str]]) -> Any:
+        """Get the property values of multiple vertices/edges.
+
+        The values of scalar properties are read with a single PGQL query and transferred column
+        by column, see :meth:`PgqlResultSet.to_numpy`.
+
+        This method requires NumPy.
+
+        :param keys: The keys (vertices/edges or their IDs) whose property to get
+        :return: A NumPy array with the value of each key, in the order of `keys`
+        """
+        columnar.import_numpy()
+        ids = [key.id if isinstance(key, PgxEntity) else key for key in columnar.to_list(keys)]
+        if not self._is_queryable():
+            return columnar.object_array([self.get(entity_id) for entity_id in ids])
+        if len(ids) == 0:
+            return columnar.column_to_numpy([], columnar.column_type(self.type))
+
+        statement = self.graph.prepare_pgql(
+            'SELECT ID(N), N.{} MATCH {} WHERE ID(N) IN ?'.format(
+                conversion.to_pgql_identifier(self.name), self._match_pattern
+            )
+        )
+        try:
+            statement.set_array(1, list(set(ids)))
+            result_set = statement.execute_query()
+            result_ids, result_values = result_set._get_all_columns([0, 1])
+            col_type = result_set._col_types[1]
+        finally:
+            statement.close()
+
+        positions = {entity_id: idx for idx, entity_id in enumerate(result_ids)}
+        values = []
+        for entity_id in ids:
+            if entity_id not in positions:
+                raise LookupError(
+                    ENTITY_NOT_FOUND.format(entity_type=self.entity_type, id=entity_id)
+                )
+            values.append(result_values[positions[entity_id]])
+        return columnar.column_to_numpy(values, col_type, self.graph)
+
+    def set_many(self, keys: Iterable[Union[PgxEntity, int, str]], values: Iterable[Any]) -> None:
+        """Set the property values of multiple vertices/edges.
+
+        The keys given as IDs are looked up with a single PGQL query, and all the values are sent
+        to the server in a single request.
+
+        :param keys: The keys (vertices/edges or their IDs) whose property to set
+        :param values: The property values, in the order of `keys`. Can be a NumPy array.
+        """
+        keys = columnar.to_list(keys)
+        values = columnar.to_list(values)
+        if len(keys) != len(values):
+            raise ValueError(ARG_MUST_BE.format(arg='values', type="a sequence as long as 'keys'"))
+        java_keys = self.graph._get_java_entities(keys, self.entity_type)
+        java_values = HashMap()
+        for java_key, value in zip(java_keys, values):
+            java_values.put(java_key, self._to_java_value(value))
+        java_handler(self._prop.setValues, [java_values])
+
+    def to_numpy(self, with_ids: bool = False) -> Any:
+        """Get all the values of this property as a NumPy array.
+
+        The values are in the internal order of the vertices/edges of the graph, which is also the
+        order expected by :meth:`from_numpy`.
+
+        This method requires NumPy.
+
+        :param with_ids: Whether to also return the IDs of the vertices/edges
+        :return: The values, or an (IDs, values) tuple of arrays if `with_ids` is True
+        """
+        columnar.import_numpy()
+        ids = []
+        values = []
+        for item in java_handler(self._prop.getValues, []):
+            if with_ids:
+                ids.append(item.getKey().getId())
+            values.append(item.getValue())
+        col_type = 'array' if self.is_vector_property else columnar.column_type(self.type)
+        values_array = columnar.column_to_numpy(values, col_type, self.graph)
+        if not with_ids:
+            return values_array
+        id_type = 'long'
+        if self.entity_type == 'vertex':
+            id_type = getattr(self.graph, 'vertex_id_type', None) or 'long'
+        return columnar.column_to_numpy(ids, id_type), values_array
+
+    def from_numpy(self, values: Iterable[Any]) -> None:
+        """Set all the values of this property.
+
+        All the values are sent to the server in a single request.
+
+        :param values: The values, in the internal order of the vertices/edges of the graph as
+            returned by :meth:`to_numpy`. Can be a NumPy array.
+        """
+        values = columnar.to_list(values)
+        if len(values) != self.size:
+            raise ValueError(
+                ARG_MUST_BE.format(arg='values', type='a sequence as long as the property')
+            )
+        java_values = HashMap()
+        for item, value in zip(java_handler(self._prop.getValues, []), values):
+            java_values.put(item.getKey(), self._to_java_value(value))
+        java_handler(self._prop.setValues, [java_values])
 
     def fill(self, value: Any) -> None:
         """Fill this property with a given value.
 
         :param value: The value
         """
-        if self.is_vector_property:
-            java_value = self._to_java_pgx_vect(value)
-        else:
-            java_value = conversion.property_to_java(value, self.type)
-        java_handler(self._prop.fill, [java_value])
+        java_handler(self._prop.fill, [self._to_java_value(value)])
 
     def expand(self) -> Union["PgxProperty", List["PgxProperty"]]:
         """If this is a vector property, expands this property into a list of scalar properties of
@@ -203,8 +341,13 @@ class PgxProperty(PgxContextManager):
 
         :return: None
         """
+        self.graph._forget_property(self._entity_kind, self.name)
         java_handler(self._prop.close, [])
 
+    def _is_queryable(self) -> bool:
+        """Whether the values of this property can be read with a PGQL query."""
+        return not self.is_vector_property and self.type in _QUERYABLE_TYPES
+
     def get_property_id(self) -> PgxId:
         """Get an internal identifier for this property.
 
@@ -242,28 +385,106 @@ class PgxProperty(PgxContextManager):
 
         :return: None
         """
+        self.graph._forget_property(self._entity_kind, self.name)
         java_handler(self._prop.destroy, [])
 
-    def __iter__(self) -> Iterator[Tuple[PgxEntity, Any]]:
-        it = self._prop.getValues().iterator()
-        return (
-            (
-                conversion.entity_to_python(item.getKey(), self.graph),
-                conversion.property_to_python(item.getValue(), self.type, self.graph),
+    def _query_values(self, ids_only: bool) -> PgqlResultSet:
+        """Query the keys and values of this property, for reading them page by page."""
+        key = 'ID(N)' if ids_only else 'N'
+        result_set = self.graph.query_pgql(
+            'SELECT {}, N.{} MATCH {}'.format(
+                key, conversion.to_pgql_identifier(self.name), self._match_pattern
             )
-            for item in it
         )
+        # The pages are read once, in order.
+        result_set.configure_cache(policy='none')
+        return result_set
+
+    def _iter_java_values(self, ids_only: bool) -> Iterator[Tuple[Any, Any]]:
+        for item in self._prop.getValues().iterator():
+            if ids_only:
+                key = item.getKey().getId()
+            else:
+                key = conversion.entity_to_python(item.getKey(), self.graph)
+            yield key, conversion.property_to_python(item.getValue(), self.type, self.graph)
+
+    def _iter_values(self, page_size: int, ids_only: bool, as_numpy: bool) -> Iterator[Any]:
+        if not self._is_queryable():
+            items = self._iter_java_values(ids_only or as_numpy)
+            if not as_numpy:
+                yield from items
+                return
+            col_type = 'array' if self.is_vector_property else columnar.column_type(self.type)
+            id_type = 'long'
+            if self.entity_type == 'vertex':
+                id_type = getattr(self.graph, 'vertex_id_type', None) or 'long'
+            while True:
+                page = list(islice(items, page_size))
+                if not page:
+                    return
+                ids, values = zip(*page)
+                yield (
+                    columnar.column_to_numpy(ids, id_type),
+                    columnar.column_to_numpy(values, col_type, self.graph),
+                )
+
+        result_set = self._query_values(ids_only or as_numpy)
+        try:
+            if as_numpy:
+                for _, _, (ids, values) in result_set._iter_column_chunks([0, 1], page_size):
+                    yield (
+                        columnar.column_to_numpy(ids, result_set._col_types[0]),
+                        columnar.column_to_numpy(values, result_set._col_types[1], self.graph),
+                    )
+            else:
+                for row in result_set.iter_rows(page_size):
+                    yield tuple(row)
+        finally:
+            result_set.close()
+
+    def iter_values(
+        self, page_size: int = DEFAULT_BATCH_SIZE, ids_only: bool = True, as_numpy: bool = False
+    ) -> Iterator[Any]:
+        """Iterate over the keys and values of this property, page by page.
+
+        The keys and values of scalar properties are read with a PGQL query, whose result is
+        fetched from the server one page at a time instead of all at once. The order of the
+        entries is not specified.
+
+        :param page_size: Number of entries fetched per request
+        :param ids_only: Whether to yield the IDs of the vertices/edges instead of PgxVertex/PgxEdge
+            objects
+        :param as_numpy: Whether to yield an (IDs, values) tuple of NumPy arrays per page instead of
+            one (key, value) tuple per entry. This requires NumPy.
+        :return: An iterator over (key, value) tuples, or over (IDs, values) tuples of NumPy arrays
+            if `as_numpy` is True
+        """
+        if not isinstance(page_size, int) or page_size < 1:
+            raise ValueError(ARG_MUST_BE.format(arg='page_size', type='a positive integer'))
+        if as_numpy:
+            columnar.import_numpy()
+        return self._iter_values(page_size, ids_only, as_numpy)
+
+    def __iter__(self) -> Iterator[Tuple[PgxEntity, Any]]:
+        return self.iter_values(ids_only=False)
 
     def __getitem__(self, key: Union[slice, PgxEntity, int, str]) -> Any:
         if isinstance(key, slice):
-            it = self._prop.getValues().iterator()
-            return list(
-                (
-                    conversion.entity_to_python(item.getKey(), self.graph),
-                    conversion.property_to_python(item.getValue(), self.type, self.graph),
-                )
-                for item in islice(it, key.start, key.stop, key.step)
-            )
+            if not self._is_queryable():
+                items = self._iter_java_values(ids_only=False)
+                return list(islice(items, key.start, key.stop, key.step))
+            # Only fetch the requested rows of the query result.
+            start, stop, step = key.indices(self.size)
+            if step < 0:
+                return list(self)[key]
+            result_set = self._query_values(ids_only=False)
+            try:
+                stop = min(stop, result_set.num_results)
+                if start >= stop:
+                    return []
+                return [tuple(row) for row in result_set.get_slice(start, stop - 1, step)]
+            finally:
+                result_set.close()
         else:
             return self.get(key)
 
@@ -293,6 +514,12 @@ class PgxProperty(PgxContextManager):
         """Get a Java PgxEdge or PgxVertex by ID or by Python PgxEdge/PgxVertex."""
         raise NotImplementedError(ABSTRACT_METHOD)
 
+    def _to_java_value(self, value: Any) -> JavaClass:
+        """Convert a Python value to a Java value of the type of this property."""
+        if self.is_vector_property:
+            return self._to_java_pgx_vect(value)
+        return conversion.property_to_java(value, self.type)
+
     def _to_java_pgx_vect(self, value: Any) -> JavaClass:
         """Convert a value or sequence of values to a Java PgxVect."""
 
@@ -311,17 +538,16 @@ class VertexProperty(PgxProperty):
     """A vertex property of a :class:`PgxGraph`."""
 
     _java_class = 'oracle.pgx.api.VertexProperty'
+    _entity_kind = 'vertex'
+    _match_pattern = '(N)'
 
     @staticmethod
     def _from_java(java_prop):
         # need to import here to avoid import loop
-        from pypgx.api._pgx_session import PgxSession
         from pypgx.api._pgx_graph import PgxGraph
 
-        java_graph = java_handler(java_prop.getGraph, [])
-        java_session = java_handler(java_graph.getSession, [])
-        graph = PgxGraph(PgxSession(java_session), java_graph)
-        return VertexProperty(graph, java_prop)
+        graph = PgxGraph._from_java(None, java_handler(java_prop.getGraph, []))
+        return graph._remember_property(VertexProperty(graph, java_prop))
 
     def _get_java_pgx_entity(self, key: Union[PgxEntity, int, str]) -> JavaClass:
         if isinstance(key, PgxEntity):
@@ -333,6 +559,8 @@ class EdgeProperty(PgxProperty):
     """An edge property of a :class:`PgxGraph`."""
 
     _java_class = 'oracle.pgx.api.EdgeProperty'
+    _entity_kind = 'edge'
+    _match_pattern = '()-[N]->()'
 
     def _get_java_pgx_entity(self, key: Union[PgxEntity, int, str]) -> JavaClass:
         if isinstance(key, PgxEntity):
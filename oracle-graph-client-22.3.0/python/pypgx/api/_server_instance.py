@@ -6,6 +6,7 @@ import json
 from jnius import autoclass
 
 from pypgx._utils.error_handling import java_handler
+from pypgx._utils.lazy import lazy_property, reset_lazy_properties
 from pypgx._utils.error_messages import INVALID_OPTION
 from pypgx._utils.pgx_types import time_units, memory_units
 from pypgx._utils import conversion
@@ -24,20 +25,60 @@ class ServerInstance:
 
     def __init__(self, java_server_instance) -> None:
         self._server_instance = java_server_instance
-        self.is_embedded_instance = java_server_instance.isEmbeddedInstance()
-        self.username = java_server_instance.getUsername()
-        self.base_url = java_server_instance.getBaseUrl()
-        self.prefetch_size = java_server_instance.getPrefetchSize()
-        self.upload_batch_size = java_server_instance.getUploadBatchSize()
-        self.remote_future_timeout = java_server_instance.getRemoteFutureTimeout()
-        self.client_server_interaction_mode = (
-            java_server_instance.getClientServerInteractionMode().toString()
-        )
-        self.remote_future_pending_retry_interval = (
-            java_server_instance.getRemoteFuturePendingRetryInterval()
-        )
-        self.version = java_server_instance.getVersion().toString()
-        self.pgx_version = java_server_instance.getVersion()
+
+    def refresh(self) -> None:
+        """Fetch the attributes of the server instance again when they are next read."""
+        reset_lazy_properties(self)
+
+    @lazy_property
+    def is_embedded_instance(self) -> bool:
+        """Whether the engine runs in the same JVM as the client."""
+        return self._server_instance.isEmbeddedInstance()
+
+    @lazy_property
+    def username(self) -> str:
+        """Get the name of the user connected to the server."""
+        return self._server_instance.getUsername()
+
+    @lazy_property
+    def base_url(self) -> str:
+        """Get the base URL of the server."""
+        return self._server_instance.getBaseUrl()
+
+    @lazy_property
+    def prefetch_size(self) -> int:
+        """Get the number of elements fetched at once when iterating over remote collections."""
+        return self._server_instance.getPrefetchSize()
+
+    @lazy_property
+    def upload_batch_size(self) -> int:
+        """Get the number of elements uploaded at once."""
+        return self._server_instance.getUploadBatchSize()
+
+    @lazy_property
+    def remote_future_timeout(self) -> int:
+        """Get the timeout of remote futures, in milliseconds."""
+        return self._server_instance.getRemoteFutureTimeout()
+
+    @lazy_property
+    def client_server_interaction_mode(self) -> str:
+        """Get the client-server interaction mode."""
+        return self._server_instance.getClientServerInteractionMode().toString()
+
+    @lazy_property
+    def remote_future_pending_retry_interval(self) -> int:
+        """Get the interval between checks of pending remote futures, in milliseconds."""
+        return self._server_instance.getRemoteFuturePendingRetryInterval()
+
+    @lazy_property
+    def pgx_version(self) -> Any:
+        """Get the Java version object of the server."""
+        return self._server_instance.getVersion()
+
+    @lazy_property
+    def version(self) -> str:
+        """Get the version of the server."""
+        return self.pgx_version.toString()
 
     def create_session(
         self,
@@ -68,7 +109,7 @@ class ServerInstance:
         session = java_handler(
             self._server_instance.createSession, [source, idle_timeout, task_timeout, time_unit]
         )
-        return PgxSession(session)
+        return PgxSession._from_java(session)
 
     def get_session(self, session_id: str) -> "PgxSession":
         """Get a session by ID.
@@ -79,7 +120,7 @@ class ServerInstance:
         from pypgx.api._pgx_session import PgxSession
 
         session = java_handler(self._server_instance.getSession, [session_id])
-        return PgxSession(session)
+        return PgxSession._from_java(session)
 
     def get_pgx_config(self) -> Dict[str, Any]:
         """Get the PGX config.
@@ -0,0 +1,317 @@
+#
+# Copyright (C) 2013 - 2022 Oracle and/or its affiliates. All rights reserved.
+#
+
+import threading
+import time
+from collections import deque
+from typing import Deque, Dict, Iterable, List, Optional, Tuple
+
+from pypgx._utils.error_messages import ARG_MUST_BE, GRAPH_NOT_FOUND
+from pypgx.api._analyst import Analyst
+from pypgx.api._pgx_graph import PgxGraph
+from pypgx.api._pgx_session import PgxSession
+from pypgx.api._server_instance import ServerInstance
+
+DEFAULT_POOL_MAX_SIZE = 8
+DEFAULT_POOL_IDLE_TIMEOUT = 300.0
+DEFAULT_POOL_HEALTH_CHECK_INTERVAL = 30.0
+
+
+class PooledSession:
+    """A session handed out by a :class:`SessionPool`, with its analyst and preloaded graphs.
+
+    Each :meth:`SessionPool.acquire` returns a new handle. Once released, the handle cannot be
+    used anymore. Used as a context manager, the session is returned to the pool on exit.
+    """
+
+    def __init__(self, pool: "SessionPool", session: PgxSession, graphs: Dict[str, PgxGraph]):
+        self._session = session
+        self._analyst: Analyst = session.analyst
+        self._graphs = graphs
+        self._pool = pool
+        self._released = False
+
+    @property
+    def session(self) -> PgxSession:
+        """Get the session."""
+        self._assert_not_released()
+        return self._session
+
+    @property
+    def analyst(self) -> Analyst:
+        """Get the analyst of the session."""
+        self._assert_not_released()
+        return self._analyst
+
+    @property
+    def graphs(self) -> Dict[str, PgxGraph]:
+        """Get the preloaded graphs of the session, by name."""
+        self._assert_not_released()
+        return self._graphs
+
+    def _assert_not_released(self) -> None:
+        if self._released:
+            raise RuntimeError('the session was released to its pool')
+
+    def release(self) -> None:
+        """Return the session to its pool. The handle cannot be used anymore.
+
+        Releasing a handle again has no effect.
+        """
+        if not self._released:
+            self._released = True
+            # The pool hands out a new handle, so that this one can't release it again.
+            self._pool._release(PooledSession(self._pool, self._session, self._graphs))
+
+    def __enter__(self) -> "PooledSession":
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.release()
+
+    def __repr__(self) -> str:
+        return "{}(session: {}, graphs: {}, released: {})".format(
+            self.__class__.__name__, self._session.id, list(self._graphs), self._released
+        )
+
+    def __str__(self) -> str:
+        return repr(self)
+
+
+class SessionPool:
+    """A pool of sessions reused by the request handlers of a service.
+
+    Creating a session takes several requests to the server, to create the session and its
+    analyst and to look up its graphs. The pool keeps sessions that are not in use, with their
+    analyst and their preloaded published graphs, and hands them out again.
+
+    Idle sessions above the minimum size are destroyed once they are idle for `idle_timeout`
+    seconds, when a session is next acquired or released. Before a
+    session idle for `health_check_interval` seconds is handed out again, the pool checks that it
+    still exists on the server, and replaces it by a new session otherwise.
+
+    Data created in a session, e.g. transient properties, stays in the session when it is
+    returned to the pool.
+
+    :param server_instance: The server instance to create sessions on
+    :param source: A descriptive string identifying the client
+    :param graph_names: The names of the published graphs to preload in each session
+    :param min_size: The number of sessions kept even when idle, created upfront
+    :param max_size: The maximum number of sessions
+    :param idle_timeout: Seconds after which idle sessions above `min_size` are destroyed
+    :param health_check_interval: Seconds after which an idle session is checked again
+    """
+
+    def __init__(
+        self,
+        server_instance: ServerInstance,
+        source: str = 'pypgx_session_pool',
+        graph_names: Iterable[str] = (),
+        min_size: int = 0,
+        max_size: int = DEFAULT_POOL_MAX_SIZE,
+        idle_timeout: float = DEFAULT_POOL_IDLE_TIMEOUT,
+        health_check_interval: float = DEFAULT_POOL_HEALTH_CHECK_INTERVAL,
+    ) -> None:
+        if not isinstance(server_instance, ServerInstance):
+            raise TypeError(ARG_MUST_BE.format(arg='server_instance', type=ServerInstance.__name__))
+        if not isinstance(max_size, int) or max_size < 1:
+            raise ValueError(ARG_MUST_BE.format(arg='max_size', type='a positive integer'))
+        if not isinstance(min_size, int) or not 0 <= min_size <= max_size:
+            raise ValueError(ARG_MUST_BE.format(arg='min_size', type='between 0 and max_size'))
+        self.server_instance = server_instance
+        self.source = source
+        self.graph_names = list(graph_names)
+        self.min_size = min_size
+        self.max_size = max_size
+        self.idle_timeout = idle_timeout
+        self.health_check_interval = health_check_interval
+        # Idle sessions with the time they were returned, the most recently returned last.
+        self._idle: Deque[Tuple[PooledSession, float]] = deque()
+        self._size = 0
+        self._closed = False
+        self._condition = threading.Condition()
+        created: List[PooledSession] = []
+        try:
+            for _ in range(min_size):
+                created.append(self._create())
+        except BaseException:
+            for pooled in created:
+                self._discard(pooled)
+            raise
+        for pooled in created:
+            pooled.release()
+
+    @property
+    def size(self) -> int:
+        """Get the number of sessions of the pool, in use or idle."""
+        return self._size
+
+    @property
+    def num_idle(self) -> int:
+        """Get the number of idle sessions of the pool."""
+        return len(self._idle)
+
+    def acquire(self, timeout: Optional[float] = None) -> PooledSession:
+        """Get a session from the pool, creating one if none is idle.
+
+        If the pool already has `max_size` sessions, wait for one to be returned.
+
+        The session is returned to the pool by :meth:`PooledSession.release`, or at the end of
+        a ``with pool.acquire() as pooled:`` block.
+
+        :param timeout: The maximum number of seconds to wait, or None to wait indefinitely
+        :returns: The session
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while True:
+            pooled, returned_at = self._take(deadline)
+            if pooled is None:
+                try:
+                    return self._create(reserved=True)
+                except BaseException:
+                    self._discard(None)
+                    raise
+            if (
+                time.monotonic() - returned_at < self.health_check_interval
+                or self._is_alive(pooled._session)
+            ):
+                return pooled
+            # The session is gone on the server, e.g. it timed out. Try the next one.
+            self._discard(pooled)
+
+    def _take(self, deadline: Optional[float]) -> Tuple[Optional[PooledSession], float]:
+        """Take an idle session with the time it was returned, or reserve the slot of a new
+        session and return None if no session is idle, waiting until `deadline` if necessary.
+        """
+        evicted: List[PooledSession] = []
+        try:
+            with self._condition:
+                while True:
+                    if self._closed:
+                        raise RuntimeError('the session pool is closed')
+                    evicted.extend(self._pop_expired())
+                    if self._idle:
+                        return self._idle.pop()
+                    if self._size < self.max_size:
+                        # Reserve the slot, the session is created without holding the lock.
+                        self._size += 1
+                        return None, 0.0
+                    remaining = None if deadline is None else deadline - time.monotonic()
+                    if remaining is not None and remaining <= 0:
+                        raise TimeoutError('no session of the pool was released in time')
+                    self._condition.wait(remaining)
+        finally:
+            for expired in evicted:
+                self._destroy(expired._session)
+
+    def close(self) -> None:
+        """Destroy the idle sessions. Sessions in use are destroyed when they are released."""
+        with self._condition:
+            self._closed = True
+            self._condition.notify_all()
+        self._discard_idle()
+
+    def _create(self, reserved: bool = False) -> PooledSession:
+        if not reserved:
+            with self._condition:
+                self._size += 1
+        try:
+            session = self.server_instance.create_session(self.source)
+        except BaseException:
+            if not reserved:
+                self._discard(None)
+            raise
+        try:
+            graphs = {}
+            for name in self.graph_names:
+                graph = session.get_graph(name)
+                if graph is None:
+                    raise LookupError(GRAPH_NOT_FOUND.format(graph=name))
+                graphs[name] = graph
+        except BaseException:
+            self._destroy(session)
+            if not reserved:
+                self._discard(None)
+            raise
+        return PooledSession(self, session, graphs)
+
+    def _release(self, pooled: PooledSession) -> None:
+        with self._condition:
+            if not self._closed:
+                self._idle.append((pooled, time.monotonic()))
+                self._condition.notify()
+                evicted = self._pop_expired()
+            else:
+                evicted = None
+        if evicted is None:
+            self._discard(pooled)
+            return
+        for expired in evicted:
+            self._destroy(expired._session)
+
+    def _pop_expired(self) -> List[PooledSession]:
+        """Remove the sessions idle for longer than the idle timeout from the pool, keeping
+        min_size sessions, and return them to be destroyed.
+
+        Must be called while holding the lock.
+        """
+        now = time.monotonic()
+        evicted: List[PooledSession] = []
+        # The least recently returned sessions are first.
+        while self._idle and self._size > self.min_size:
+            pooled, returned_at = self._idle[0]
+            if now - returned_at < self.idle_timeout:
+                break
+            self._idle.popleft()
+            self._size -= 1
+            evicted.append(pooled)
+        return evicted
+
+    def _discard(self, pooled: Optional[PooledSession]) -> None:
+        """Destroy a session that is not idle, or give up a reserved slot if `pooled` is None."""
+        with self._condition:
+            self._size -= 1
+            self._condition.notify()
+        if pooled is not None:
+            self._destroy(pooled._session)
+
+    def _discard_idle(self) -> None:
+        with self._condition:
+            idle = [pooled for pooled, _ in self._idle]
+            self._idle.clear()
+            self._size -= len(idle)
+            self._condition.notify_all()
+        for pooled in idle:
+            self._destroy(pooled._session)
+
+    @staticmethod
+    def _is_alive(session: PgxSession) -> bool:
+        """Check that the session still exists on the server with a lightweight request."""
+        try:
+            session.get_graphs()
+        except Exception:
+            return False
+        return True
+
+    @staticmethod
+    def _destroy(session: PgxSession) -> None:
+        try:
+            session.destroy()
+        except Exception:
+            # The session may have timed out on the server already.
+            pass
+
+    def __enter__(self) -> "SessionPool":
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
+
+    def __repr__(self) -> str:
+        return "{}(source: {}, size: {}, idle: {})".format(
+            self.__class__.__name__, self.source, self.size, self.num_idle
+        )
+
+    def __str__(self) -> str:
+        return repr(self)
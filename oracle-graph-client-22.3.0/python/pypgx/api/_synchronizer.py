@@ -2,13 +2,14 @@
 # Copyright (C) 2013 - 2022 Oracle and/or its affiliates. All rights reserved.
 #
 
-from typing import TYPE_CHECKING
+from typing import Optional, TYPE_CHECKING
 
 from pypgx._utils.error_handling import java_handler
 
 if TYPE_CHECKING:
     # Don't import at runtime, to avoid circular imports.
     from pypgx.api._pgx_graph import PgxGraph
+    from pypgx.api._pgx_session import PgxSession
 
 
 class Synchronizer:
@@ -16,8 +17,9 @@ class Synchronizer:
 
     _java_class = 'oracle.pgx.api.Synchronizer'
 
-    def __init__(self, java_synchronizer) -> None:
+    def __init__(self, java_synchronizer, session: Optional["PgxSession"] = None) -> None:
         self._synchronizer = java_synchronizer
+        self._session = session
 
     def apply(self):
         """Apply the changes to the underlying PGX graph."""
@@ -44,7 +46,9 @@ class Synchronizer:
         """
         from pypgx.api._pgx_graph import PgxGraph
 
-        return PgxGraph(self, java_handler(self._synchronizer.sync, []))
+        return PgxGraph._from_java(
+            self._session, java_handler(self._synchronizer.sync, []), new_snapshot=True
+        )
 
 
 class FlashbackSynchronizer(Synchronizer):
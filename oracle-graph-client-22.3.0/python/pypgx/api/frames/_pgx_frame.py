@@ -8,9 +8,21 @@ from jnius import autoclass
 from pypgx.api._pgx_context_manager import PgxContextManager
 from pypgx._utils.error_handling import java_handler
 from pypgx._utils.error_messages import UNHASHABLE_TYPE, ARG_MUST_BE
-from pypgx.api._pgql_result_set import PgqlResultSet
+from pypgx.api._pgql_result_set import DEFAULT_EXPORT_CHUNK_SIZE, PgqlResultSet
 from pypgx.api.frames._pgx_frame_storer import PgxGenericFrameStorer
-from typing import List, Optional, Tuple, Mapping, TextIO, NoReturn
+from typing import (
+    Any,
+    Dict,
+    Iterator,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+    Mapping,
+    TextIO,
+    NoReturn,
+    Union,
+)
 
 ByteArrayOutputStream = autoclass('java.io.ByteArrayOutputStream')
 PrintStream = autoclass('java.io.PrintStream')
@@ -297,22 +309,102 @@ class PgxFrame(PgxContextManager):
         java_pgql_result_set = java_handler(self._frame.toPgqlResultSet, [])
         return PgqlResultSet(None, java_pgql_result_set)
 
-    def to_pandas(self):
+    def to_pandas(
+        self,
+        columns: Optional[Sequence[Union[str, int]]] = None,
+        chunksize: Optional[int] = None,
+        categorical: bool = False,
+    ):
         """
         Convert to pandas DataFrame.
 
+        See :meth:`PgqlResultSet.to_pandas` for the dtypes of the columns.
+
         This method may change result_set cursor.
 
         This method requires pandas.
 
-        :return: PgxFrame as a Pandas Dataframe
+        :param columns: Names or indices of the columns to convert, or None for all columns
+        :param chunksize: If given, return an iterator over DataFrames of at most `chunksize`
+            rows each instead of a single DataFrame
+        :param categorical: Whether to convert string columns to the 'category' dtype
+        :return: PgxFrame as a Pandas Dataframe, or an iterator over Pandas Dataframes if
+            `chunksize` is given
         """
         result_set = self.to_pgql_result_set()
-        df = result_set.to_pandas()
+        try:
+            df = result_set.to_pandas(columns, chunksize, categorical)
+        except Exception:
+            result_set.close()
+            raise
+        if chunksize is not None:
+            return self._iter_chunks(result_set, df)
         result_set.close()
 
         return df
 
+    @staticmethod
+    def _iter_chunks(result_set, chunks):
+        try:
+            yield from chunks
+        finally:
+            result_set.close()
+
+    def to_numpy(self, columns: Optional[Sequence[Union[str, int]]] = None) -> Dict[str, Any]:
+        """Convert to a dictionary of NumPy arrays, one per column.
+
+        See :meth:`PgqlResultSet.to_numpy` for the dtypes of the arrays.
+
+        This method requires NumPy.
+
+        :param columns: Names or indices of the columns to convert, or None for all columns
+        :return: A dictionary mapping column names to NumPy arrays
+        """
+        result_set = self.to_pgql_result_set()
+        try:
+            return result_set.to_numpy(columns)
+        finally:
+            result_set.close()
+
+    def to_arrow(self, columns: Optional[Sequence[Union[str, int]]] = None):
+        """Convert to a pyarrow Table.
+
+        See :meth:`PgqlResultSet.to_arrow` for the types of the columns.
+
+        This method requires pyarrow.
+
+        :param columns: Names or indices of the columns to convert, or None for all columns
+        :return: PgxFrame as a pyarrow Table
+        """
+        result_set = self.to_pgql_result_set()
+        try:
+            return result_set.to_arrow(columns)
+        finally:
+            result_set.close()
+
+    def to_arrow_batches(
+        self,
+        batch_rows: int = DEFAULT_EXPORT_CHUNK_SIZE,
+        columns: Optional[Sequence[Union[str, int]]] = None,
+    ) -> Iterator[Any]:
+        """Iterate over the frame as pyarrow RecordBatches.
+
+        See :meth:`PgqlResultSet.to_arrow_batches`.
+
+        This method requires pyarrow.
+
+        :param batch_rows: Maximum number of rows per batch
+        :param columns: Names or indices of the columns to convert, or None for all columns
+        :return: An iterator over pyarrow RecordBatches
+        """
+        result_set = self.to_pgql_result_set()
+        try:
+            batches = result_set.to_arrow_batches(batch_rows, columns)
+        except Exception:
+            result_set.close()
+            raise
+        return self._iter_chunks(result_set, batches)
+
     def print(
         self,
         file: Optional[TextIO] = None,
@@ -1,43 +1,93 @@
 #
 # Copyright (C) 2013 - 2022 Oracle and/or its affiliates. All rights reserved.
 #
-from jnius import autoclass
-
+from pypgx._utils import columnar, conversion, pgx_types
 from pypgx._utils.error_handling import java_handler
 from pypgx._utils.error_messages import ARG_MUST_BE
-from pypgx._utils.conversion import anything_to_java
 from pypgx.api.frames._pgx_frame import PgxFrame
 from pypgx.api._pgx_context_manager import PgxContextManager
-from typing import Dict, Any
+from typing import Any, Dict, List, Mapping, Optional, Tuple, Union
+
+# The number of rows uploaded at once when creating a frame from local data.
+DEFAULT_UPLOAD_CHUNK_SIZE = 100000
+
+# Frame data types of NumPy array and pandas Series columns whose type is not known from the
+# schema, including the pandas nullable types.
+_NUMPY_DATA_TYPES = {
+    'int8': 'INTEGER_TYPE',
+    'int16': 'INTEGER_TYPE',
+    'int32': 'INTEGER_TYPE',
+    'int64': 'LONG_TYPE',
+    'float16': 'FLOAT_TYPE',
+    'float32': 'FLOAT_TYPE',
+    'float64': 'DOUBLE_TYPE',
+    'bool': 'BOOLEAN_TYPE',
+    'Int8': 'INTEGER_TYPE',
+    'Int16': 'INTEGER_TYPE',
+    'Int32': 'INTEGER_TYPE',
+    'Int64': 'LONG_TYPE',
+    'Float32': 'FLOAT_TYPE',
+    'Float64': 'DOUBLE_TYPE',
+    'boolean': 'BOOLEAN_TYPE',
+}
 
 
 class PgxFrameBuilder(PgxContextManager):
-    """A frame builder for constructing a :class:`PgxFrame`."""
+    """A frame builder for constructing a :class:`PgxFrame`.
+
+    Rows can be added any number of times before the frame is built, e.g. one batch at a time
+    while streaming the data in.
+    """
 
     _java_class = 'oracle.pgx.api.frames.PgxFrameBuilder'
 
-    def __init__(self, java_pgx_frame_builder) -> None:
+    def __init__(
+        self, java_pgx_frame_builder, schema: Optional[List[Tuple[str, Any]]] = None
+    ) -> None:
         self._frame_builder = java_pgx_frame_builder
+        # The data type of each column, if known, to pass the column values as the right type.
+        self._data_types: Dict[str, Any] = dict(schema) if schema is not None else {}
 
-    def add_rows(self, column_data: Dict[str, Any]) -> "PgxFrameBuilder":
+    def add_rows(self, column_data: Union[Dict[str, Any], Any]) -> "PgxFrameBuilder":
         """Add the data to the frame builder.
 
-        :param column_data: the column data in a dictionary
+        The columns can be lists, NumPy arrays, pandas Series or pyarrow arrays. Numeric and
+        boolean columns are passed to Java as one primitive array per column; only the values of
+        other columns are converted one by one.
+
+        :param column_data: the column data in a dictionary, or a pandas DataFrame or pyarrow
+            Table or RecordBatch
 
         :return: self
         """
-        if not isinstance(column_data, dict):
-            raise TypeError(ARG_MUST_BE.format(arg='column_data', type=dict))
-        java_data = autoclass('java.util.HashMap')()
-        for column_name in column_data:
-            python_list = column_data[column_name]
-            java_list = autoclass('java.util.ArrayList')()
-            for x in python_list:
-                java_list.add(anything_to_java(x))
-            java_data.put(column_name, java_list)
-        java_handler(self._frame_builder.addRows, [java_data])
+        java_handler(self._frame_builder.addRows, [self._to_java_data(column_data)])
         return self
 
+    def _to_java_data(self, column_data: Union[Dict[str, Any], Any]) -> Any:
+        """Return a Java map from column name to the Java list of the column values."""
+        if hasattr(column_data, 'column_names') and hasattr(column_data, 'column'):
+            # A pyarrow Table or RecordBatch.
+            column_data = {
+                name: column_data.column(i) for i, name in enumerate(column_data.column_names)
+            }
+        elif hasattr(column_data, 'columns') and hasattr(column_data, 'items'):
+            # A pandas DataFrame.
+            column_data = dict(column_data.items())
+        if not isinstance(column_data, Mapping):
+            raise TypeError(ARG_MUST_BE.format(arg='column_data', type=dict))
+        java_data = pgx_types.HashMap()
+        for column_name, values in column_data.items():
+            data_type = self._data_types.get(column_name)
+            if data_type is None:
+                dtype = getattr(values, 'dtype', None)
+                data_type = _NUMPY_DATA_TYPES.get(str(dtype))
+            python_values = _to_python_values(values)
+            if data_type in pgx_types.primitive_lists and None in python_values:
+                # Primitive arrays cannot hold nulls.
+                data_type = None
+            java_data.put(column_name, conversion.to_java_column(python_values, data_type))
+        return java_data
+
     def build(self, frame_name: str) -> PgxFrame:
         """Build the frame with the given frame name.
 
@@ -61,3 +111,22 @@ class PgxFrameBuilder(PgxContextManager):
         After this method returns, the behaviour of any methods of this class becomes undefined.
         """
         java_handler(self._frame_builder.destroy, [])
+
+
+def _to_python_values(values: Any) -> List[Any]:
+    """Return a column given as a list, NumPy array, pandas Series or pyarrow array as a list of
+    Python values.
+    """
+    if hasattr(values, 'to_pylist'):
+        # A pyarrow Array or ChunkedArray.
+        return values.to_pylist()
+    if hasattr(values, 'to_numpy'):
+        # A pandas Series. Its missing values, pd.NA or NaN, become None, so that they are passed
+        # as nulls. Missing datetimes (NaT) become None when converted below.
+        if values.dtype.kind != 'M' and values.hasnans:
+            values = values.astype(object).where(values.notna(), None)
+        values = values.to_numpy()
+    if getattr(values, 'dtype', None) is not None and values.dtype.kind == 'M':
+        # NumPy converts datetime64 values with nanoseconds to ints, not datetimes.
+        values = values.astype('datetime64[us]')
+    return columnar.to_list(values)
@@ -34,11 +34,8 @@ class GnnExplanation:
         :returns: the importance graph
         :rtype: PgxGraph
         """
-        from pypgx.api._pgx_session import PgxSession  # need to import here to avoid import loop
-
         java_graph = java_handler(self._explanation.getImportanceGraph, [])
-        java_session = java_handler(java_graph.getSession, [])
-        return PgxGraph(PgxSession(java_session), java_graph)
+        return PgxGraph._from_java(None, java_graph)
 
     def get_vertex_importance_property(self) -> VertexProperty:
         """Get the vertex property that contains the computed vertex importance.
@@ -100,6 +100,7 @@ try:
         long_description="PyPGX",
         packages=[
             "pypgx",
+            "pypgx.aio",
             "pypgx.api",
             "pypgx.api.auth",
             "pypgx.api.filters",